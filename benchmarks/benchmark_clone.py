@@ -0,0 +1,90 @@
+"""
+Measure the cost of submitting a parsed form repeatedly with different
+values: parsing the page again, copy.deepcopy() of the form, and clone() of
+a template. Each submission sets a few fields, selects an option, and
+prepares the submitted data.
+
+Usage: python benchmarks/benchmark_clone.py [--sizes 50,200,1000,5000] [--parser NAME]
+"""
+
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.models.form_data import FormData
+
+
+def create_page(size: int) -> str:
+    """
+    Create a page holding a form of text inputs, and a select element.
+    """
+
+    inputs = "".join("<input name=\"field%d\" value=\"default%d\" />" % (index, index, ) for index in range(size))
+    options = "".join("<option value=\"option%d\">Option %d</option>" % (index, index, ) for index in range(20))
+
+    return "<html><body><form action=\"/submit\" method=\"post\">%s<select name=\"choice\">%s</select></form></body></html>" % (inputs, options, )
+
+
+def submit(form_data: FormData, index: int) -> list:
+    """
+    Set the values of a submission, and prepare its data.
+    """
+
+    form_data.fields.update_many({"field0": "user%d" % (index, ), "field1": "token%d" % (index, ), "field2": "note"})
+    form_data.groups["choice"].select("option%d" % (index % 20, ))
+
+    return form_data.prepare_data()
+
+
+def measure(create, repeat: int) -> float:
+    """
+    Returns the mean time in microseconds of creating a form and submitting
+    it.
+    """
+
+    start = time.perf_counter()
+    for index in range(repeat):
+        submit(create(), index)
+
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--sizes", default="50,200,1000,5000")
+    argument_parser.add_argument("--parser", default="lxml")
+    arguments = argument_parser.parse_args()
+
+    form_parser = HtmlFormParser()
+
+    print("%8s %12s %12s %12s %16s" % ("fields", "parse us", "deepcopy us", "clone us", "clone only us"))
+
+    for size in [int(value) for value in arguments.sizes.split(",")]:
+
+        page = create_page(size)
+        form_data = form_parser.parse_forms(page, parser=arguments.parser)[0]
+        template = form_data.template()
+
+        repeat = max(20000 // size, 5)
+
+        start = time.perf_counter()
+        for _ in range(repeat * 10):
+            template.clone()
+        clone_only = (time.perf_counter() - start) / (repeat * 10) * 1e6
+
+        print("%8d %12.0f %12.0f %12.0f %16.2f" % (
+            size,
+            measure(lambda: form_parser.parse_forms(page, parser=arguments.parser)[0], max(repeat // 10, 2)),
+            measure(lambda: copy.deepcopy(form_data), repeat),
+            measure(template.clone, repeat),
+            clone_only))
+
+
+if __name__ == "__main__":
+    main()
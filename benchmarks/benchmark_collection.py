@@ -0,0 +1,153 @@
+"""
+Measure the cost of FormDataEntryCollection lookups and updates as the
+collection grows: filling every field of a form by name, reading fields by
+position between lookups, setting every field with a single update_many()
+call, inserting and deleting fields, regrouping the options of a select
+element, and switching the selected option of a select
+element with as many options as the form has fields.
+
+Usage: python benchmarks/benchmark_collection.py [--sizes 500,1000,2000,4000,8000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_form_parser.models.form_data_entry import FormDataEntry
+from html_form_parser.models.form_data_group import GROUP_KIND_SELECT, FormDataGroup
+from html_form_parser.models.form_data_entry_collection import FormDataEntryCollection
+
+
+def create_collection(size: int) -> FormDataEntryCollection:
+
+    return FormDataEntryCollection([FormDataEntry("field%d" % (index, ), "") for index in range(size)])
+
+
+def fill_by_name(fields: FormDataEntryCollection) -> int:
+    """
+    Set the value of each field, located by name.
+    """
+
+    for index in range(len(fields)):
+        fields[fields.index_by_name("field%d" % (index, ))].value = "value%d" % (index, )
+
+    return len(fields)
+
+
+def update_many(fields: FormDataEntryCollection) -> int:
+    """
+    Set the value of each field with a single call.
+    """
+
+    fields.update_many({"field%d" % (index, ): "updated%d" % (index, ) for index in range(len(fields))})
+
+    return len(fields)
+
+
+def read_and_lookup(fields: FormDataEntryCollection) -> int:
+    """
+    Read a field by position, then look up a field by name and value.
+    """
+
+    for index in range(len(fields)):
+        fields[index]
+        fields.index_by_name_value("field%d" % (index, ), "value%d" % (index, ))
+
+    return len(fields)
+
+
+def insert_and_delete(fields: FormDataEntryCollection) -> int:
+    """
+    Insert a field near the start, look it up, and delete it again.
+    """
+
+    count = 200
+    for index in range(count):
+        fields.insert(1, FormDataEntry("inserted", str(index)))
+        fields.index_by_name("inserted")
+        del fields[1]
+
+    return count
+
+
+def group_options(fields: FormDataEntryCollection) -> int:
+    """
+    Select an option of a select element, then collect its options and count
+    the submitable fields.
+    """
+
+    if "genre" not in fields.by_name:
+        fields.extend([FormDataEntry("genre", "option%d" % (index, ), is_submitable=False) for index in range(10)])
+
+    count = 1000
+    for index in range(count):
+        options = fields.get_all("genre")
+        options[index % 10].is_submitable = True
+        len(fields.submitable())
+        options[index % 10].is_submitable = False
+
+    return count
+
+
+def add_options(fields: FormDataEntryCollection):
+    """
+    Add a select element with as many options as the form has fields.
+    """
+
+    fields.extend([FormDataEntry("size", "option%d" % (index, ), is_submitable=False) for index in range(len(fields))])
+
+    FormDataGroup(fields, "size", GROUP_KIND_SELECT).selected()
+
+
+def select_option(fields: FormDataEntryCollection) -> int:
+    """
+    Select an option of the select element, deselecting the previous
+    option, and read the selection.
+    """
+
+    size = len(fields) // 2
+    group = FormDataGroup(fields, "size", GROUP_KIND_SELECT)
+
+    count = 1000
+    for index in range(count):
+        group.select("option%d" % (index * 7 % size, ))
+        group.selected()
+
+    return count
+
+
+def measure(operation, fields: FormDataEntryCollection) -> float:
+    """
+    Returns the mean time in microseconds of each step of an operation.
+    """
+
+    start = time.perf_counter()
+    steps = operation(fields)
+
+    return (time.perf_counter() - start) / steps * 1e6
+
+
+def main():
+
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--sizes", default="500,1000,2000,4000,8000")
+    arguments = argument_parser.parse_args()
+
+    print("%8s %16s %20s %20s %20s %20s %20s" % ("fields", "update many us", "fill by name us", "read + lookup us", "insert + delete us", "group options us", "select option us"))
+
+    for size in [int(value) for value in arguments.sizes.split(",")]:
+
+        fields = create_collection(size)
+        results = [measure(update_many, fields), measure(fill_by_name, fields), measure(read_and_lookup, fields), measure(insert_and_delete, fields), measure(group_options, fields)]
+
+        add_options(fields)
+        results.append(measure(select_option, fields))
+
+        print("%8d %16.2f %20.2f %20.2f %20.2f %20.2f %20.2f" % (size, *results))
+
+
+if __name__ == "__main__":
+    main()
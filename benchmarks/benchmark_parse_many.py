@@ -0,0 +1,98 @@
+"""
+Measure parse_many() throughput against the number of workers, with worker
+processes, worker threads, and subinterpreters. Worker threads only scale on
+a free-threaded Python build, and subinterpreters require Python 3.14.
+
+Usage: python benchmarks/benchmark_parse_many.py [--documents N] [--workers 1,2,4,8] [--parser NAME]
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_form_parser import HtmlFormParser
+
+
+def create_corpus(count: int) -> list:
+    """
+    Create a corpus of pages of varied size, each with a login form and a
+    search form among unrelated markup.
+    """
+
+    documents = []
+    for index in range(count):
+
+        filler = "<div class=\"item\"><p>Paragraph %d</p><a href=\"/link\">Link</a></div>" % (index, )
+        filler *= 20 + (index % 10) * 20
+
+        documents.append(
+            "<html><head><title>Page %d</title></head><body>" % (index, ) +
+            filler +
+            "<form id=\"login\" action=\"/login\" method=\"post\">"
+            "<input type=\"text\" name=\"user\" value=\"user%d\" />"
+            "<input type=\"password\" name=\"pass\" />"
+            "<input type=\"checkbox\" name=\"remember\" checked />"
+            "<select name=\"lang\"><option value=\"en\" selected>English</option><option>Deutsch</option></select>"
+            "<button type=\"submit\">Sign in</button>"
+            "</form>" % (index, ) +
+            filler +
+            "<form action=\"/search\"><input type=\"search\" name=\"q\" /></form>"
+            "</body></html>")
+
+    return documents
+
+
+def measure(form_parser: HtmlFormParser, documents: list, workers: int, parser: str, threads: bool = False, interpreters: bool = False) -> float:
+    """
+    Returns the number of documents parsed per second. Worker start-up is
+    excluded from the measurement.
+    """
+
+    with form_parser.create_pool(workers, parser, threads=threads, interpreters=interpreters) as pool:
+
+        # Start the workers before measuring.
+        list(form_parser.parse_many(documents[:workers * 2], chunksize=1, pool=pool))
+
+        start = time.perf_counter()
+        for index, forms in form_parser.parse_many(documents, pool=pool):
+            pass
+
+        return len(documents) / (time.perf_counter() - start)
+
+
+def main():
+
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("--documents", type=int, default=2000)
+    argument_parser.add_argument("--workers", default="1,2,4,8")
+    argument_parser.add_argument("--parser", default="html5lib", help="lxml is not available within subinterpreters.")
+    arguments = argument_parser.parse_args()
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("Python %s, GIL %s, %d CPUs" % (sys.version.split()[0], "enabled" if is_gil_enabled else "disabled", os.cpu_count(), ))
+
+    documents = create_corpus(arguments.documents)
+    form_parser = HtmlFormParser()
+
+    has_interpreters = hasattr(concurrent.futures, "InterpreterPoolExecutor")
+
+    print("%8s %14s %14s %16s" % ("workers", "processes/s", "threads/s", "interpreters/s", ))
+
+    for workers in [int(value) for value in arguments.workers.split(",")]:
+
+        processes = measure(form_parser, documents, workers, arguments.parser)
+        threads = measure(form_parser, documents, workers, arguments.parser, threads=True)
+
+        interpreters = "n/a"
+        if has_interpreters:
+            interpreters = "%.1f" % (measure(form_parser, documents, workers, arguments.parser, interpreters=True), )
+
+        print("%8d %14.1f %14.1f %16s" % (workers, processes, threads, interpreters, ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure the payload size, and encode and decode time, of parsed forms with
+plain pickle, to_dict() with JSON, pickled encoded tuples as used by
+ParserPool, and pack_forms().
+
+Usage: python benchmarks/benchmark_serialization.py [--documents N] [--parser NAME]
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmark_parse_many import create_corpus
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.models.form_data import FormData
+from html_form_parser.models.form_data_codec import pack_forms, unpack_forms
+from html_form_parser.parsers.parser_pool import decode_forms, encode_forms
+
+
+def measure(function, value, repeat: int) -> float:
+    """
+    Returns the mean time in microseconds of a call.
+    """
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(value)
+
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+
+    argument_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argument_parser.add_argument("--documents", type=int, default=200)
+    argument_parser.add_argument("--parser", default="lxml")
+    arguments = argument_parser.parse_args()
+
+    form_parser = HtmlFormParser()
+    forms = []
+    for markup in create_corpus(arguments.documents):
+        forms.extend(form_parser.parse_forms(markup, parser=arguments.parser))
+
+    formats = [
+        ("pickle", lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL), pickle.loads),
+        ("to_dict + json", lambda value: json.dumps([form_data.to_dict() for form_data in value]).encode("utf-8"),
+         lambda data: [FormData.from_dict(form_data) for form_data in json.loads(data)]),
+        ("encoded tuples + pickle", lambda value: pickle.dumps(encode_forms(value), pickle.HIGHEST_PROTOCOL),
+         lambda data: decode_forms(pickle.loads(data))),
+        ("pack_forms", pack_forms, unpack_forms),
+    ]
+
+    print("%d forms, %d fields" % (len(forms), sum(len(form_data.fields) for form_data in forms)))
+    print("%-24s %10s %12s %12s" % ("format", "bytes", "encode us", "decode us"))
+
+    for name, encode, decode in formats:
+
+        data = encode(forms)
+
+        print("%-24s %10d %12.0f %12.0f" % (name, len(data), measure(encode, forms, 20), measure(decode, data, 20)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,24 @@
-import re
-from typing import List
+import asyncio
+import functools
+import mmap
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, List, Tuple, Union
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from html_form_parser.models.form_data import FormData
 from html_form_parser.models.form_data_entry import FormDataEntry
-from html_form_parser.parsers import form_data_entry_parser
+from html_form_parser.models.lazy_form_data import LazyFormData
+from html_form_parser.parsers.form_data_entry_parser_registry import FormDataEntryParserRegistry, FormDataEntryParserTable, default_registry
+from html_form_parser.parsers.encoding_sniffer import IncrementalMarkupDecoder, is_ascii_compatible, sniff_encoding, strip_byte_order_mark
+from html_form_parser.parsers.form_region_scanner import extract_form_markup
+from html_form_parser.parsers.form_selector import FormSelection, FormSelector
+from html_form_parser.parsers.form_template import FormTemplateCache, FormTemplateStats
+from html_form_parser.parsers.parse_cache import ParseCache, ParseCacheStats, SqliteParseCache
+from html_form_parser.parsers.parser_backend import Markup, ParserBackend, StreamBackend, get_parser_backend
+from html_form_parser.parsers.parser_pool import InterpreterParserPool, ParserPool, ThreadParserPool
+from html_form_parser.parsers.stream_form_parser import FormElement
 
 
 class HtmlFormParser:
@@ -13,96 +26,714 @@ class HtmlFormParser:
     Parse and extract HTML forms from a HTML page.
     """
 
-    def __init__(self, markup: str = None, parser: str = None):
+    # The parser name selecting the tree-free stream engine.
+    STREAM_PARSER = StreamBackend.name
+
+    # The registry of FormDataEntryParser classes used to create fields.
+    # Assign a copy of the default registry to change the parsers of a
+    # single HtmlFormParser object, or class.
+    field_parser_registry = default_registry
+
+    # The ParseCache, or SqliteParseCache, of parse results, or None. Pages
+    # identical to a page already parsed, with the same settings, are not
+    # parsed again.
+    cache = None
+
+    # The FormTemplateCache of form skeletons, or None. Pages sharing the
+    # form skeleton of a page already parsed have only their changing values
+    # read. Pages are reduced to their form regions, as with prefilter.
+    templates = None
+
+    def __init__(self, markup: Markup = None, parser: str = None, encoding: str = None):
         """
-        :param markup: A string containing HTML markup.
+        :param markup: A string, or bytes, containing HTML markup.
 
-        :param parser: A string containing a valid BeautifulSoup parsing library name.
+        :param parser: A parser backend name: "html5lib", "html.parser",
+            "lxml", or "stream". Other names are given to BeautifulSoup as a
+            tree builder name.
+
+        :param encoding: The encoding label provided by the transport layer,
+            such as the HTTP Content-Type charset, when bytes are given.
         """
 
         self.forms = []
 
+        # The parser accepting a document in chunks through feed().
+        self._incremental_parser = None
+        self._incremental_decoder = None
+        self._incremental_form_count = 0
+
         if markup is not None:
-            self.parse(markup, parser)
+            self.parse(markup, parser, encoding)
 
-    def parse(self, markup: str, parser: str = None) -> List[FormData]:
+    def parse(self, markup: Markup, parser: str = None, encoding: str = None, prefilter: bool = False, lazy: bool = False, forms: Union[Callable[[FormData], bool], dict] = None, first_only: bool = False, max_forms: int = None, reset: bool = False, cache_key: str = None) -> List[FormData]:
         """
         Convert a HTML page into Form Data objects
 
-        :param markup: A string containing HTML markup.
-
-        :param parser: A string property to select a BeutifulSoup Parser.
+        :param markup: A string containing HTML markup. Undecoded bytes,
+            bytearray, or memoryview objects are also accepted; the encoding
+            is determined as a web browser would. When prefilter is enabled,
+            and the encoding is ASCII compatible, only the regions of the
+            page containing forms are decoded. Otherwise the whole page is
+            decoded.
+
+        :param parser: A parser backend name, or ParserBackend object. The
+            default "html5lib" builds the document exactly as a web browser
+            would. "lxml" is several times faster on well-formed pages, and
+            "stream" extracts forms without building a document tree.
+
+        :param encoding: The encoding label provided by the transport layer,
+            such as the HTTP Content-Type charset, when bytes are given. A
+            byte order mark takes precedence over this value, and this value
+            takes precedence over a <meta> declaration.
+
+        :param prefilter: When enabled, the markup is scanned for forms
+            before it is parsed. Pages without a form are not parsed, and
+            only the regions of the page containing forms, or fields naming
+            their form by attribute, are given to the parser. Pages where
+            the parser could build a form differently without the rest of
+            the page, such as a form within a table, are parsed whole.
+            Disabled by default.
+
+            The scan costs about as much as an "lxml" parse of the page. It
+            speeds up the "html5lib", "html.parser" and "stream" parsers
+            many times on large pages with few forms, but slows down the
+            "lxml" parser.
+
+        :param lazy: When enabled, LazyFormData objects are returned. The
+            form attributes are available immediately, while the fields are
+            created when first accessed.
+
+        :param forms: Select the forms to extract. A callable given each
+            FormData object with only its attributes populated, returning
+            True for forms to extract. A dictionary matching the "id",
+            "name", or a substring of the "action" attribute is also
+            accepted, see FormSelector.from_dict(). Fields are only created
+            for selected forms.
+
+        :param first_only: Extract only the first selected form.
+
+        :param max_forms: The maximum number of forms to extract. The
+            "stream" parser stops reading the page once the last form is
+            closed, unless a later field could name it by "form" attribute.
+
+        :param reset: Discard the forms stored by previous calls, rather
+            than adding to them.
+
+        :param cache_key: A key identifying the page in the cache, such as
+            its URL and ETag. By default, pages are identified by a hash of
+            their markup.
 
         :returns: A collection of ForData objects. The same objects are
             stored within the object.
         """
 
-        if parser is None:
-            parser = "html5lib"
+        parsed_forms = self.parse_forms(markup, parser, encoding, prefilter, lazy, forms, first_only, max_forms, cache_key)
+
+        if reset:
+            self.forms = []
+
+        self.forms.extend(parsed_forms)
+
+        return self.forms
+
+    def parse_forms(self, markup: Markup, parser: str = None, encoding: str = None, prefilter: bool = False, lazy: bool = False, forms: Union[Callable[[FormData], bool], dict] = None, first_only: bool = False, max_forms: int = None, cache_key: str = None) -> List[FormData]:
+        """
+        Convert a HTML page into Form Data objects, without storing them.
+        See parse() for the parameters.
+
+        No state is kept within the object, so a single object may be
+        shared by any number of threads, each parsing its own pages.
+
+        When a cache is assigned to the "cache" attribute, forms of a page
+        already parsed are copied from the cache. Lazy parses, and
+        selections by callable, are not cached.
+
+        :returns: A new collection of FormData objects.
+        """
+
+        if first_only:
+            max_forms = 1
+
+        selection = None
+        if forms is not None or max_forms is not None:
+            selection = FormSelection(forms, max_forms)
+
+        parser_backend = get_parser_backend(parser)
+        field_parsers = self._get_field_parsers(parser_backend)
+
+        cache = self.cache
+        key = None
+
+        # Lazy forms are not cached, as caching them would create their
+        # fields. Selections by callable cannot be compared.
+        if cache is not None and not lazy and (forms is None or isinstance(forms, dict)):
+
+            selection_key = selection.predicate.key if forms is not None else None
+
+            # Keys given by the caller are told apart from markup by the
+            # last setting.
+            key = cache.create_key(
+                markup if cache_key is None else cache_key,
+                parser_backend, field_parsers, encoding, prefilter, selection_key, max_forms, cache_key is not None)
+
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        result = self._parse_markup(
+            markup, parser_backend, field_parsers, encoding, prefilter, lazy, selection)
+
+        if key is not None:
+            cache.put(key, result)
+
+        return result
+
+    def parse_file(self, path: str, parser: str = None, encoding: str = None, prefilter: bool = False, lazy: bool = False) -> List[FormData]:
+        """
+        Convert a HTML page stored in a file into Form Data objects. The file
+        is memory-mapped rather than read, so the operating system's page
+        cache is shared with other processes reading the same file.
+
+        With prefilter enabled, the mapped file is scanned in place, and only
+        the regions of the file containing forms are copied and decoded,
+        when its encoding is ASCII compatible. Otherwise the whole file is
+        decoded.
+
+        :param path: The path of the file containing HTML markup.
+
+        :param parser: A parser backend name.
+
+        :param encoding: The encoding label of the file, if known. See
+            parse().
+
+        :param prefilter: Scan the file for forms before parsing, copying and
+            decoding only the regions containing forms. See parse().
+
+        :param lazy: Create the fields of each form when first accessed. See
+            parse().
+
+        :returns: A collection of FormData objects. The same objects are
+            stored within the object.
+        """
+
+        parser_backend = get_parser_backend(parser)
+
+        forms = self._parse_mapped_file(
+            path, parser_backend, self._get_field_parsers(parser_backend), encoding, prefilter, lazy)
+
+        self.forms.extend(forms)
+
+        return self.forms
+
+    def parse_files(self, paths: Iterable[str], parser: str = None, encoding: str = None, prefilter: bool = False, lazy: bool = False) -> Iterator[Tuple[str, List[FormData]]]:
+        """
+        Convert a series of HTML pages stored in files into Form Data
+        objects. See parse_file().
+
+        The forms are not stored within the object, allowing large numbers
+        of files to be processed.
+
+        :param paths: A collection of file paths.
+
+        :param parser: A parser backend name.
+
+        :param encoding: The encoding label of the files, if known.
+
+        :param prefilter: Scan the files for forms before parsing, copying
+            and decoding only the regions containing forms. See parse().
+
+        :param lazy: Create the fields of each form when first accessed. See
+            parse().
+
+        :returns: An iterator of (path, forms) pairs, in the order given.
+        """
+
+        parser_backend = get_parser_backend(parser)
+        parsers = self._get_field_parsers(parser_backend)
+
+        for path in paths:
+            yield path, self._parse_mapped_file(path, parser_backend, parsers, encoding, prefilter, lazy)
+
+    def create_pool(self, workers: int = None, parser: str = None, encoding: str = None, prefilter: bool = False, threads: bool = False, interpreters: bool = False) -> ParserPool:
+        """
+        Start a pool of worker processes for parse_many(). The workers are
+        kept running, with the parsing libraries imported, until the pool is
+        closed. The pool may be used as a context manager.
+
+        :param workers: The number of worker processes. Default is the
+            number of CPUs.
+
+        :param parser: A parser backend name.
+
+        :param encoding: The encoding label of documents given as bytes, if
+            known.
+
+        :param prefilter: Scan the documents for forms before parsing. See
+            parse().
+
+        :param threads: Use worker threads sharing this object, rather than
+            processes. Threads parse in parallel on a free-threaded Python
+            build, without pickling documents or results.
+
+        :param interpreters: Use subinterpreters within this process, each
+            with its own GIL, rather than processes. Requires Python 3.14.
+        """
+
+        if threads:
+            return ThreadParserPool(self, workers, parser, encoding, prefilter)
+
+        field_parser_registry = None
+        if self.field_parser_registry is not type(self).field_parser_registry:
+            field_parser_registry = self.field_parser_registry
+
+        pool_class = InterpreterParserPool if interpreters else ParserPool
+
+        return pool_class(type(self), workers, parser, encoding, prefilter, field_parser_registry)
+
+    def parse_many(self, documents: Iterable[Markup], parser: str = None, encoding: str = None, prefilter: bool = False, workers: int = None, chunksize: int = 16, ordered: bool = False, pool: ParserPool = None, threads: bool = False, interpreters: bool = False) -> Iterator[Tuple[int, List[FormData]]]:
+        """
+        Convert a series of HTML pages into Form Data objects, in parallel
+        worker processes. Documents are batched by count and size, so a
+        large page does not delay the pages batched with it, and results
+        are provided as each batch completes.
+
+        The forms are not stored within the object. Worker processes import
+        this package, so the main module must use an
+        'if __name__ == "__main__":' guard.
+
+        :param documents: A series of strings, or bytes, containing HTML
+            markup. The series is read as workers become available.
+
+        :param parser: A parser backend name.
+
+        :param encoding: The encoding label of documents given as bytes, if
+            known.
+
+        :param prefilter: Scan the documents for forms before parsing. See
+            parse().
+
+        :param workers: The number of worker processes. Default is the
+            number of CPUs.
+
+        :param chunksize: The maximum number of documents sent to a worker
+            at a time.
+
+        :param ordered: Provide results in the order of the documents.
+            Otherwise, results are provided as soon as they are available.
+
+        :param pool: A pool created by create_pool(), reused to avoid
+            starting worker processes for each call. The parser, encoding,
+            prefilter, workers, threads and interpreters arguments are
+            ignored when provided.
 
-        parsers = [
-            form_data_entry_parser.SelectableInputFormElementParser(),
-            form_data_entry_parser.ColorInputFormElementParser(),
-            form_data_entry_parser.RangeInputFormElementParser(),
-            form_data_entry_parser.SubmitInputFormElementParser(),
-            form_data_entry_parser.ButtonInputFormElementParser(),
-            form_data_entry_parser.ImageInputFormElementParser(),
-            form_data_entry_parser.ButtonFormElementParser(),
-            form_data_entry_parser.InputFormElementParser(),
-            form_data_entry_parser.SelectFormElementParser(),
-            form_data_entry_parser.TextareaFormElementParser(),
-            form_data_entry_parser.FormDataEntryParser(),
-        ]
+        :param threads: Use worker threads rather than processes. See
+            create_pool().
 
-        bs4_parser = BeautifulSoup(markup, parser)
+        :param interpreters: Use subinterpreters rather than processes. See
+            create_pool().
 
-        parsed_forms = bs4_parser.find_all("form")
+        :returns: An iterator of (index, forms) pairs. The index is the
+            position of the document in the series.
+        """
+
+        if pool is not None:
+            yield from pool.parse_many(documents, chunksize, ordered)
+            return
+
+        with self.create_pool(workers, parser, encoding, prefilter, threads, interpreters) as pool:
+            yield from pool.parse_many(documents, chunksize, ordered)
+
+    def feed(self, chunk: Markup, parser: str = None, encoding: str = None) -> List[FormData]:
+        """
+        Provide the next chunk of a HTML page being received. With the
+        "stream" parser, forms are extracted as soon as their markup
+        arrives. Other parsers buffer or build their tree as chunks arrive,
+        and provide forms once closed.
+
+        Fields referencing their form by "form" attribute are associated
+        once the owning form is reached, even when it appears later in the
+        page.
+
+        :param chunk: A string containing the next part of the HTML markup.
+            Undecoded bytes are also accepted, and decoded as they arrive.
 
-        parsed_fields = bs4_parser.find_all(("button", "input", "select", "textarea", ))
+        :param parser: A parser backend name, used when starting a new page.
 
-        form_id_map = {}
-        for index, parsed_form in enumerate(parsed_forms):
+        :param encoding: The encoding label provided by the transport layer,
+            used when starting a new page of bytes.
 
-            if "id" in parsed_form.attrs:
-                form_id_map[parsed_form.attrs["id"]] = index
+        :returns: A collection of the FormData objects found in this chunk.
+            Fields may continue to be added to the forms until close() is
+            called.
+        """
+
+        if self._incremental_parser is None:
 
-            self.forms.append(self._create_form_data(parsed_form))
+            parser_backend = get_parser_backend(parser)
+            parsers = self._get_field_parsers(parser_backend)
 
-        # Fields associate to the nearest containing form node, or specify their form owner by attribute.
-        # https://html.spec.whatwg.org/multipage/form-control-infrastructure.html#association-of-controls-and-forms
-        for parsed_field in parsed_fields:
+            self._incremental_parser = parser_backend.create_incremental_parser(
+                *self._create_form_builders(parsers), field_tags=parsers.tag_names)
+            self._incremental_form_count = 0
 
-            form_index = None
-            if "form" in parsed_field.attrs:
-                form_index = form_id_map.get(parsed_field.attrs["form"], None)
+        if not isinstance(chunk, str):
 
-            if form_index is None:
+            if self._incremental_decoder is None:
+                self._incremental_decoder = IncrementalMarkupDecoder(encoding)
 
-                parent_form = parsed_field.find_parent("form")
-                if parent_form is not None:
-                    form_index = parsed_forms.index(parsed_form)
+            chunk = self._incremental_decoder.decode(chunk)
 
-            if form_index is not None:
-                self.forms[form_index].fields.extend(
-                    self._create_form_data_field(parsed_field, parsers))
+        self._incremental_parser.feed(chunk)
+
+        return self.__collect_incremental_forms()
+
+    def close(self) -> List[FormData]:
+        """
+        Complete parsing of the page provided through feed().
+
+        :returns: A collection of FormData objects. The same objects are
+            stored within the object.
+        """
+
+        if self._incremental_parser is not None:
+
+            if self._incremental_decoder is not None:
+                self._incremental_parser.feed(self._incremental_decoder.decode(b"", True))
+                self._incremental_decoder = None
+
+            self._incremental_parser.close()
+            self.__collect_incremental_forms()
+
+            self._incremental_parser = None
 
         return self.forms
 
-    def _create_form_data(self, parsed_form: Tag) -> FormData:
+    def parse_stream(self, fileobj: 'io.IOBase', chunk_size: int = 65536, parser: str = None, encoding: str = None) -> List[FormData]:
+        """
+        Convert a HTML page read from a file-like object into Form Data
+        objects, reading the page in chunks.
+
+        :param fileobj: A text or binary file-like object providing a read()
+            method.
+
+        :param chunk_size: The number of characters, or bytes, to read at a
+            time.
+
+        :param parser: A parser backend name.
+
+        :param encoding: The encoding label provided by the transport layer,
+            when reading bytes.
+
+        :returns: A collection of FormData objects. The same objects are
+            stored within the object.
+        """
+
+        while True:
+
+            chunk = fileobj.read(chunk_size)
+            if not chunk:
+                break
+
+            self.feed(chunk, parser, encoding)
+
+        return self.close()
+
+    async def parse_async(self, markup: Union[Markup, 'asyncio.StreamReader', AsyncIterable[Markup]], parser: str = None, encoding: str = None, prefilter: bool = False, executor: Executor = None, timeout: float = None, chunk_size: int = 65536) -> List[FormData]:
+        """
+        Convert a HTML page into Form Data objects without blocking the
+        event loop. Parsing is run in an executor.
+
+        A page provided as an asyncio.StreamReader, or an asynchronous
+        iterator of chunks, is parsed incrementally as it is received. Each
+        chunk is parsed in the executor while the next chunk is read.
+
+        The task may be cancelled, or time out, at any point. The page is not
+        read, or parsed, any further, although a chunk, or page, already
+        being parsed by the executor is completed in the background.
+
+        The forms are not stored within the object, allowing concurrent
+        parses.
+
+        :param markup: A string, or bytes, containing HTML markup, an
+            asyncio.StreamReader, or an asynchronous iterator of strings or
+            bytes.
+
+        :param parser: A parser backend name.
+
+        :param encoding: The encoding label provided by the transport layer,
+            when bytes are given.
+
+        :param prefilter: Scan the page for forms before parsing. See
+            parse(). Pages parsed incrementally are not scanned.
+
+        :param executor: The concurrent.futures Executor running the parse.
+            Default is the event loop's default thread pool. The object is
+            pickled when a process pool is given. A page provided in chunks
+            is then read whole before it is parsed, as the incremental
+            parser can not be shared with another process.
+
+        :param timeout: The number of seconds allowed for reading and
+            parsing the page, after which asyncio.TimeoutError is raised.
+
+        :param chunk_size: The number of bytes read at a time from a
+            StreamReader.
+
+        :returns: A collection of FormData objects.
+        """
+
+        if timeout is not None:
+            return await asyncio.wait_for(
+                self.parse_async(markup, parser, encoding, prefilter, executor, None, chunk_size), timeout)
+
+        loop = asyncio.get_running_loop()
+
+        if not isinstance(markup, (str, bytes, bytearray, memoryview, )) and isinstance(executor, ProcessPoolExecutor):
+            chunks = [chunk async for chunk in self.__read_chunks(markup, chunk_size)]
+
+            if chunks and isinstance(chunks[0], str):
+                markup = "".join(chunks)
+            else:
+                markup = b"".join(chunks)
+
+        if isinstance(markup, (str, bytes, bytearray, memoryview, )):
+            return await loop.run_in_executor(
+                executor, functools.partial(self.parse_forms, markup, parser, encoding, prefilter))
+
+        parser_backend = get_parser_backend(parser)
+        field_parsers = self._get_field_parsers(parser_backend)
+
+        incremental_parser = parser_backend.create_incremental_parser(
+            *self._create_form_builders(field_parsers), field_tags=field_parsers.tag_names)
+        decoder = IncrementalMarkupDecoder(encoding)
+
+        def feed(chunk: Markup):
+            if not isinstance(chunk, str):
+                chunk = decoder.decode(chunk)
+
+            incremental_parser.feed(chunk)
+
+        def close():
+            incremental_parser.feed(decoder.decode(b"", True))
+            incremental_parser.close()
+
+        # Chunks are parsed one at a time, in order. The next chunk is read
+        # while the previous chunk is being parsed.
+        pending = None
+        async for chunk in self.__read_chunks(markup, chunk_size):
+
+            if pending is not None:
+                await pending
+
+            pending = loop.run_in_executor(executor, feed, chunk)
+
+        if pending is not None:
+            await pending
+
+        await loop.run_in_executor(executor, close)
+
+        return incremental_parser.forms
+
+    async def __read_chunks(self, source: Union['asyncio.StreamReader', AsyncIterable[Markup]], chunk_size: int) -> AsyncIterator[Markup]:
+        """
+        Read the chunks of a page from an asyncio.StreamReader, or an
+        asynchronous iterator.
+        """
+
+        if hasattr(source, "__aiter__") and not hasattr(source, "read"):
+            async for chunk in source:
+                if chunk:
+                    yield chunk
+
+            return
+
+        while True:
+
+            chunk = await source.read(chunk_size)
+            if not chunk:
+                break
+
+            yield chunk
+
+    def _parse_markup(self, markup: Markup, parser_backend: ParserBackend, field_parsers: FormDataEntryParserTable, encoding: str = None, prefilter: bool = False, lazy: bool = False, selection: FormSelection = None) -> List[FormData]:
+        """
+        Convert a HTML page into Form Data objects, without storing them.
+
+        :param markup: A string, or bytes, containing HTML markup.
+
+        :param parser_backend: The backend used to parse the markup.
+
+        :param field_parsers: The dispatch table of HTML input element
+            parsers.
+
+        :param encoding: The transport layer encoding label, if any.
+
+        :param prefilter: Reduce the markup to its form regions before it is
+            given to the parser backend.
+
+        :param lazy: Create LazyFormData objects.
+
+        :param selection: The selection of forms to extract, all forms are
+            extracted by default.
+        """
+
+        if not isinstance(markup, str):
+            encoding = sniff_encoding(markup, encoding)
+
+        use_templates = self.templates is not None and not lazy and selection is None
+
+        # Templates are learned from the form regions whatever the prefilter
+        # setting, so pages differing only outside their forms share one.
+        if prefilter or use_templates:
+
+            if not isinstance(markup, str) and not is_ascii_compatible(encoding):
+                # The markup can not be scanned before it is decoded.
+                markup = str(strip_byte_order_mark(markup, encoding), encoding, "replace")
+                encoding = None
+
+            markup = extract_form_markup(markup)
+            if markup is None:
+                return []
+
+        create_form_data, add_form_data_field = self._create_form_builders(field_parsers, lazy, selection)
+
+        if use_templates:
+
+            if not isinstance(markup, str):
+                markup = str(strip_byte_order_mark(markup, encoding), encoding, "replace")
+
+            return self.templates.parse(
+                markup,
+                lambda template_markup: parser_backend.parse_forms(
+                    template_markup, create_form_data, add_form_data_field, field_tags=field_parsers.tag_names),
+                parser_backend, field_parsers)
+
+        if selection is None:
+            return parser_backend.parse_forms(
+                markup, create_form_data, add_form_data_field, encoding, field_tags=field_parsers.tag_names)
+
+        if isinstance(markup, str) or is_ascii_compatible(encoding):
+            # Other encodings can not be searched for "form" attributes.
+            selection.markup = markup
+
+        return selection.filter(parser_backend.parse_forms(
+            markup, create_form_data, add_form_data_field, encoding, selection.is_finished, field_parsers.tag_names))
+
+    def _parse_mapped_file(self, path: str, parser_backend: ParserBackend, field_parsers: FormDataEntryParserTable, encoding: str = None, prefilter: bool = False, lazy: bool = False) -> List[FormData]:
+        """
+        Memory-map a file, and convert its contents into Form Data objects
+        without storing them.
+        """
+
+        with open(path, "rb") as fh:
+
+            if os.fstat(fh.fileno()).st_size == 0:
+                # Empty files can not be mapped.
+                return self._parse_markup(b"", parser_backend, field_parsers, encoding, prefilter, lazy)
+
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                return self._parse_markup(mapped_file, parser_backend, field_parsers, encoding, prefilter, lazy)
+
+    def __collect_incremental_forms(self) -> List[FormData]:
+        """
+        Store forms found by the incremental parser since the last call.
+        """
+
+        new_forms = self._incremental_parser.forms[self._incremental_form_count:]
+        self._incremental_form_count += len(new_forms)
+
+        self.forms.extend(new_forms)
+
+        return new_forms
+
+    def _create_form_builders(self, field_parsers: FormDataEntryParserTable, lazy: bool = False, selection: FormSelection = None) -> Tuple[Callable, Callable]:
+        """
+        Create the callables a parser backend uses to create forms, and add
+        parsed fields to them.
+
+        :param field_parsers: The dispatch table of HTML input element
+            parsers.
+
+        :param lazy: Create LazyFormData objects, retaining copies of the
+            parsed fields until they are accessed.
+
+        :param selection: The selection of forms to extract. Fields of forms
+            not selected are discarded.
+
+        :returns: A pair of "create_form_data" and "add_form_data_field"
+            callables.
+        """
+
+        def create_fields(parsed_field):
+            return self._create_form_data_field(parsed_field, field_parsers)
+
+        def add_form_data_field(form_data, parsed_field):
+
+            parser = field_parsers.get_parser(parsed_field.name, parsed_field.attrs.get("type", None))
+            if parser is None:
+                return
+
+            group = parser.get_group(parsed_field)
+            if group is not None:
+                form_data.add_group(*group)
+
+            if lazy:
+                # A copy of the element is retained, rather than the element,
+                # so the document tree is released once parsed.
+                form_data.add_field_source(FormElement.detach(parsed_field))
+            else:
+                form_data.fields.extend(parser.parse(parsed_field))
+
+        if lazy:
+            create_form_data = lambda parsed_form: self._create_form_data(parsed_form, LazyFormData(create_fields=create_fields))
+        else:
+            create_form_data = self._create_form_data
+
+        if selection is None:
+            return create_form_data, add_form_data_field
+
+        def create_selected_form_data(parsed_form):
+            form_data = create_form_data(parsed_form)
+            selection.select(form_data)
+            return form_data
+
+        def add_selected_form_data_field(form_data, parsed_field):
+            if selection.is_selected(form_data):
+                add_form_data_field(form_data, parsed_field)
+
+        return create_selected_form_data, add_selected_form_data_field
+
+    def _get_field_parsers(self, parser_backend: ParserBackend) -> FormDataEntryParserTable:
+        """
+        Returns the dispatch table of HTML input element parsers. The table
+        is shared by all parses using the same registry and parser backend.
+
+        :param parser_backend: The backend used by the parsers.
+        """
+
+        return self.field_parser_registry.get_table(parser_backend)
+
+    def _create_form_data(self, parsed_form: Tag, form_data: FormData = None) -> FormData:
         """
         Create Form Data from parsed form node object.
 
         :param parsed_form: A BeautifulSoup object containing a form.
 
+        :param form_data: A FormData object to populate, a new FormData
+            object is created by default.
+
         :returns: A FormData object
         """
 
-        form_data = FormData()
+        if form_data is None:
+            form_data = FormData()
 
         for key, val in parsed_form.attrs.items():
 
             match_key = key.lower()
 
+            form_data._attrs[match_key] = val
+
             if match_key == "name":
                 form_data.name = val
 
@@ -117,25 +748,39 @@ class HtmlFormParser:
 
         return form_data
 
-    def _create_form_data_field(self, parsed_form_field: Tag, field_parsers: List[form_data_entry_parser.InputFormElementParser] = None) -> List[FormDataEntry]:
+    def _create_form_data_field(self, parsed_form_field: Tag, field_parsers: FormDataEntryParserTable = None) -> List[FormDataEntry]:
         """
         Create Form Data Entries from pasred form input element.
 
         :param parsed_form_field: A BeautifulSoup object containing an input field.
 
-        :param field_parsers: A collection of HTML input element parsers.
+        :param field_parsers: The dispatch table of HTML input element
+            parsers. Default is the table of the parser registry.
 
         :returns: A collection of Form Data Entry objects
         """
 
-        field_type = parsed_form_field.attrs.get("type", None)
+        if field_parsers is None:
+            field_parsers = self._get_field_parsers(None)
 
-        for parser in field_parsers:
+        parser = field_parsers.get_parser(parsed_form_field.name, parsed_form_field.attrs.get("type", None))
+        if parser is None:
+            return []
 
-            if field_type is not None and parser.suitable(parsed_form_field.name, field_type.strip().lower()):
-                return parser.parse(parsed_form_field)
+        return parser.parse(parsed_form_field)
 
-            elif parser.suitable(parsed_form_field.name, None):
-                return parser.parse(parsed_form_field)
 
-        return []
+# The object used by parse_forms(). Holds no state between calls.
+_default_form_parser = HtmlFormParser()
+
+
+def parse_forms(markup: Markup, parser: str = None, encoding: str = None, prefilter: bool = False, lazy: bool = False, forms: Union[Callable[[FormData], bool], dict] = None, first_only: bool = False, max_forms: int = None) -> List[FormData]:
+    """
+    Convert a HTML page into Form Data objects. A thread-safe shortcut for
+    HtmlFormParser().parse_forms(), see HtmlFormParser.parse() for the
+    parameters.
+
+    :returns: A new collection of FormData objects.
+    """
+
+    return _default_form_parser.parse_forms(markup, parser, encoding, prefilter, lazy, forms, first_only, max_forms)
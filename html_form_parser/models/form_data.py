@@ -1,6 +1,8 @@
 from typing import List
 
+from html_form_parser.models.form_data_entry import FormDataEntry
 from html_form_parser.models.form_data_entry_collection import FormDataEntryCollection
+from html_form_parser.models.form_data_group import FormDataGroupView
 
 
 class FormData:
@@ -18,6 +20,9 @@ class FormData:
 
         fields: A collection of the form's input fields.
 
+        groups: The select elements, radio groups and checkbox groups of the
+            form, by name.
+
     The object contains an "_attrs" collection. This collection is the source
     of the values provided in the object properties. Additionally, when
     provided a parsed object, its attributes will be loaded into this
@@ -32,6 +37,8 @@ class FormData:
     :param enctype: The Form Data encoding type.
     """
 
+    __slots__ = ("name", "action", "method", "enctype", "fields", "_attrs", "_group_kinds", "__weakref__", )
+
     def __init__(self, name: str = None, action: str = None, method: str = "GET", enctype: str = "multipart/form-data"):
 
         self.name = name
@@ -41,6 +48,134 @@ class FormData:
 
         self.fields = FormDataEntryCollection()
 
+        self._attrs = {}
+
+        # The kind of each group of fields, by name. See FormDataGroup.
+        self._group_kinds = {}
+
+    @property
+    def groups(self) -> FormDataGroupView:
+        """
+        A live mapping of control names to FormDataGroup objects, for the
+        select elements, radio groups and checkbox groups of the form.
+        """
+
+        return FormDataGroupView(self)
+
+    def add_group(self, name: str, kind: str):
+        """
+        Record a control offering a choice of values. The first kind
+        recorded for a name is kept.
+
+        :param name: The name of the control.
+
+        :param kind: The kind of control, one of the GROUP_KIND constants of
+            the form_data_group module.
+        """
+
+        self._group_kinds.setdefault(name, kind)
+
+    def template(self) -> 'FormData':
+        """
+        Returns a read-only copy of the form, from which clones are created
+        cheaply. See FormDataEntryCollection.template().
+        """
+
+        form_data = self.__copy_form()
+        form_data.fields = self.fields.template()
+
+        return form_data
+
+    def clone(self) -> 'FormData':
+        """
+        Returns a copy of the form to be changed and submitted. The fields of
+        a clone of a template are shared with the template, and copied as
+        they are used. A form which is not a template is copied into a
+        template first, so forms submitted repeatedly should be cloned from
+        a template.
+        """
+
+        fields = self.fields
+        if not fields.is_template:
+            return self.template().clone()
+
+        form_data = self.__copy_form()
+        form_data.fields = fields.clone()
+
+        return form_data
+
+    def __copy_form(self) -> 'FormData':
+        """
+        Returns a FormData object with the attributes of the form, but no
+        fields.
+        """
+
+        form_data = FormData(self.name, self.action, self.method, self.enctype)
+        form_data._attrs = {key: (list(value) if isinstance(value, list) else value) for key, value in self._attrs.items()}
+        form_data._group_kinds = dict(self._group_kinds)
+
+        return form_data
+
+    @classmethod
+    def from_dict(cls, value: dict) -> 'FormData':
+        """
+        Create a form from a dictionary created by to_dict().
+
+        :param value: A dictionary of form values.
+        """
+
+        form_data = cls(
+            value.get("name", None), value.get("action", None),
+            value.get("method", "GET"), value.get("enctype", "multipart/form-data"))
+
+        form_data._attrs = {
+            key: (list(attribute_value) if isinstance(attribute_value, list) else attribute_value)
+            for key, attribute_value in value.get("attrs", {}).items()
+        }
+
+        form_data.fields.extend([FormDataEntry.from_dict(entry) for entry in value.get("fields", [])])
+        form_data._group_kinds = dict(value.get("groups", {}))
+
+        return form_data
+
+    def to_dict(self) -> dict:
+        """
+        Returns the form and its fields as a dictionary of plain values,
+        suitable for encoding as JSON.
+        """
+
+        return {
+            "name": self.name,
+            "action": self.action,
+            "method": self.method,
+            "enctype": self.enctype,
+            "attrs": {
+                str(key): ([str(item) for item in value] if isinstance(value, list) else value)
+                for key, value in self._attrs.items()
+            },
+            "fields": [entry.to_dict() for entry in self.fields._iter_entries()],
+            "groups": dict(self._group_kinds),
+        }
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the attributes of the object, including those of subclasses,
+        for copying and pickling.
+        """
+
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name != "__weakref__" and hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state: dict):
+
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def from_beautifulsoup(self, value: 'bs4.Tag'):
         """
         Populate the object with values from a <form /> tag parsed with
@@ -71,7 +206,7 @@ class FormData:
         """
 
         results = [(field.name, field.value, )
-                   for field in self.fields
+                   for field in self.fields._iter_entries()
                    if field.is_submitable and field.filename is None]
 
         return results
@@ -84,7 +219,7 @@ class FormData:
         """
 
         results = [(field.name, (field.filename, open(field.value, "rb")), )
-                   for field in self.fields
+                   for field in self.fields._iter_entries()
                    if field.is_submitable and field.filename is not None]
 
         return results
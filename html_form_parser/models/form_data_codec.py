@@ -0,0 +1,190 @@
+import struct
+import sys
+from array import array
+from typing import List
+
+from html_form_parser.models.form_data import FormData
+from html_form_parser.models.form_data_entry import FormDataEntry
+
+# Identifies packed forms, and the version of the format.
+_MAGIC = b"HFP\x03"
+
+# The magic value, the type codes of the number and string length arrays,
+# the number of strings, the size of the string data, and the count of
+# numbers.
+_header = struct.Struct("<4s2sIII")
+
+# The flags of an entry.
+_SUBMITABLE = 1
+_OPTION = 2
+
+# A multi-valued attribute, such as "class", is stored as a list of
+# strings. A single valued attribute is stored with a count of zero.
+_SINGLE_VALUE = 0
+
+
+def _get_typecode(maximum: int) -> str:
+    """
+    Returns the smallest unsigned array type code able to hold a value.
+    """
+
+    if maximum < 1 << 8:
+        return "B"
+
+    if maximum < 1 << 16:
+        return "H"
+
+    return "I"
+
+
+def _to_bytes(values: array) -> bytes:
+    """
+    Returns the little-endian bytes of an array.
+    """
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: memoryview) -> array:
+    """
+    Create an array from little-endian bytes.
+    """
+
+    values = array(typecode)
+    values.frombytes(data)
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values
+
+
+def pack_forms(forms: List[FormData]) -> bytes:
+    """
+    Encode forms as compact bytes. Each distinct string, such as a field
+    name repeated across forms, is stored once in a string table and
+    referred to by number.
+
+    :param forms: A collection of FormData objects. Names, values and
+        attributes must be strings, lists of strings for multi-valued
+        attributes, or None.
+
+    :returns: The packed forms, see unpack_forms().
+    """
+
+    # The string table, in order of first use. Reference zero is None.
+    references = {None: 0}
+    add_reference = references.setdefault
+
+    def add(value: str) -> int:
+        return add_reference(value, len(references))
+
+    numbers = [len(forms)]
+    for form_data in forms:
+
+        numbers.extend((add(form_data.name), add(form_data.action), add(form_data.method), add(form_data.enctype), len(form_data._attrs), ))
+
+        for key, value in form_data._attrs.items():
+            if isinstance(value, list):
+                numbers.append(add(key))
+                numbers.append(len(value) + 1)
+                numbers.extend([add(item) for item in value])
+            else:
+                numbers.extend((add(key), _SINGLE_VALUE, add(value), ))
+
+        fields = form_data.fields
+        numbers.append(len(fields))
+        for entry in fields._iter_entries():
+            numbers.extend((
+                add(entry.name), add(entry.value), add(entry.filename),
+                (_SUBMITABLE if entry.is_submitable else 0) | (_OPTION if entry.is_option else 0), ))
+
+        numbers.append(len(form_data._group_kinds))
+        for group_name, kind in form_data._group_kinds.items():
+            numbers.extend((add(group_name), add(kind), ))
+
+    del references[None]
+
+    strings = list(references)
+    for value in strings:
+        if not isinstance(value, str):
+            raise TypeError("Expected a string, not %r." % (value, ))
+
+    string_data = "".join(strings).encode("utf-8", "surrogatepass")
+    lengths = [len(value) for value in strings]
+
+    number_typecode = _get_typecode(max(numbers))
+    length_typecode = _get_typecode(max(lengths, default=0))
+
+    return b"".join((
+        _header.pack(_MAGIC, (number_typecode + length_typecode).encode("ascii"), len(strings), len(string_data), len(numbers)),
+        _to_bytes(array(length_typecode, lengths)),
+        string_data,
+        _to_bytes(array(number_typecode, numbers)),
+    ))
+
+
+def unpack_forms(data: bytes) -> List[FormData]:
+    """
+    Create FormData objects from forms packed by pack_forms().
+
+    :param data: The packed forms.
+    """
+
+    data = memoryview(data).cast("B")
+
+    magic, typecodes, string_count, string_size, number_count = _header.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("The data does not contain packed forms.")
+
+    number_typecode, length_typecode = typecodes.decode("ascii")
+
+    position = _header.size
+    length_end = position + string_count * array(length_typecode).itemsize
+    lengths = _from_bytes(length_typecode, data[position:length_end])
+
+    string_end = length_end + string_size
+    string_data = str(data[length_end:string_end], "utf-8", "surrogatepass")
+
+    numbers = _from_bytes(number_typecode, data[string_end:])
+    if len(numbers) != number_count or len(lengths) != string_count:
+        raise ValueError("The packed forms are truncated.")
+
+    strings = [None]
+    offset = 0
+    for length in lengths:
+        strings.append(string_data[offset:offset + length])
+        offset += length
+
+    values = iter(numbers)
+
+    forms = []
+    for _ in range(next(values)):
+
+        form_data = FormData(strings[next(values)], strings[next(values)], strings[next(values)], strings[next(values)])
+
+        attrs = form_data._attrs
+        for _ in range(next(values)):
+            key = strings[next(values)]
+
+            count = next(values)
+            if count == _SINGLE_VALUE:
+                attrs[key] = strings[next(values)]
+            else:
+                attrs[key] = [strings[next(values)] for _ in range(count - 1)]
+
+        entries = []
+        for _ in range(next(values)):
+            entry_name, value, filename, flags = strings[next(values)], strings[next(values)], strings[next(values)], next(values)
+            entries.append(FormDataEntry(entry_name, value, filename, bool(flags & _SUBMITABLE), bool(flags & _OPTION)))
+
+        form_data.fields.extend(entries)
+
+        form_data._group_kinds = {strings[next(values)]: strings[next(values)] for _ in range(next(values))}
+
+        forms.append(form_data)
+
+    return forms
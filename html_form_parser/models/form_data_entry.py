@@ -12,16 +12,257 @@ class FormDataEntry:
 
     :param is_submitable: A flag to indicate if a field should be included
         with a HTTP post.
+
+    :param is_option: A flag to indicate the field is an option of a select
+        element, or a radio button or checkbox, and a member of the group of
+        its name. See FormDataGroup.
     """
 
-    def __init__(self, name: str = None, value: str = None, filename: str = None, is_submitable: bool = True):
+    __slots__ = ("_name", "_value", "_filename", "_is_submitable", "_is_option", "_sort_key", "_collections", )
+
+    # The content type of entries, shared by all instances.
+    content_type = "form-data"
+
+    def __init__(self, name: str = None, value: str = None, filename: str = None, is_submitable: bool = True, is_option: bool = False):
+
+        self._name = name
+        self._value = value
+        self._filename = filename
+        self._is_submitable = is_submitable
+        self._is_option = is_option
+
+        # The values compared by the comparison methods, created when first
+        # compared.
+        self._sort_key = None
+
+        # Weak references to the collections indexing the entry, as a single
+        # reference or a tuple of references, notified when the name or
+        # value, or submitable state, changes.
+        self._collections = None
+
+    @property
+    def name(self) -> str:
+        """
+        The form data field name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+
+        if self._collections is not None:
+            self.__check_collections()
+
+        previous_name = self._name
+
+        self._name = value
+        self._sort_key = None
+
+        if self._collections is not None:
+            self.__notify_collections(previous_name, self._value)
+
+    @property
+    def value(self) -> str:
+        """
+        The form data field value or file attachment contents.
+        """
+
+        return self._value
+
+    @value.setter
+    def value(self, value: str):
+
+        if self._collections is not None:
+            self.__check_collections()
+
+        previous_value = self._value
+
+        self._value = value
+        self._sort_key = None
+
+        if self._collections is not None:
+            self.__notify_collections(self._name, previous_value)
+
+    @property
+    def filename(self) -> str:
+        """
+        A filename used if file data is stored in value.
+        """
+
+        return self._filename
+
+    @filename.setter
+    def filename(self, value: str):
+
+        if self._collections is not None:
+            self.__check_collections()
+
+        self._filename = value
+        self._sort_key = None
+
+    @property
+    def is_submitable(self) -> bool:
+        """
+        A flag to indicate if a field should be included with a HTTP post.
+        """
+
+        return self._is_submitable
+
+    @is_submitable.setter
+    def is_submitable(self, value: bool):
+
+        if self._collections is not None:
+            self.__check_collections()
+
+        previous_value = self._is_submitable
+
+        self._is_submitable = value
+
+        if self._collections is not None and bool(value) != bool(previous_value):
+            self.__notify_collections(self._name, self._value)
+
+    @property
+    def is_option(self) -> bool:
+        """
+        A flag to indicate the field is a member of the group of its name.
+        Other fields of the same name, such as a hidden input providing a
+        default for a checkbox, are not changed through the group.
+        """
+
+        return self._is_option
+
+    @property
+    def sort_key(self) -> tuple:
+        """
+        The name, value and filename of the entry, by which entries are
+        compared.
+        """
+
+        sort_key = self._sort_key
+        if sort_key is None:
+            sort_key = self._sort_key = (self._name, self._value, self._filename, )
+
+        return sort_key
+
+    def copy(self) -> 'FormDataEntry':
+        """
+        Returns a new entry with the same name, value, filename, submitable
+        state and group membership. The copy is not contained by any
+        collection.
+        """
+
+        return type(self)(self._name, self._value, self._filename, self._is_submitable, self._is_option)
+
+    def _assign(self, value: str, filename: str, is_submitable: bool):
+        """
+        Set the value, filename and submitable state without notifying the
+        collections indexing the entry. Used by a collection updating its own
+        indexes, see FormDataEntryCollection.update_many().
+        """
+
+        self._value = value
+        self._filename = filename
+        self._is_submitable = is_submitable
+        self._sort_key = None
+
+    def _add_collection(self, reference: 'weakref.ref'):
+        """
+        Register a collection indexing the entry.
+
+        :param reference: The weak reference of the collection.
+        """
+
+        collections = self._collections
+
+        if collections is None:
+            self._collections = reference
+        elif isinstance(collections, tuple):
+            if reference not in collections:
+                self._collections = collections + (reference, )
+        elif collections is not reference:
+            self._collections = (collections, reference, )
+
+    def _remove_collection(self, reference: 'weakref.ref'):
+        """
+        Unregister a collection no longer containing the entry.
+
+        :param reference: The weak reference of the collection.
+        """
+
+        collections = self._collections
+
+        if collections is reference:
+            self._collections = None
+        elif isinstance(collections, tuple) and reference in collections:
+            collections = tuple(item for item in collections if item is not reference)
+            self._collections = collections if len(collections) > 1 else collections[0]
+
+    def __check_collections(self):
+        """
+        Raise a TypeError when a collection containing the entry is a
+        template, before the entry is changed.
+        """
+
+        collections = self._collections
+        if not isinstance(collections, tuple):
+            collections = (collections, )
+
+        for reference in collections:
+            collection = reference()
+            if collection is not None and collection.is_template:
+                raise TypeError("An entry of a template can not be changed, change a clone of the template instead.")
+
+    def __notify_collections(self, previous_name: str, previous_value: str):
+        """
+        Update the indexes of the collections containing the entry, after
+        its name, value or submitable state changed.
+        """
 
-        self.content_type = "form-data"
+        collections = self._collections
+        if not isinstance(collections, tuple):
+            collections = (collections, )
 
-        self.name = name
-        self.value = value
-        self.filename = filename
-        self.is_submitable = is_submitable
+        for reference in collections:
+            collection = reference()
+            if collection is None:
+                self._remove_collection(reference)
+            else:
+                collection._update_entry(self, previous_name, previous_value)
+
+    @classmethod
+    def from_dict(cls, value: dict) -> 'FormDataEntry':
+        """
+        Create an entry from a dictionary created by to_dict().
+
+        :param value: A dictionary of entry values.
+        """
+
+        return cls(
+            value.get("name", None), value.get("value", None), value.get("filename", None),
+            value.get("is_submitable", True), value.get("is_option", False))
+
+    def to_dict(self) -> dict:
+        """
+        Returns the entry as a dictionary of plain values, suitable for
+        encoding as JSON.
+        """
+
+        return {
+            "name": self.name,
+            "value": self.value,
+            "filename": self.filename,
+            "is_submitable": self.is_submitable,
+            "is_option": self.is_option,
+        }
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the entry as its constructor arguments, rather than its
+        attribute dictionary.
+        """
+
+        return (type(self), (self.name, self.value, self.filename, self.is_submitable, self.is_option, ), )
 
     def __eq__(self, other: 'FormDataField'):
         """
@@ -33,7 +274,9 @@ class FormDataEntry:
         if not isinstance(other, FormDataEntry):
             return NotImplemented
 
-        return (self.name, self.value, self.filename, ) == (other.name, other.value, other.filename, )
+        # The cached keys are read directly, as a sort makes many
+        # comparisons.
+        return (self._sort_key or self.sort_key) == (other._sort_key or other.sort_key)
 
     def __ne__(self, other: 'FormDataField'):
         """
@@ -42,7 +285,10 @@ class FormDataEntry:
         :param other: A FormDataField object to compare to.
         """
 
-        return not self.__eq__(other)
+        if not isinstance(other, FormDataEntry):
+            return NotImplemented
+
+        return (self._sort_key or self.sort_key) != (other._sort_key or other.sort_key)
 
     def __gt__(self, other: 'FormDataField'):
         """
@@ -54,7 +300,7 @@ class FormDataEntry:
         if not isinstance(other, FormDataEntry):
             return NotImplemented
 
-        return (self.name, self.value, self.filename, ) > (other.name, other.value, other.filename, )
+        return (self._sort_key or self.sort_key) > (other._sort_key or other.sort_key)
 
     def __ge__(self, other: 'FormDataField'):
         """
@@ -63,7 +309,10 @@ class FormDataEntry:
         :param other: A FormDataField object to compare to.
         """
 
-        return (self.__eq__(other) or self.__gt__(other))
+        if not isinstance(other, FormDataEntry):
+            return NotImplemented
+
+        return (self._sort_key or self.sort_key) >= (other._sort_key or other.sort_key)
 
     def __lt__(self, other: 'FormDataField'):
         """
@@ -72,7 +321,10 @@ class FormDataEntry:
         :param other: A FormDataField object to compare to.
         """
 
-        return (not self.__eq__(other) and not self.__gt__(other))
+        if not isinstance(other, FormDataEntry):
+            return NotImplemented
+
+        return (self._sort_key or self.sort_key) < (other._sort_key or other.sort_key)
 
     def __le__(self, other: 'FormDataField'):
         """
@@ -81,4 +333,7 @@ class FormDataEntry:
         :param other: A FormDataField object to compare to.
         """
 
-        return (self.__eq__(other) or not self.__gt__(other))
+        if not isinstance(other, FormDataEntry):
+            return NotImplemented
+
+        return (self._sort_key or self.sort_key) <= (other._sort_key or other.sort_key)
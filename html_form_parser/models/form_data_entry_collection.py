@@ -1,13 +1,64 @@
-from collections.abc import Iterable, MutableSequence
-from typing import List
+import bisect
+import operator
+import weakref
+from collections.abc import Iterable, Mapping, MutableSequence, Sequence
+from typing import Iterable as IterableType, Iterator, KeysView, List, Mapping as MappingType, Tuple, Union
 
 from html_form_parser.models.form_data_entry import FormDataEntry
 
 
+def _add_position(positions: List[int], position: int):
+    """
+    Add a position to a list of positions in ascending order.
+    """
+
+    if not positions or positions[-1] < position:
+        positions.append(position)
+    else:
+        bisect.insort(positions, position)
+
+
+def _discard_position(positions: List[int], position: int):
+    """
+    Remove a position from a list of positions in ascending order, if
+    present.
+    """
+
+    index = bisect.bisect_left(positions, position)
+    if index < len(positions) and positions[index] == position:
+        del positions[index]
+
+
+def _restore_template(fields: List[FormDataEntry]) -> 'FormDataEntryCollection':
+    """
+    Recreate a pickled, or deep copied, template collection from its
+    entries.
+    """
+
+    return FormDataEntryCollection(fields).template()
+
+
 class FormDataEntryCollection(MutableSequence):
     """
     A collection of FormDataField objects. Providing methods for locating
-    entries in the collection by name, or name and value.
+    entries in the collection by name, or name and value, and views of the
+    entries sharing a name and of the submitable entries.
+
+    The lookup indexes are created by the first lookup, and are then kept
+    up to date by each change: entries added, removed or moved, and changes
+    to the name, value or submitable state of an entry. Reading entries
+    costs nothing.
+
+    A template, created by template(), is a read-only copy of a collection.
+    Clones of a template share its entries and indexes: an entry is copied
+    when it is first read from the clone, and an index position list when it
+    is first changed. Creating a clone, and changing some of its fields,
+    therefore costs nothing for the other fields. Adding, removing or moving
+    entries of a clone copies the remaining entries.
+
+    Lookups may be shared by any number of threads. Changes to the
+    collection, or to its entries, must not be made while it is used by
+    another thread.
 
     :param fields: A collection of fields to add to this instance.
     """
@@ -16,17 +67,97 @@ class FormDataEntryCollection(MutableSequence):
 
         self.__fields = []
 
-        # Indexes used by the index() method to optimize searching for fields.
-        self.__field_name_index = {}
-        self.__field_name_value_index = {}
+        # The positions of the entries by name, and by name and value, the
+        # positions of the submitable entries, and the positions of the
+        # submitable group members of the names used by groups, in
+        # ascending order. None until the first lookup.
+        self.__indexes = None
+
+        # The weak reference of the collection given to indexed entries,
+        # letting them report changes to their name, value or submitable
+        # state.
+        self.__reference = None
+
+        # Indicates a template, which may not be changed.
+        self.__is_template = False
 
-        # A flag to let the index() method know that it needs to refresh the
-        # index before doing a lookup.
-        self.__is_dirty = False
+        # The template of a clone. A clone has no list of entries of its own,
+        # but the copies of the entries read from it by position, and the
+        # changes to the template's indexes: name and value index position
+        # lists by key, the submitable state by position, and the selected
+        # positions by name.
+        self.__template = None
+        self.__copies = None
+        self.__overlay = None
 
         if fields is not None:
             self.extend(fields)
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the collection as its entries. The indexes are derived from
+        the entries, and are rebuilt when first needed. A template is
+        recreated as a template, and a clone as an ordinary collection.
+        """
+
+        if self.__is_template:
+            return (_restore_template, (list(self._iter_entries()), ), )
+
+        return (type(self), (list(self._iter_entries()), ), )
+
+    @property
+    def is_template(self) -> bool:
+        """
+        Indicates the collection is a template, see template().
+        """
+
+        return self.__is_template
+
+    def template(self) -> 'FormDataEntryCollection':
+        """
+        Returns a read-only copy of the collection, from which clones are
+        created cheaply. Adding, removing or moving its entries raises a
+        TypeError, as does changing an entry read from it.
+        """
+
+        collection = FormDataEntryCollection([field.copy() for field in self._iter_entries()])
+        collection.__build_indexes()
+        collection.__is_template = True
+
+        return collection
+
+    def clone(self) -> 'FormDataEntryCollection':
+        """
+        Returns a collection of the same entries, sharing the entries and
+        indexes of a template until they are changed. A collection which is
+        not a template is copied into a template first.
+        """
+
+        if not self.__is_template:
+            return self.template().clone()
+
+        collection = FormDataEntryCollection()
+        collection.__fields = None
+        collection.__reference = weakref.ref(collection)
+        collection.__template = self
+        collection.__copies = {}
+        collection.__overlay = ({}, {}, {}, {}, )
+
+        return collection
+
+    def _iter_entries(self) -> Iterator[FormDataEntry]:
+        """
+        Iterate over the entries to read them, without copying the entries
+        a clone shares with its template. The entries must not be changed.
+        """
+
+        if self.__template is None:
+            return iter(self.__fields)
+
+        copies = self.__copies
+
+        return iter([copies.get(position, field) for position, field in enumerate(self.__template.__fields)])
+
     def index_by_name(self, name: str) -> int:
         """
         Return zero-based index of the first field providing a matching name.
@@ -34,9 +165,14 @@ class FormDataEntryCollection(MutableSequence):
         :param name: A "name" to match in the collection of FormDataFields.
         """
 
-        self.__refresh_indexes()
+        if self.__template is not None:
+            positions = self.__find_positions(0, name)
+            if not positions:
+                raise KeyError(name)
+
+            return positions[0]
 
-        return self.__field_name_index[name][0]
+        return self.__get_indexes()[0][name][0]
 
     def index_by_name_value(self, name: str, value: str) -> int:
         """
@@ -49,15 +185,168 @@ class FormDataEntryCollection(MutableSequence):
             FormDataFields.
         """
 
-        self.__refresh_indexes()
+        if self.__template is not None:
+            positions = self.__find_positions(1, (name, value, ))
+            if not positions:
+                raise KeyError((name, value, ))
+
+            return positions[0]
+
+        return self.__get_indexes()[1][(name, value, )][0]
+
+    def indices_by_name(self, name: str) -> List[int]:
+        """
+        Return the zero-based indexes of all fields providing a matching
+        name, in order.
+
+        :param name: A "name" to match in the collection of FormDataFields.
+        """
+
+        return list(self.__find_positions(0, name))
+
+    def get_all(self, name: str) -> List[FormDataEntry]:
+        """
+        Return all fields providing a matching name, in order, such as the
+        options of a select element.
+
+        :param name: A "name" to match in the collection of FormDataFields.
+        """
+
+        if self.__template is not None:
+            return [self.__get_copy(position) for position in self.__find_positions(0, name)]
+
+        fields = self.__fields
+
+        return [fields[position] for position in self.__get_indexes()[0].get(name, ())]
+
+    @property
+    def by_name(self) -> 'FormDataEntryNameView':
+        """
+        A live mapping of each field name to the list of fields providing
+        it.
+        """
+
+        return FormDataEntryNameView(self)
+
+    def submitable(self) -> 'FormDataEntrySubmitableView':
+        """
+        Returns a live sequence of the fields to be included with a HTTP
+        post, in order.
+        """
+
+        return FormDataEntrySubmitableView(self)
+
+    def update_many(self, values: Union[MappingType[str, object], IterableType[Tuple[str, object]]] = (), select: Union[MappingType[str, object], IterableType[Tuple[str, object]]] = ()):
+        """
+        Set the values of several fields, and select checkboxes and options,
+        in one pass. Every name and selected value is validated before any
+        field is changed.
+
+        :param values: A mapping, or (name, value) pairs, of the values to
+            set. The first field providing each name is changed. A
+            (filename, path) tuple assigns a file, see
+            FormData.prepare_file_data().
+
+        :param select: A mapping, or (name, value) pairs, of the values to
+            select. A value may be a list of values. The group members of
+            each name, see FormDataEntry.is_option, are made submitable when
+            their value is selected, and are otherwise deselected. Other
+            fields of the name are unchanged.
+
+        :raises KeyError: A name, or a selected value, is not provided by any
+            field, or group member.
+        """
+
+        if self.__is_template:
+            raise TypeError("A template can not be changed, change a clone of it instead.")
+
+        if isinstance(values, Mapping):
+            values = values.items()
+        if isinstance(select, Mapping):
+            select = select.items()
+
+        updates = []
+        for name, value in values:
+
+            positions = self.__find_positions(0, name)
+            if not positions:
+                raise KeyError(name)
+
+            updates.append((positions[0], value, ))
+
+        selections = []
+        for name, selected_values in select:
+
+            if isinstance(selected_values, str) or not isinstance(selected_values, Iterable):
+                selected_values = (selected_values, )
+
+            selected_values = set(selected_values)
+
+            for value in selected_values:
+                if not self._get_option_positions(name, value):
+                    raise KeyError((name, value, ))
+
+            selections.append((name, selected_values, ))
 
-        return self.__field_name_value_index[(name, value, )]
+        fields = self
+        reference = self.__reference
+
+        if self.__template is not None:
+            # Clones update their copies of the template's indexes as each
+            # entry reports its changes.
+            reference = None
+        else:
+            fields = self.__fields
+
+        # The previous value and submitable state of each entry changed,
+        # when the entry is indexed only by this collection. The indexes
+        # are refreshed once all entries are changed.
+        changes = {}
+
+        def set_field(field, value, filename, is_submitable):
+
+            if field._collections is not reference:
+                # Entries shared with other collections notify each of them.
+                field.value = value
+                field.filename = filename
+                field.is_submitable = is_submitable
+                return
+
+            if id(field) not in changes:
+                changes[id(field)] = (field, field.value, bool(field.is_submitable), )
+
+            field._assign(value, filename, is_submitable)
+
+        for position, value in updates:
+
+            field = fields[position]
+
+            if isinstance(value, tuple):
+                filename, value = value
+                set_field(field, value, filename, field.is_submitable)
+            else:
+                set_field(field, value, field.filename, field.is_submitable)
+
+        for name, selected_values in selections:
+            for position in list(self.__find_positions(0, name)):
+
+                if not self.__read_entry(position).is_option:
+                    continue
+
+                field = fields[position]
+
+                is_selected = field.value in selected_values
+                if bool(field.is_submitable) != is_selected:
+                    set_field(field, field.value, field.filename, is_selected)
+
+        if changes:
+            self.__refresh_fields(list(changes.values()))
 
     def insert(self, index: int, value: FormDataEntry):
         """
-        Inserts a FormDataField at the given index. Note this is a very
-        intensive operation, as each insert triggers a rebuild of the
-        object's indexes.
+        Inserts a FormDataField at the given index. The positions of the
+        following fields are shifted within the indexes, so inserting near
+        the end of the collection is cheapest.
 
         :param index: The location in the collection to insert the given
             value at.
@@ -65,61 +354,547 @@ class FormDataEntryCollection(MutableSequence):
         :param value: The value to be inserted into the collection.
         """
 
-        self.__is_dirty = True
+        if self.__template is not None or self.__is_template:
+            self.__prepare_change()
+
+        length = len(self.__fields)
+
+        # Positions are clamped as list.insert() does.
+        if index < 0:
+            index = max(length + index, 0)
+        index = min(index, length)
 
         self.__fields.insert(index, value)
 
+        if self.__indexes is None:
+            return
+
+        if index < length:
+            self.__shift_positions(index, 1)
+
+        self.__add_position(value, index)
+        value._add_collection(self.__reference)
+
+    def extend(self, values: Iterable):
+        """
+        Append fields to the end of the collection.
+
+        :param values: A collection of FormDataField objects.
+        """
+
+        if self.__template is not None or self.__is_template:
+            self.__prepare_change()
+
+        if self.__indexes is None:
+            self.__fields.extend(values)
+            return
+
+        for value in list(values):
+            self.insert(len(self.__fields), value)
+
+    def clear(self):
+        """
+        Remove all fields from the collection.
+        """
+
+        if self.__template is not None or self.__is_template:
+            self.__prepare_change()
+
+        if self.__indexes is not None:
+            for field in self.__fields:
+                field._remove_collection(self.__reference)
+
+            self.__indexes = ({}, {}, [], {name: [] for name in self.__indexes[3]}, )
+
+        self.__fields.clear()
+
+    def reverse(self):
+        """
+        Reverses the order of the fields in place.
+        """
+
+        if self.__template is not None or self.__is_template:
+            self.__prepare_change()
+
+        self.__fields.reverse()
+
+        if self.__indexes is not None:
+            self.__build_indexes()
+
     def sort(self, key=None, reverse=False):
         """
-        Sorts the collection of fields in place.
+        Sorts the collection of fields in place. By default, fields are
+        sorted by their name, value and filename.
         """
 
-        self.__is_dirty = True
+        if self.__template is not None or self.__is_template:
+            self.__prepare_change()
+
+        if key is None:
+            key = operator.attrgetter("sort_key")
 
         self.__fields.sort(key=key, reverse=reverse)
 
-    def __add_field_to_index(self, index: int, field: FormDataEntry):
+        if self.__indexes is not None:
+            self.__build_indexes()
+
+    def _update_entry(self, field: FormDataEntry, previous_name: str, previous_value: str):
         """
-        Create a new entry to the indexes.
+        Move an entry within the indexes after its name, value or submitable
+        state changed. Called by the entry.
 
-        :param index: The location of the field in the collection.
+        :param field: The changed FormDataField object.
 
-        :param field: The FormDataField object to obtain key values from.
+        :param previous_name: The name of the entry before the change.
+
+        :param previous_value: The value of the entry before the change.
+        """
+
+        if self.__is_template:
+            raise TypeError("A template can not be changed, change a clone of it instead.")
+
+        if self.__template is not None:
+            self.__update_copy(field, previous_name, previous_value)
+            return
+
+        indexes = self.__indexes
+        if indexes is None:
+            return
+
+        # Entries rarely share a name and value, so the positions of the
+        # entry are found without visiting the other entries of its name.
+        fields = self.__fields
+        positions = [position for position in indexes[1].get((previous_name, previous_value, ), ()) if fields[position] is field]
+
+        if field.name == previous_name and field.value == previous_value:
+            # At most the submitable state changed.
+            selected_positions = indexes[3].get(previous_name, None) if field.is_option else None
+
+            for position in positions:
+                for submitable_positions in (indexes[2], selected_positions, ):
+                    if submitable_positions is not None:
+                        _discard_position(submitable_positions, position)
+                        if field.is_submitable:
+                            _add_position(submitable_positions, position)
+
+            return
+
+        for position in positions:
+            self.__remove_position(previous_name, previous_value, position)
+            self.__add_position(field, position)
+
+    def _get_names(self) -> KeysView:
         """
+        Returns the names of the fields, see by_name.
+        """
+
+        if self.__template is not None:
+            names = dict.fromkeys(self.__template.__indexes[0])
+            names.update(self.__overlay[0])
+
+            return {name: None for name in names if self.__find_positions(0, name)}.keys()
+
+        return self.__get_indexes()[0].keys()
+
+    def _get_submitable_positions(self) -> List[int]:
+        """
+        Returns the positions of the submitable fields, see submitable().
+        """
+
+        if self.__template is not None:
+            submitable_overlay = self.__overlay[2]
+            if not submitable_overlay:
+                return self.__template.__indexes[2]
 
-        if field.name not in self.__field_name_index:
-            self.__field_name_index[field.name] = []
+            positions = {position for position in self.__template.__indexes[2] if submitable_overlay.get(position, True)}
+            positions.update(position for position, is_submitable in submitable_overlay.items() if is_submitable)
 
-        self.__field_name_index[field.name].append(index)
-        self.__field_name_index[field.name].sort()
+            return sorted(positions)
 
-        key = (field.name, field.value, )
-        if key not in self.__field_name_value_index:
-            self.__field_name_value_index[key] = index
+        return self.__get_indexes()[2]
 
-    def __refresh_indexes(self):
+    def _get_selected_positions(self, name: str) -> List[int]:
         """
-        Rebuilds the indexes.
+        Returns the positions of the submitable group members providing a
+        name, see FormDataGroup. The positions are maintained from the first
+        call.
+
+        :param name: A "name" to match in the collection of FormDataFields.
+        """
+
+        if self.__template is not None:
+            selected_overlay = self.__overlay[3]
+
+            positions = selected_overlay.get(name, None)
+            if positions is None:
+                positions = selected_overlay[name] = [position for position in self.__find_positions(0, name) if self.__get_entry(position).is_option and self.__get_entry(position).is_submitable]
+
+            return positions
+
+        indexes = self.__get_indexes()
+
+        positions = indexes[3].get(name, None)
+        if positions is None:
+            fields = self.__fields
+            positions = indexes[3][name] = [position for position in indexes[0].get(name, ()) if fields[position].is_option and fields[position].is_submitable]
+
+        return positions
+
+    def _get_option_positions(self, name: str, value: str) -> List[int]:
+        """
+        Returns the positions of the group members providing a name and
+        value, see FormDataGroup.
+
+        :param name: A "name" to match in the collection of FormDataFields.
+
+        :param value: A "value" to match in the collection of
+            FormDataFields.
+        """
+
+        return [position for position in self.__find_positions(1, (name, value, )) if self.__read_entry(position).is_option]
+
+    def __refresh_fields(self, changes: List[Tuple[FormDataEntry, str, bool]]):
+        """
+        Update the indexes after the values or submitable states of entries
+        were changed without notifications. The name index is unchanged.
+        When most entries changed, the other indexes are created again in a
+        single pass.
+
+        :param changes: The changed entries, with their previous value and
+            submitable state.
         """
 
-        if not self.__is_dirty:
-            # The collection hasn't been marked dirty, there is nothing to do.
+        field_name_index, field_name_value_index, submitable_positions, selected_index = self.__indexes
+        fields = self.__fields
+
+        if len(changes) * 2 > len(fields):
+
+            field_name_value_index.clear()
+            del submitable_positions[:]
+            for selected_positions in selected_index.values():
+                del selected_positions[:]
+
+            for position, field in enumerate(fields):
+
+                name = field.name
+                field_name_value_index.setdefault((name, field.value, ), []).append(position)
+
+                if field.is_submitable:
+                    submitable_positions.append(position)
+
+                    selected_positions = selected_index.get(name, None) if field.is_option else None
+                    if selected_positions is not None:
+                        selected_positions.append(position)
+
             return
 
-        self.__field_name_index = {}
-        self.__field_name_value_index = {}
+        for field, previous_value, was_submitable in changes:
+
+            name = field.name
+            value = field.value
+            is_submitable = bool(field.is_submitable)
+
+            is_value_changed = value != previous_value
+            is_submitable_changed = is_submitable != was_submitable
+
+            if not is_value_changed and not is_submitable_changed:
+                continue
+
+            previous_key = (name, previous_value, )
+            previous_positions = field_name_value_index[previous_key]
+
+            field_positions = [position for position in previous_positions if fields[position] is field]
+
+            if is_value_changed:
+                for position in field_positions:
+                    _discard_position(previous_positions, position)
+
+                if not previous_positions:
+                    del field_name_value_index[previous_key]
+
+                positions = field_name_value_index.setdefault((name, value, ), [])
+                for position in field_positions:
+                    _add_position(positions, position)
+
+            if is_submitable_changed:
+                update = _add_position if is_submitable else _discard_position
+                selected_positions = selected_index.get(name, None) if field.is_option else None
+
+                for position in field_positions:
+                    update(submitable_positions, position)
+                    if selected_positions is not None:
+                        update(selected_positions, position)
+
+    def __find_positions(self, index_number: int, key) -> List[int]:
+        """
+        Returns the positions of a key of the name index, or the name and
+        value index, which must not be changed.
+
+        :param index_number: 0 for the name index, 1 for the name and value
+            index.
+        """
+
+        if self.__template is not None:
+            overlay = self.__overlay[index_number]
+            if key in overlay:
+                return overlay[key]
+
+            return self.__template.__indexes[index_number].get(key, ())
+
+        return self.__get_indexes()[index_number].get(key, ())
+
+    def __prepare_change(self):
+        """
+        Prepare to add, remove or move entries. Templates may not be changed,
+        and clones are given a copy of every entry.
+        """
+
+        if self.__is_template:
+            raise TypeError("A template can not be changed, change a clone of it instead.")
+
+        fields = [self.__get_copy(position) for position in range(len(self))]
+
+        self.__template = None
+        self.__copies = None
+        self.__overlay = None
+
+        self.__fields = fields
+        self.__build_indexes()
+
+    def __read_entry(self, position: int) -> FormDataEntry:
+        """
+        Returns the entry at a position, to be read only. Clones do not copy
+        the entry.
+        """
+
+        if self.__template is not None:
+            return self.__get_entry(position)
+
+        return self.__fields[position]
+
+    def __get_entry(self, position: int) -> FormDataEntry:
+        """
+        Returns the entry of a clone at a position, to be read only.
+        """
+
+        field = self.__copies.get(position, None)
+        if field is None:
+            field = self.__template.__fields[position]
+
+        return field
+
+    def __get_copy(self, position: int) -> FormDataEntry:
+        """
+        Returns the entry of a clone at a position, copying the template's
+        entry on first use.
+        """
 
-        for index, item in enumerate(self.__fields):
-            self.__add_field_to_index(index, item)
+        if position < 0:
+            position += len(self)
 
-        self.__is_dirty = False
+        field = self.__copies.get(position, None)
+        if field is None:
+            field = self.__copies[position] = self.__template.__fields[position].copy()
+            field._add_collection(self.__reference)
+
+        return field
+
+    def __get_own_positions(self, index_number: int, key) -> List[int]:
+        """
+        Returns the positions of a key of a clone's name index, or name and
+        value index, copying the template's positions on first use.
+        """
+
+        overlay = self.__overlay[index_number]
+
+        positions = overlay.get(key, None)
+        if positions is None:
+            positions = overlay[key] = list(self.__template.__indexes[index_number].get(key, ()))
+
+        return positions
+
+    def __update_copy(self, field: FormDataEntry, previous_name: str, previous_value: str):
+        """
+        Update the indexes of a clone after the name, value or submitable
+        state of an entry changed, see _update_entry().
+        """
+
+        copies = self.__copies
+        positions = [position for position in self.__find_positions(1, (previous_name, previous_value, )) if copies.get(position, None) is field]
+
+        name = field.name
+        is_submitable = bool(field.is_submitable)
+
+        submitable_overlay = self.__overlay[2]
+        selected_overlay = self.__overlay[3]
+
+        for position in positions:
+
+            if name != previous_name:
+                _discard_position(self.__get_own_positions(0, previous_name), position)
+                _add_position(self.__get_own_positions(0, name), position)
+
+            if name != previous_name or field.value != previous_value:
+                _discard_position(self.__get_own_positions(1, (previous_name, previous_value, )), position)
+                _add_position(self.__get_own_positions(1, (name, field.value, )), position)
+
+            submitable_overlay[position] = is_submitable
+
+            selected_positions = selected_overlay.get(previous_name, None)
+            if selected_positions is not None:
+                _discard_position(selected_positions, position)
+
+            selected_positions = selected_overlay.get(name, None)
+            if selected_positions is not None and is_submitable and field.is_option:
+                _add_position(selected_positions, position)
+
+    def __get_indexes(self) -> tuple:
+        """
+        Returns the name index, the name and value index and the submitable
+        positions, creating them on first use.
+        """
+
+        indexes = self.__indexes
+        if indexes is None:
+            indexes = self.__build_indexes()
+
+        return indexes
+
+    def __build_indexes(self) -> tuple:
+        """
+        Create the indexes from the current entries, and register the
+        collection with each entry.
+
+        The indexes are published together once complete, so a lookup on
+        another thread never sees a partially built index.
+
+        :returns: The name index, the name and value index, the submitable
+            positions, and the selected positions index.
+        """
+
+        if self.__reference is None:
+            self.__reference = weakref.ref(self)
+
+        reference = self.__reference
+
+        field_name_index = {}
+        field_name_value_index = {}
+        submitable_positions = []
+
+        # The names used by groups remain indexed.
+        selected_index = {name: [] for name in (self.__indexes[3] if self.__indexes is not None else ())}
+
+        for position, field in enumerate(self.__fields):
+
+            name = field.name
+            field_name_index.setdefault(name, []).append(position)
+            field_name_value_index.setdefault((name, field.value, ), []).append(position)
+
+            if field.is_submitable:
+                submitable_positions.append(position)
+
+                selected_positions = selected_index.get(name, None) if field.is_option else None
+                if selected_positions is not None:
+                    selected_positions.append(position)
+
+            field._add_collection(reference)
+
+        indexes = self.__indexes = (field_name_index, field_name_value_index, submitable_positions, selected_index, )
+
+        return indexes
+
+    def __add_position(self, field: FormDataEntry, position: int):
+        """
+        Add the position of an entry to the indexes.
+        """
+
+        field_name_index, field_name_value_index, submitable_positions, selected_index = self.__indexes
+
+        name = field.name
+
+        if field.is_submitable:
+            _add_position(submitable_positions, position)
+
+            selected_positions = selected_index.get(name, None) if field.is_option else None
+            if selected_positions is not None:
+                _add_position(selected_positions, position)
+
+        for index, key in ((field_name_index, name, ), (field_name_value_index, (name, field.value, ), ), ):
+
+            positions = index.get(key, None)
+            if positions is None:
+                index[key] = [position]
+            else:
+                _add_position(positions, position)
+
+    def __remove_position(self, name: str, value: str, position: int):
+        """
+        Remove the position of an entry from the indexes.
+        """
+
+        field_name_index, field_name_value_index, submitable_positions, selected_index = self.__indexes
+
+        _discard_position(submitable_positions, position)
+
+        selected_positions = selected_index.get(name, None)
+        if selected_positions is not None:
+            _discard_position(selected_positions, position)
+
+        for index, key in ((field_name_index, name, ), (field_name_value_index, (name, value, ), ), ):
+
+            positions = index[key]
+            del positions[bisect.bisect_left(positions, position)]
+
+            if not positions:
+                del index[key]
+
+    def __shift_positions(self, start: int, offset: int):
+        """
+        Add an offset to the positions at or following a position.
+        """
+
+        field_name_index, field_name_value_index, submitable_positions, selected_index = self.__indexes
+
+        first = bisect.bisect_left(submitable_positions, start)
+        submitable_positions[first:] = [position + offset for position in submitable_positions[first:]]
+
+        for index in (field_name_index, field_name_value_index, selected_index, ):
+            for positions in index.values():
+
+                if not positions or positions[-1] < start:
+                    continue
+
+                # Most names belong to a single entry.
+                if len(positions) == 1:
+                    positions[0] += offset
+                    continue
+
+                first = bisect.bisect_left(positions, start)
+                positions[first:] = [position + offset for position in positions[first:]]
+
+    def __release_field(self, field: FormDataEntry):
+        """
+        Unregister the collection from an entry removed from it, unless the
+        entry is still contained at another position.
+        """
+
+        fields = self.__fields
+        for position in self.__indexes[1].get((field.name, field.value, ), ()):
+            if fields[position] is field:
+                return
+
+        field._remove_collection(self.__reference)
 
     def __getitem__(self, index: int) -> FormDataEntry:
         """
         Fetches a FormDataField from the collection using the given index.
         """
 
-        self.__is_dirty = True
+        if self.__template is not None:
+            if isinstance(index, slice):
+                return [self.__get_copy(position) for position in range(*index.indices(len(self)))]
+
+            return self.__get_copy(index)
 
         return self.__fields[index]
 
@@ -133,10 +908,30 @@ class FormDataEntryCollection(MutableSequence):
             FormDataField found at the given index.
         """
 
-        self.__is_dirty = True
+        if self.__template is not None or self.__is_template:
+            self.__prepare_change()
 
+        if self.__indexes is None:
+            self.__fields[index] = value
+            return
+
+        if isinstance(index, slice):
+            self.__fields[index] = value
+            self.__build_indexes()
+            return
+
+        if index < 0:
+            index += len(self.__fields)
+
+        previous = self.__fields[index]
         self.__fields[index] = value
 
+        self.__remove_position(previous.name, previous.value, index)
+        self.__add_position(value, index)
+
+        value._add_collection(self.__reference)
+        self.__release_field(previous)
+
     def __delitem__(self, index: int):
         """
         Removes a FormDataField from the collection.
@@ -144,13 +939,119 @@ class FormDataEntryCollection(MutableSequence):
         :param index: The location to update with the given value.
         """
 
-        self.__is_dirty = True
+        if self.__template is not None or self.__is_template:
+            self.__prepare_change()
+
+        if self.__indexes is None:
+            del self.__fields[index]
+            return
+
+        if isinstance(index, slice):
+            del self.__fields[index]
+            self.__build_indexes()
+            return
 
+        if index < 0:
+            index += len(self.__fields)
+
+        field = self.__fields[index]
         del self.__fields[index]
 
+        self.__remove_position(field.name, field.value, index)
+        if index < len(self.__fields):
+            self.__shift_positions(index + 1, -1)
+
+        self.__release_field(field)
+
+    def __iter__(self) -> Iterator[FormDataEntry]:
+        """
+        Iterate over the entries of the collection.
+        """
+
+        if self.__template is not None:
+            return iter([self.__get_copy(position) for position in range(len(self))])
+
+        return iter(self.__fields)
+
     def __len__(self) -> int:
         """
         Return the number of entries in the collection.
         """
 
+        if self.__template is not None:
+            return len(self.__template.__fields)
+
         return len(self.__fields)
+
+
+class FormDataEntryNameView(Mapping):
+    """
+    A live mapping of field names to the lists of fields providing them,
+    served from the indexes of a FormDataEntryCollection. Changes to the
+    collection are visible immediately.
+
+    :param collection: The collection viewed.
+    """
+
+    __slots__ = ("_collection", )
+
+    def __init__(self, collection: FormDataEntryCollection):
+
+        self._collection = collection
+
+    def __getitem__(self, name: str) -> List[FormDataEntry]:
+
+        fields = self._collection.get_all(name)
+        if not fields:
+            raise KeyError(name)
+
+        return fields
+
+    def __contains__(self, name: object) -> bool:
+
+        return name in self._collection._get_names()
+
+    def __iter__(self) -> Iterator[str]:
+
+        return iter(self._collection._get_names())
+
+    def __len__(self) -> int:
+
+        return len(self._collection._get_names())
+
+
+class FormDataEntrySubmitableView(Sequence):
+    """
+    A live sequence of the fields of a FormDataEntryCollection to be
+    included with a HTTP post, served from the indexes of the collection.
+    Changes to the collection are visible immediately.
+
+    :param collection: The collection viewed.
+    """
+
+    __slots__ = ("_collection", )
+
+    def __init__(self, collection: FormDataEntryCollection):
+
+        self._collection = collection
+
+    def __getitem__(self, index):
+
+        positions = self._collection._get_submitable_positions()[index]
+
+        if isinstance(index, slice):
+            return [self._collection[position] for position in positions]
+
+        return self._collection[positions]
+
+    def __iter__(self) -> Iterator[FormDataEntry]:
+
+        collection = self._collection
+
+        # The entries are collected first, so the collection may be changed
+        # while iterating.
+        return iter([collection[position] for position in collection._get_submitable_positions()])
+
+    def __len__(self) -> int:
+
+        return len(self._collection._get_submitable_positions())
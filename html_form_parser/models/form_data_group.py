@@ -0,0 +1,156 @@
+from collections.abc import Mapping
+from typing import Iterator, List
+
+from html_form_parser.models.form_data_entry import FormDataEntry
+from html_form_parser.models.form_data_entry_collection import FormDataEntryCollection
+
+# The kinds of groups. Selecting an option of a radio group, or a select
+# element without the "multiple" attribute, deselects the others.
+GROUP_KIND_RADIO = "radio"
+GROUP_KIND_CHECKBOX = "checkbox"
+GROUP_KIND_SELECT = "select"
+GROUP_KIND_SELECT_MULTIPLE = "select-multiple"
+
+_multiple_kinds = frozenset((GROUP_KIND_CHECKBOX, GROUP_KIND_SELECT_MULTIPLE, ))
+
+
+class FormDataGroup:
+    """
+    The fields of a control offering a choice of values: the options of a
+    select element, or radio buttons or checkboxes sharing a name. Fields
+    are located through the indexes of the form's FormDataEntryCollection,
+    so selecting a value costs the same however many options there are.
+
+    The members of a group are the fields of its name created from such a
+    control, see FormDataEntry.is_option. Other fields of the name, such as
+    a hidden input submitted when a checkbox is not checked, are not
+    changed through the group.
+
+    A group is a view of the fields. Changes made through the group, or to
+    the fields directly, are visible to each.
+
+    :param fields: The fields of the form.
+
+    :param name: The name of the control.
+
+    :param kind: The kind of control, one of the GROUP_KIND constants.
+    """
+
+    __slots__ = ("fields", "name", "kind", )
+
+    def __init__(self, fields: FormDataEntryCollection, name: str, kind: str):
+
+        self.fields = fields
+        self.name = name
+        self.kind = kind
+
+    def __repr__(self) -> str:
+
+        return "%s(%r, %r)" % (type(self).__name__, self.name, self.kind, )
+
+    @property
+    def multiple(self) -> bool:
+        """
+        Indicates several values may be selected at once.
+        """
+
+        return self.kind in _multiple_kinds
+
+    @property
+    def options(self) -> List[FormDataEntry]:
+        """
+        The fields of the group, in order.
+        """
+
+        return [field for field in self.fields.get_all(self.name) if field.is_option]
+
+    def select(self, value: str):
+        """
+        Select the field providing a value, by making it submitable. Unless
+        the group allows several values, the other fields are deselected.
+
+        :param value: The "value" of the field to select. A KeyError is
+            raised when no field of the group provides it.
+        """
+
+        fields = self.fields
+        position = self.__get_position(value)
+
+        if not self.multiple:
+            for selected_position in list(fields._get_selected_positions(self.name)):
+                if selected_position != position:
+                    fields[selected_position].is_submitable = False
+
+        fields[position].is_submitable = True
+
+    def deselect(self, value: str):
+        """
+        Deselect the field providing a value.
+
+        :param value: The "value" of the field to deselect. A KeyError is
+            raised when no field of the group provides it.
+        """
+
+        self.fields[self.__get_position(value)].is_submitable = False
+
+    def selected(self) -> List[FormDataEntry]:
+        """
+        Returns the selected fields, in order.
+        """
+
+        fields = self.fields
+
+        return [fields[position] for position in fields._get_selected_positions(self.name)]
+
+    def clear(self):
+        """
+        Deselect every field of the group.
+        """
+
+        fields = self.fields
+        for position in list(fields._get_selected_positions(self.name)):
+            fields[position].is_submitable = False
+
+    def __get_position(self, value: str) -> int:
+        """
+        Returns the position of the first field of the group providing a
+        value.
+        """
+
+        positions = self.fields._get_option_positions(self.name, value)
+        if not positions:
+            raise KeyError((self.name, value, ))
+
+        return positions[0]
+
+
+class FormDataGroupView(Mapping):
+    """
+    A live mapping of control names to the FormDataGroup objects of a form.
+
+    :param form_data: The FormData object viewed.
+    """
+
+    __slots__ = ("_form_data", )
+
+    def __init__(self, form_data: 'FormData'):
+
+        self._form_data = form_data
+
+    def __getitem__(self, name: str) -> FormDataGroup:
+
+        form_data = self._form_data
+
+        return FormDataGroup(form_data.fields, name, form_data._group_kinds[name])
+
+    def __contains__(self, name: object) -> bool:
+
+        return name in self._form_data._group_kinds
+
+    def __iter__(self) -> Iterator[str]:
+
+        return iter(self._form_data._group_kinds)
+
+    def __len__(self) -> int:
+
+        return len(self._form_data._group_kinds)
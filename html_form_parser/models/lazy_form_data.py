@@ -0,0 +1,101 @@
+import threading
+from typing import Callable, List
+
+from html_form_parser.models.form_data import FormData
+from html_form_parser.models.form_data_entry import FormDataEntry
+from html_form_parser.models.form_data_entry_collection import FormDataEntryCollection
+
+
+class LazyFormData(FormData):
+    """
+    A FormData object which creates its fields when they are first accessed.
+    The form's attributes are available immediately.
+
+    The object retains copies of the parsed field elements, holding their
+    attributes and text, until the fields are created. The document tree is
+    not retained, so forms which are never inspected cost little more than
+    their attributes.
+
+    :param create_fields: A callable creating a collection of FormDataEntry
+        objects from a parsed field element.
+
+    See FormData for the remaining parameters.
+    """
+
+    __slots__ = ("_create_fields", "_field_sources", "_load_lock", "_fields", )
+
+    def __init__(self, name: str = None, action: str = None, method: str = "GET", enctype: str = "multipart/form-data", create_fields: Callable[[object], List[FormDataEntry]] = None):
+
+        self._create_fields = create_fields
+        self._field_sources = []
+
+        # Held while the fields are created, as the object may be shared by
+        # several threads.
+        self._load_lock = threading.Lock()
+
+        super().__init__(name, action, method, enctype)
+
+    @property
+    def fields(self) -> FormDataEntryCollection:
+        """
+        A collection of the form's input fields, created on first access.
+        """
+
+        if self._field_sources:
+            with self._load_lock:
+
+                # The sources are only released once the fields are created,
+                # so another thread never sees a partial collection.
+                if self._field_sources:
+
+                    entries = []
+                    for field_source in self._field_sources:
+                        entries.extend(self._create_fields(field_source))
+
+                    self._fields.extend(entries)
+                    self._field_sources = []
+
+        return self._fields
+
+    @fields.setter
+    def fields(self, value: FormDataEntryCollection):
+
+        self._field_sources = []
+        self._fields = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Indicates the fields have been created.
+        """
+
+        return not self._field_sources
+
+    def add_field_source(self, field_source: object):
+        """
+        Retain a parsed field element, creating its entries when the fields
+        are first accessed.
+
+        :param field_source: A parsed field element.
+        """
+
+        self._field_sources.append(field_source)
+
+    def __getstate__(self) -> dict:
+        """
+        Create the fields before the object is copied or pickled, as parsed
+        elements are not retained.
+        """
+
+        self.fields
+
+        state = super().__getstate__()
+        state["_create_fields"] = None
+        del state["_load_lock"]
+
+        return state
+
+    def __setstate__(self, state: dict):
+
+        super().__setstate__(state)
+        self._load_lock = threading.Lock()
@@ -0,0 +1,248 @@
+import codecs
+import re
+from typing import Union
+
+# Byte order marks, checked before any other source of the encoding.
+_byte_order_marks = (
+    (codecs.BOM_UTF8, "utf-8", ),
+    (codecs.BOM_UTF16_BE, "utf-16-be", ),
+    (codecs.BOM_UTF16_LE, "utf-16-le", ),
+)
+
+# The labels of each encoding of the WHATWG Encoding standard, by the name
+# of the Python codec used to decode it. Labels not listed, including those
+# of Python codecs such as "rot13", "zlib", or "utf-32", are not encodings a
+# web browser would use, and are ignored. The "replacement" encoding, which
+# decodes a document to a single replacement character, is not supported,
+# and its labels are ignored.
+# https://encoding.spec.whatwg.org/#names-and-labels
+_encoding_labels = {
+    "utf-8": ("unicode-1-1-utf-8", "unicode11utf8", "unicode20utf8", "utf-8", "utf8", "x-unicode20utf8", ),
+    "cp866": ("866", "cp866", "csibm866", "ibm866", ),
+    "iso-8859-2": ("csisolatin2", "iso-8859-2", "iso-ir-101", "iso8859-2", "iso88592", "iso_8859-2", "iso_8859-2:1987", "l2", "latin2", ),
+    "iso-8859-3": ("csisolatin3", "iso-8859-3", "iso-ir-109", "iso8859-3", "iso88593", "iso_8859-3", "iso_8859-3:1988", "l3", "latin3", ),
+    "iso-8859-4": ("csisolatin4", "iso-8859-4", "iso-ir-110", "iso8859-4", "iso88594", "iso_8859-4", "iso_8859-4:1988", "l4", "latin4", ),
+    "iso-8859-5": ("csisolatincyrillic", "cyrillic", "iso-8859-5", "iso-ir-144", "iso8859-5", "iso88595", "iso_8859-5", "iso_8859-5:1988", ),
+    "iso-8859-6": ("arabic", "asmo-708", "csiso88596e", "csiso88596i", "csisolatinarabic", "ecma-114", "iso-8859-6", "iso-8859-6-e", "iso-8859-6-i", "iso-ir-127", "iso8859-6", "iso88596", "iso_8859-6", "iso_8859-6:1987", ),
+    "iso-8859-7": ("csisolatingreek", "ecma-118", "elot_928", "greek", "greek8", "iso-8859-7", "iso-ir-126", "iso8859-7", "iso88597", "iso_8859-7", "iso_8859-7:1987", "sun_eu_greek", ),
+    "iso-8859-8": ("csiso88598e", "csisolatinhebrew", "hebrew", "iso-8859-8", "iso-8859-8-e", "iso-ir-138", "iso8859-8", "iso88598", "iso_8859-8", "iso_8859-8:1988", "visual", "csiso88598i", "iso-8859-8-i", "logical", ),
+    "iso-8859-10": ("csisolatin6", "iso-8859-10", "iso-ir-157", "iso8859-10", "iso885910", "l6", "latin6", ),
+    "iso-8859-13": ("iso-8859-13", "iso8859-13", "iso885913", ),
+    "iso-8859-14": ("iso-8859-14", "iso8859-14", "iso885914", ),
+    "iso-8859-15": ("csisolatin9", "iso-8859-15", "iso8859-15", "iso885915", "iso_8859-15", "l9", ),
+    "iso-8859-16": ("iso-8859-16", ),
+    "koi8-r": ("cskoi8r", "koi", "koi8", "koi8-r", "koi8_r", ),
+    "koi8-u": ("koi8-ru", "koi8-u", ),
+    "macintosh": ("csmacintosh", "mac", "macintosh", "x-mac-roman", ),
+    "cp874": ("dos-874", "iso-8859-11", "iso8859-11", "iso885911", "tis-620", "windows-874", ),
+    "windows-1250": ("cp1250", "windows-1250", "x-cp1250", ),
+    "windows-1251": ("cp1251", "windows-1251", "x-cp1251", ),
+    "windows-1252": ("ansi_x3.4-1968", "ascii", "cp1252", "cp819", "csisolatin1", "ibm819", "iso-8859-1", "iso-ir-100", "iso8859-1", "iso88591", "iso_8859-1", "iso_8859-1:1987", "l1", "latin1", "us-ascii", "windows-1252", "x-cp1252", "x-user-defined", ),
+    "windows-1253": ("cp1253", "windows-1253", "x-cp1253", ),
+    "windows-1254": ("cp1254", "csisolatin5", "iso-8859-9", "iso-ir-148", "iso8859-9", "iso88599", "iso_8859-9", "iso_8859-9:1989", "l5", "latin5", "windows-1254", "x-cp1254", ),
+    "windows-1255": ("cp1255", "windows-1255", "x-cp1255", ),
+    "windows-1256": ("cp1256", "windows-1256", "x-cp1256", ),
+    "windows-1257": ("cp1257", "windows-1257", "x-cp1257", ),
+    "windows-1258": ("cp1258", "windows-1258", "x-cp1258", ),
+    "mac-cyrillic": ("x-mac-cyrillic", "x-mac-ukrainian", ),
+    "gbk": ("chinese", "csgb2312", "csiso58gb231280", "gb2312", "gb_2312", "gb_2312-80", "gbk", "iso-ir-58", "x-gbk", ),
+    "gb18030": ("gb18030", ),
+    "big5hkscs": ("big5", "big5-hkscs", "cn-big5", "csbig5", "x-x-big5", ),
+    "euc-jp": ("cseucpkdfmtjapanese", "euc-jp", "x-euc-jp", ),
+    "iso-2022-jp": ("csiso2022jp", "iso-2022-jp", ),
+    "shift_jis": ("csshiftjis", "ms932", "ms_kanji", "shift-jis", "shift_jis", "sjis", "windows-31j", "x-sjis", ),
+    "euc-kr": ("cseuckr", "csksc56011987", "euc-kr", "iso-ir-149", "korean", "ks_c_5601-1987", "ks_c_5601-1989", "ksc5601", "ksc_5601", "windows-949", ),
+    "utf-16-be": ("unicodefffe", "utf-16be", ),
+    "utf-16-le": ("csunicode", "iso-10646-ucs-2", "ucs-2", "unicode", "unicodefeff", "utf-16", "utf-16le", ),
+}
+
+_label_encodings = {label: encoding for encoding, labels in _encoding_labels.items() for label in labels}
+
+# Encodings where markup characters are not represented by their ASCII byte
+# values, and the document can not be scanned before decoding.
+_ascii_incompatible = ("utf-16-be", "utf-16-le", "iso-2022-jp", )
+
+# The number of bytes searched for a <meta> encoding declaration.
+PRESCAN_LENGTH = 1024
+
+# Used when no encoding is declared, and the document isn't valid UTF-8.
+DEFAULT_ENCODING = "windows-1252"
+
+_comment_pattern = re.compile(rb"<!--.*?(?:-->|\Z)", re.DOTALL)
+_meta_pattern = re.compile(rb"<meta[\s/]([^>]*)", re.IGNORECASE)
+_attribute_pattern = re.compile(rb"""([^\s=/>]+)(?:\s*=\s*("[^"]*"|'[^']*'|[^\s>]*))?""")
+_content_charset_pattern = re.compile(rb"""charset\s*=\s*["']?([^\s"';]+)""", re.IGNORECASE)
+
+
+def normalize_encoding(label: str) -> str:
+    """
+    Convert an encoding label to the name of the Python codec decoding the
+    encoding a web browser would use. Returns None when the label is not a
+    label of the WHATWG Encoding standard.
+
+    :param label: An encoding label, such as a "charset" attribute value.
+    """
+
+    if label is None:
+        return None
+
+    return _label_encodings.get(label.strip(" \t\n\f\r").lower(), None)
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """
+    Determine if markup characters are represented by their ASCII byte
+    values in the given encoding.
+    """
+
+    return encoding not in _ascii_incompatible
+
+
+def prescan_encoding(data: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Search the start of a document for a <meta> element declaring the
+    encoding. A simplified form of the WHATWG prescan algorithm.
+    https://html.spec.whatwg.org/multipage/parsing.html#prescan-a-byte-stream-to-determine-its-encoding
+
+    :param data: The document bytes. Only the first PRESCAN_LENGTH bytes are
+        searched.
+
+    :returns: The declared encoding name, or None.
+    """
+
+    head = _comment_pattern.sub(b"", bytes(data[:PRESCAN_LENGTH]))
+
+    for meta_match in _meta_pattern.finditer(head):
+
+        attributes = {}
+        for key, val in _attribute_pattern.findall(meta_match.group(1)):
+            key = key.lower()
+            if key not in attributes:
+                attributes[key] = val.strip(b"\"'")
+
+        label = None
+        if b"charset" in attributes:
+            label = attributes[b"charset"]
+
+        elif attributes.get(b"http-equiv", b"").lower() == b"content-type" and b"content" in attributes:
+            charset_match = _content_charset_pattern.search(attributes[b"content"])
+            if charset_match is not None:
+                label = charset_match.group(1)
+
+        if label is None:
+            continue
+
+        label = label.decode("ascii", "replace")
+
+        encoding = normalize_encoding(label)
+        if encoding is None:
+            if not label.strip().lower().startswith("utf-32"):
+                continue
+
+            encoding = "utf-8"
+
+        if encoding.startswith("utf-16"):
+            # A document declaring UTF-16, or UTF-32, in ASCII bytes is
+            # neither.
+            encoding = "utf-8"
+
+        return encoding
+
+    return None
+
+
+def sniff_encoding(data: Union[bytes, bytearray, memoryview], transport_encoding: str = None) -> str:
+    """
+    Determine the encoding of an HTML document. A byte order mark takes
+    precedence, then the transport layer encoding (such as the HTTP
+    Content-Type charset), then a <meta> declaration. Undeclared documents
+    are checked for valid UTF-8, then assumed to be windows-1252.
+    https://html.spec.whatwg.org/multipage/parsing.html#determining-the-character-encoding
+
+    Only the start of the document is examined.
+
+    :param data: The document bytes.
+
+    :param transport_encoding: The encoding label provided by the transport
+        layer, if any.
+    """
+
+    head = bytes(data[:3])
+    for byte_order_mark, encoding in _byte_order_marks:
+        if head.startswith(byte_order_mark):
+            return encoding
+
+    encoding = normalize_encoding(transport_encoding)
+    if encoding is not None:
+        return encoding
+
+    encoding = prescan_encoding(data)
+    if encoding is not None:
+        return encoding
+
+    try:
+        # A multibyte character may be cut at the end of the sample.
+        codecs.getincrementaldecoder("utf-8")().decode(bytes(data[:PRESCAN_LENGTH]))
+        return "utf-8"
+    except UnicodeDecodeError:
+        return DEFAULT_ENCODING
+
+
+def strip_byte_order_mark(data: Union[bytes, bytearray, memoryview], encoding: str) -> memoryview:
+    """
+    Returns a view of the document without the byte order mark of the given
+    encoding.
+    """
+
+    data = memoryview(data).cast("B")
+
+    for byte_order_mark, bom_encoding in _byte_order_marks:
+        if bom_encoding == encoding and data[:len(byte_order_mark)] == byte_order_mark:
+            return data[len(byte_order_mark):]
+
+    return data
+
+
+class IncrementalMarkupDecoder:
+    """
+    Decodes a document provided in chunks of bytes. The encoding is sniffed
+    once enough of the document has been received to search for a <meta>
+    declaration.
+
+    :param transport_encoding: The encoding label provided by the transport
+        layer, if any.
+    """
+
+    def __init__(self, transport_encoding: str = None):
+
+        self.transport_encoding = transport_encoding
+        self.encoding = None
+
+        self.__decoder = None
+        self.__buffer = bytearray()
+
+    def decode(self, data: Union[bytes, bytearray, memoryview], final: bool = False) -> str:
+        """
+        Decode the next chunk of the document. Returns an empty string while
+        the start of the document is being buffered.
+
+        :param data: The next chunk of document bytes.
+
+        :param final: Indicates this is the last chunk of the document.
+        """
+
+        if self.__decoder is None:
+
+            self.__buffer += data
+            if len(self.__buffer) < PRESCAN_LENGTH and not final:
+                return ""
+
+            data = self.__buffer
+            self.__buffer = bytearray()
+
+            self.encoding = sniff_encoding(data, self.transport_encoding)
+            self.__decoder = codecs.getincrementaldecoder(self.encoding)("replace")
+
+            data = strip_byte_order_mark(data, self.encoding)
+
+        return self.__decoder.decode(data, final)
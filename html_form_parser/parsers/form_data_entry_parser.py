@@ -1,8 +1,8 @@
-from typing import List
-
-from bs4 import BeautifulSoup, Tag
+from typing import List, Optional, Tuple
 
 from ..models.form_data_entry import FormDataEntry
+from ..models.form_data_group import GROUP_KIND_SELECT, GROUP_KIND_SELECT_MULTIPLE
+from .parser_backend import ParserBackend, get_parser_backend
 
 
 class FormDataEntryParser:
@@ -16,8 +16,19 @@ class FormDataEntryParser:
     _default_type = None
     _default_is_selected = True
 
+    # Indicates the parsed fields are members of a group, see get_group().
+    _is_option = False
+
     __suitable_tags = ("button", "input", "select", "textarea", )
 
+    def __init__(self, parser_backend: ParserBackend = None):
+        """
+        :param parser_backend: The ParserBackend, or backend name, used to
+            parse HTML fragments. Default is "html5lib".
+        """
+
+        self._parser_backend = get_parser_backend(parser_backend)
+
     def parse(self, html: str) -> List[FormDataEntry]:
         """
         Parse an HTML form element tag and generates a collection of form
@@ -37,10 +48,26 @@ class FormDataEntryParser:
         form_element = FormDataEntry(
             name=attribute_name,
             value=attribute_value,
-            is_submitable=attribute_selected)
+            is_submitable=attribute_selected,
+            is_option=self._is_option)
 
         return [form_element, ]
 
+    def get_group(self, html: str) -> Optional[Tuple[str, str]]:
+        """
+        Determine if an HTML form element offers a choice of values, as a
+        select element or a radio button does. See FormDataGroup. Parsers
+        returning a group create their fields with "is_option" set.
+
+        :param html: A string containing only the HTML tag, or a Beautiful
+            Soup object of the tag.
+
+        :returns: The name and kind of the group, or None for elements
+            providing a single value.
+        """
+
+        return None
+
     def suitable(self, tag_name: str, type_attribute: str) -> bool:
         """
         Determine if the parser is appropriate for the given HTML element tag
@@ -57,18 +84,16 @@ class FormDataEntryParser:
 
     def _make_bs4_parser(self, html: str) -> 'bs4.Tag':
         """
-        Creates a BeautifulSoup parser object for the given HTML fragment.
-        Assumes if an HTML fragment is provided, the fragment is the desired
-        tag to be parsed.
+        Creates a parsed element object for the given HTML fragment, using
+        the parser backend. Assumes if an HTML fragment is provided, the
+        fragment is the desired tag to be parsed.
         """
 
         bs4_parser = html
-        if not isinstance(html, (Tag, BeautifulSoup, )):
-            # Only create a beautiful soup object if one isn't provided.
-            bs4_parser = BeautifulSoup(html, "html5lib")
-
-            # html5lib builds a full and valid DOM when parsing.
-            bs4_parser = bs4_parser.body.next_element
+        if isinstance(html, str):
+            # Only parse the fragment if a parsed element isn't provided. Any
+            # other object, such as a Tag, is assumed to be a parsed element.
+            bs4_parser = self._parser_backend.parse_fragment(html)
 
         return bs4_parser
 
@@ -165,6 +190,7 @@ class InputFormElementParser(FormDataEntryParser):
 class SelectFormElementParser(FormDataEntryParser):
 
     _default_is_selected = False
+    _is_option = True
 
     def parse(self, html: str) -> List[FormDataEntry]:
         """
@@ -186,10 +212,23 @@ class SelectFormElementParser(FormDataEntryParser):
             elements.append(
                 FormDataEntry(name=name,
                               value=value,
-                              is_submitable=is_selected))
+                              is_submitable=is_selected,
+                              is_option=self._is_option))
 
         return elements
 
+    def get_group(self, html: str) -> Optional[Tuple[str, str]]:
+        """
+        Overrides base class, as the options of a select element are a group.
+        """
+
+        bs4_parser = self._make_bs4_parser(html)
+
+        if bs4_parser.has_attr("multiple"):
+            return self._get_name_attr(bs4_parser), GROUP_KIND_SELECT_MULTIPLE
+
+        return self._get_name_attr(bs4_parser), GROUP_KIND_SELECT
+
     def suitable(self, tag_name: str, type_attribute: str) -> bool:
         """
         Determine if the parser is appropriate for the given HTML element tag
@@ -257,6 +296,7 @@ class SelectableInputFormElementParser(InputFormElementParser):
     _default_type = "checkbox"
     _default_value = "on"
     _default_is_selected = False
+    _is_option = True
 
     __suitable_types = ("checkbox", "radio", )
 
@@ -273,6 +313,16 @@ class SelectableInputFormElementParser(InputFormElementParser):
 
         return tag_name == "input" and type_attribute in self.__suitable_types
 
+    def get_group(self, html: str) -> Optional[Tuple[str, str]]:
+        """
+        Overrides base class, as radio buttons and checkboxes sharing a name
+        are a group. The group kind is the element's type.
+        """
+
+        bs4_parser = self._make_bs4_parser(html)
+
+        return self._get_name_attr(bs4_parser), self._get_type_attr(bs4_parser).strip().lower()
+
     def _get_selected_state(self, bs4_parser: 'bs4.Tag') -> bool:
         """
         Overrides the base class to return the actual "checked" state of the
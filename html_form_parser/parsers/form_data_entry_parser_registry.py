@@ -0,0 +1,233 @@
+import threading
+from typing import Dict, Iterable, Tuple, Type
+
+from . import form_data_entry_parser
+from .form_data_entry_parser import FormDataEntryParser
+from .parser_backend import ParserBackend, get_parser_backend
+
+
+class FormDataEntryParserTable:
+    """
+    A dispatch table of FormDataEntryParser objects, keyed by element tag
+    name and normalized "type" attribute value. Created by a
+    FormDataEntryParserRegistry, and shared by all parses using the same
+    parser backend.
+
+    :param parsers: A dictionary of parsers keyed by (tag name, type)
+        pairs. A type of None is the parser used for any other type.
+    """
+
+    def __init__(self, parsers: Dict[Tuple[str, str], FormDataEntryParser]):
+
+        self.__parsers = parsers
+
+        # The element tag names parser backends must find.
+        self.tag_names = tuple(sorted(set(tag_name for tag_name, type_attribute in parsers)))
+
+        # A description of the parsers which is the same in every process,
+        # identifying the table in persistent cache keys.
+        self.signature = tuple(sorted(
+            (tag_name, type_attribute or "", type(parser).__module__ + "." + type(parser).__qualname__, )
+            for (tag_name, type_attribute), parser in parsers.items()
+        ))
+
+    def get_parser(self, tag_name: str, type_attribute: str = None) -> FormDataEntryParser:
+        """
+        Returns the parser for an element, or None when no parser is
+        registered for the element.
+
+        :param tag_name: The HTML element name.
+
+        :param type_attribute: The HTML element "type" attribute, as it
+            appears in the markup. If no attribute is present, provide None.
+        """
+
+        if type_attribute is not None:
+            parser = self.__parsers.get((tag_name, type_attribute.strip().lower(), ), None)
+            if parser is not None:
+                return parser
+
+        return self.__parsers.get((tag_name, None, ), None)
+
+
+class FormDataEntryParserRegistry:
+    """
+    Maps HTML form elements to the FormDataEntryParser class creating their
+    entries. Parser classes are registered for an element tag name, and
+    optionally a set of "type" attribute values. A parser registered
+    without types is used for any type without a parser of its own.
+
+    Registering a parser for a tag name and type already registered
+    replaces the existing parser. Parsers may be registered for custom
+    elements, such as form-associated custom elements, which parser backends
+    then find alongside the standard form controls.
+
+    A registry may be shared by any number of threads. Tables are created
+    while holding a lock, so a table never mixes parsers from before and
+    after a change to the registry.
+    """
+
+    def __init__(self):
+
+        self.__parser_classes = {}
+        self.__tables = {}
+
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def create_default(cls) -> 'FormDataEntryParserRegistry':
+        """
+        Create a registry of the parsers for the standard HTML form
+        controls.
+        """
+
+        registry = cls()
+
+        registry.register(form_data_entry_parser.InputFormElementParser, "input")
+        registry.register(form_data_entry_parser.SelectableInputFormElementParser, "input", ("checkbox", "radio", ))
+        registry.register(form_data_entry_parser.ColorInputFormElementParser, "input", ("color", ))
+        registry.register(form_data_entry_parser.RangeInputFormElementParser, "input", ("range", ))
+        registry.register(form_data_entry_parser.SubmitInputFormElementParser, "input", ("submit", ))
+        registry.register(form_data_entry_parser.ButtonInputFormElementParser, "input", ("button", "reset", "search", ))
+        registry.register(form_data_entry_parser.ImageInputFormElementParser, "input", ("image", ))
+        registry.register(form_data_entry_parser.ButtonFormElementParser, "button")
+        registry.register(form_data_entry_parser.SelectFormElementParser, "select")
+        registry.register(form_data_entry_parser.TextareaFormElementParser, "textarea")
+
+        return registry
+
+    def register(self, parser_class: Type[FormDataEntryParser], tag_name: str, type_attributes: Iterable[str] = None):
+        """
+        Register a parser class.
+
+        :param parser_class: A FormDataEntryParser class. Instances are
+            created with the parser backend as their only argument.
+
+        :param tag_name: The HTML element name.
+
+        :param type_attributes: A collection of "type" attribute values the
+            parser is used for. By default, the parser is used for any type
+            without a parser of its own.
+        """
+
+        with self.__lock:
+
+            for key in self.__get_keys(tag_name, type_attributes):
+                self.__parser_classes[key] = parser_class
+
+            self.__tables = {}
+
+    def unregister(self, tag_name: str, type_attributes: Iterable[str] = None):
+        """
+        Remove the parser classes registered for an element.
+
+        :param tag_name: The HTML element name.
+
+        :param type_attributes: A collection of "type" attribute values to
+            remove. By default, the parser used for any type is removed.
+        """
+
+        with self.__lock:
+
+            for key in self.__get_keys(tag_name, type_attributes):
+                self.__parser_classes.pop(key, None)
+
+            self.__tables = {}
+
+    def get_parser_class(self, tag_name: str, type_attribute: str = None) -> Type[FormDataEntryParser]:
+        """
+        Returns the parser class used for an element, or None.
+
+        :param tag_name: The HTML element name.
+
+        :param type_attribute: The HTML element "type" attribute. If no
+            attribute is present, provide None.
+        """
+
+        if type_attribute is not None:
+            parser_class = self.__parser_classes.get((tag_name.lower(), type_attribute.strip().lower(), ), None)
+            if parser_class is not None:
+                return parser_class
+
+        return self.__parser_classes.get((tag_name.lower(), None, ), None)
+
+    def copy(self) -> 'FormDataEntryParserRegistry':
+        """
+        Create a registry with the same parser classes, which may be changed
+        without affecting this registry.
+        """
+
+        registry = type(self)()
+
+        with self.__lock:
+            registry.__parser_classes = dict(self.__parser_classes)
+
+        return registry
+
+    def get_table(self, parser_backend: ParserBackend = None) -> FormDataEntryParserTable:
+        """
+        Returns the dispatch table of parser instances for a parser backend.
+        The table is created once, and shared until the registry is
+        changed.
+
+        :param parser_backend: The ParserBackend, or backend name, given to
+            the parsers.
+        """
+
+        parser_backend = get_parser_backend(parser_backend)
+
+        table = self.__tables.get(parser_backend, None)
+        if table is not None:
+            return table
+
+        with self.__lock:
+
+            table = self.__tables.get(parser_backend, None)
+            if table is None:
+
+                # Parser classes registered for several keys share an instance.
+                parsers = {}
+                instances = {}
+                for key, parser_class in self.__parser_classes.items():
+                    if parser_class not in instances:
+                        instances[parser_class] = parser_class(parser_backend)
+
+                    parsers[key] = instances[parser_class]
+
+                table = FormDataEntryParserTable(parsers)
+                self.__tables[parser_backend] = table
+
+        return table
+
+    def __getstate__(self) -> dict:
+        """
+        Exclude the lock and tables when the registry is pickled, such as
+        when it is sent to worker processes.
+        """
+
+        state = self.__dict__.copy()
+        del state["_FormDataEntryParserRegistry__lock"]
+        state["_FormDataEntryParserRegistry__tables"] = {}
+
+        return state
+
+    def __setstate__(self, state: dict):
+
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def __get_keys(self, tag_name: str, type_attributes: Iterable[str] = None) -> Iterable[Tuple[str, str]]:
+
+        tag_name = tag_name.lower()
+
+        if type_attributes is None:
+            return [(tag_name, None, ), ]
+
+        if isinstance(type_attributes, str):
+            type_attributes = (type_attributes, )
+
+        return [(tag_name, type_attribute.strip().lower(), ) for type_attribute in type_attributes]
+
+
+# The registry used by HtmlFormParser objects by default.
+default_registry = FormDataEntryParserRegistry.create_default()
@@ -0,0 +1,342 @@
+import re
+from typing import List, Tuple, Union
+
+# The attributes of a tag. Quoted attribute values are matched whole, so a
+# ">" or "<" within one is not taken for markup.
+_attributes = r"""(?:[^>="']+|=[\t\n\f\r ]*(?:"[^"]*"|'[^']*'|[^\t\n\f\r >]*)|["'])*"""
+
+# A comment, a start or end tag, or other markup such as a doctype. The tag
+# name, and the attributes of a tag, are captured.
+_token = (
+    r"<!--(?:-?>|.*?(?:-->|\Z))"
+    r"|<(/?)([a-zA-Z][^\t\n\f\r />]*)(" + _attributes + r")>?"
+    r"|<[!?/][^>]*>?"
+)
+
+# The markup preceding the next tag a scan outside forms acts on: text, and
+# the tags of other elements.
+_skipped = (
+    r"(?:[^<]+"
+    r"|<(?!!--|/?(?:%s)(?=[\t\n\f\r />]|\Z))"
+    r"(?:/?[a-zA-Z][^\t\n\f\r />]*" + _attributes.replace("%", "%%") + r">?|[!?/][^>]*>?|))*"
+)
+
+# An attribute of a tag, capturing its name.
+_attribute = r"""([^\t\n\f\r />][^\t\n\f\r /=>]*)(?:[\t\n\f\r ]*=[\t\n\f\r ]*(?:"[^"]*"|'[^']*'|[^\t\n\f\r >]*))?"""
+
+# Elements whose content is text, in which tags are not parsed.
+_text_tags = ("iframe", "noembed", "noframes", "script", "style", "textarea", "title", "xmp", )
+
+# Elements without content or an end tag.
+_void_tags = frozenset((
+    "area", "base", "basefont", "bgsound", "br", "col", "embed", "frame", "hr", "image", "img", "input",
+    "keygen", "link", "meta", "param", "source", "track", "wbr",
+))
+
+# Elements whose end tag may be omitted, and which are closed by the end tag
+# of an element containing them.
+_implied_end_tags = frozenset((
+    "caption", "colgroup", "dd", "dt", "li", "optgroup", "option", "p", "rb", "rp", "rt", "rtc",
+    "tbody", "td", "tfoot", "th", "thead", "tr",
+))
+
+# Elements changing how a "form" start tag within them is parsed: ignored
+# within a select, moved out of a table, or not an HTML element at all
+# within svg or math content.
+_context_tags = frozenset(("math", "select", "svg", "table", "template", ))
+
+# The tag names of the form controls which may name their form owner.
+_field_tags = frozenset(("button", "input", "select", "textarea", ))
+
+# The tags a scan outside forms acts on.
+_scanned_tags = frozenset(("form", "plaintext", ) + _text_tags) | _context_tags | _field_tags
+
+_flags = re.IGNORECASE | re.DOTALL
+
+
+class _Patterns:
+    """
+    The scanning patterns, compiled for either str or bytes markup.
+    """
+
+    def __init__(self, compile_pattern, is_bytes: bool):
+
+        self.is_bytes = is_bytes
+
+        self.form_start = compile_pattern(r"<form(?=[\s/>])")
+
+        self.token = compile_pattern(_token)
+
+        self.skipped = compile_pattern(_skipped % ("|".join(sorted(_scanned_tags)), ))
+
+        self.attribute = compile_pattern(_attribute)
+
+        self.text_ends = {
+            tag: compile_pattern(r"</" + tag + r"(?=[\t\n\f\r />]|\Z)")
+            for tag in _text_tags
+        }
+
+
+_str_patterns = _Patterns(lambda pattern: re.compile(pattern, _flags), False)
+_bytes_patterns = _Patterns(lambda pattern: re.compile(pattern.encode("ascii"), _flags), True)
+
+
+class _AmbiguousRegion(Exception):
+    """
+    Raised when parsers could disagree on the extent of a form region.
+    """
+
+
+def _get_patterns(data: Union[str, bytes, memoryview]) -> _Patterns:
+
+    return _str_patterns if isinstance(data, str) else _bytes_patterns
+
+
+def _get_tag_name(patterns: _Patterns, match: 're.Match') -> str:
+    """
+    Returns the lower case tag name of a tag token, or None for other tokens.
+    """
+
+    name = match.group(2)
+    if name is None:
+        return None
+
+    if patterns.is_bytes:
+        name = name.decode("ascii", "replace")
+
+    return name.lower()
+
+
+def _skip_text(data: Union[str, bytes, memoryview], patterns: _Patterns, tag: str, start: int) -> int:
+    """
+    Returns the position of the end tag of an element containing text, or the
+    end of the data when the element is not closed.
+    """
+
+    match = patterns.text_ends[tag].search(data, start)
+
+    return len(data) if match is None else match.start()
+
+
+def _has_form_attribute(patterns: _Patterns, match: 're.Match') -> bool:
+    """
+    Determine if a start tag token has a "form" attribute.
+    """
+
+    attributes = match.group(3)
+    form = b"form" if patterns.is_bytes else "form"
+
+    return any(name.lower() == form for name in patterns.attribute.findall(attributes))
+
+
+def _find_end(data: Union[str, bytes, memoryview], patterns: _Patterns, tag: str, start: int) -> int:
+    """
+    Returns the position following the end tag of an element, or the end of
+    the data when the element is not closed.
+    """
+
+    position = start
+
+    while True:
+
+        match = patterns.token.search(data, position)
+        if match is None:
+            return len(data)
+
+        position = match.end()
+
+        name = _get_tag_name(patterns, match)
+        if name is None:
+            continue
+
+        if match.group(1):
+            if name == tag:
+                return position
+
+        elif name in patterns.text_ends:
+            position = _skip_text(data, patterns, name, position)
+
+        elif name == "plaintext":
+            return len(data)
+
+
+def _find_form_end(data: Union[str, bytes, memoryview], patterns: _Patterns, start: int) -> int:
+    """
+    Returns the position following the end tag of a form, or the end of the
+    data when the form is not closed.
+
+    The elements opened within the form are tracked. An _AmbiguousRegion is
+    raised for markup which parsers build differently: a nested form, svg or
+    math content, an end tag of an element opened before the form, or an
+    element left open when the form is closed, other than one with an
+    optional end tag, as the HTML tree construction rules keep it open within
+    the form.
+    """
+
+    open_tags = []
+    position = start
+
+    while True:
+
+        match = patterns.token.search(data, position)
+        if match is None:
+            return len(data)
+
+        position = match.end()
+
+        name = _get_tag_name(patterns, match)
+        if name is None:
+            continue
+
+        if match.group(1):
+
+            if name == "form":
+                if not _implied_end_tags.issuperset(open_tags):
+                    raise _AmbiguousRegion()
+
+                return position
+
+            if name not in open_tags:
+                if name in ("br", "p", ):
+                    continue
+
+                raise _AmbiguousRegion()
+
+            index = len(open_tags) - 1 - open_tags[::-1].index(name)
+            if not _implied_end_tags.issuperset(open_tags[index + 1:]):
+                raise _AmbiguousRegion()
+
+            del open_tags[index:]
+
+        elif name in ("form", "math", "plaintext", "svg", ):
+            raise _AmbiguousRegion()
+
+        elif name in patterns.text_ends:
+            open_tags.append(name)
+            position = _skip_text(data, patterns, name, position)
+
+        elif name not in _void_tags:
+            open_tags.append(name)
+
+
+def has_form(data: Union[str, bytes, bytearray, memoryview]) -> bool:
+    """
+    A fast check for a "form" start tag anywhere in the document. A
+    document without one has no forms, and needs no further parsing.
+
+    :param data: The document string, or bytes using an ASCII compatible
+        encoding.
+    """
+
+    return _get_patterns(data).form_start.search(data) is not None
+
+
+def find_form_regions(data: Union[str, bytes, bytearray, memoryview]) -> List[Tuple[int, int]]:
+    """
+    Scan an HTML document for the regions a form parser needs: each "form"
+    element, and each field outside a form which names its form owner with a
+    "form" attribute. Comments, quoted attribute values, and the content of
+    elements containing text, such as scripts and textareas, are skipped.
+
+    Undecoded documents must use an ASCII compatible encoding.
+
+    Where parsers could build a form differently once its region is taken
+    out of the document, such as a form within a table, a nested form, or
+    misnested tags, the whole document is returned as a single region.
+
+    :param data: The document string or bytes.
+
+    :returns: A collection of (start, end) offsets, in document order.
+    """
+
+    patterns = _get_patterns(data)
+
+    regions = []
+
+    # The number of elements open outside any region, within which a form
+    # is parsed differently.
+    context_depth = 0
+
+    position = 0
+    while True:
+
+        position = patterns.skipped.match(data, position).end()
+
+        match = patterns.token.match(data, position)
+        if match is None:
+            break
+
+        position = match.end()
+
+        name = _get_tag_name(patterns, match)
+        if name is None:
+            # A comment.
+            continue
+
+        if match.group(1):
+            if name in _context_tags and context_depth:
+                context_depth -= 1
+
+            continue
+
+        if name == "form":
+
+            if context_depth:
+                return [(0, len(data), )]
+
+            try:
+                end = _find_form_end(data, patterns, position)
+            except _AmbiguousRegion:
+                return [(0, len(data), )]
+
+        elif name in _field_tags and _has_form_attribute(patterns, match):
+
+            end = position
+            if name == "textarea":
+                end = _find_end(data, patterns, name, _skip_text(data, patterns, name, position))
+
+            elif name != "input":
+                end = _find_end(data, patterns, name, position)
+
+        else:
+            if name in _context_tags:
+                context_depth += 1
+
+            elif name in patterns.text_ends:
+                position = _skip_text(data, patterns, name, position)
+
+            elif name == "plaintext":
+                break
+
+            continue
+
+        regions.append((match.start(), end, ))
+        position = end
+
+    return regions
+
+
+def extract_form_markup(data: Union[str, bytes, bytearray, memoryview]) -> Union[str, bytes]:
+    """
+    Reduce an HTML document to the regions a form parser needs. See
+    find_form_regions().
+
+    :param data: The document string, or bytes using an ASCII compatible
+        encoding.
+
+    :returns: The joined regions, or None when the document has no forms.
+    """
+
+    if not has_form(data):
+        return None
+
+    regions = find_form_regions(data)
+    if not regions:
+        return None
+
+    if isinstance(data, str):
+        return "".join(data[start:end] for start, end in regions)
+
+    view = memoryview(data).cast("B")
+
+    return b"".join(view[start:end] for start, end in regions)
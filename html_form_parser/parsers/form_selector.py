@@ -0,0 +1,181 @@
+import re
+from typing import Callable, List, Union
+
+from ..models.form_data import FormData
+
+# The keys of a dictionary of criteria, and the FormSelector argument each
+# provides.
+_criteria_arguments = {"id": "form_id", "name": "name", "action": "action"}
+
+
+class FormSelector:
+    """
+    A predicate matching forms by their attributes. All given criteria must
+    match.
+
+    :param form_id: The form's "id" attribute value.
+
+    :param name: The form's "name" attribute value.
+
+    :param action: A string found within the form's "action" attribute.
+    """
+
+    def __init__(self, form_id: str = None, name: str = None, action: str = None):
+
+        self.form_id = form_id
+        self.name = name
+        self.action = action
+
+    @classmethod
+    def from_dict(cls, criteria: dict) -> 'FormSelector':
+        """
+        Create a selector from a dictionary matching the "id", "name", or a
+        substring of the "action" attribute.
+
+        :param criteria: A dictionary of "id", "name" and "action" keys. A
+            ValueError is raised for other keys, and a TypeError for values
+            other than strings or None.
+        """
+
+        unknown = [key for key in criteria if key not in _criteria_arguments]
+        if unknown:
+            raise ValueError("Unknown form criteria %s, expected %s." % (
+                ", ".join(repr(key) for key in unknown), ", ".join(repr(key) for key in _criteria_arguments), ))
+
+        for key, value in criteria.items():
+            if value is not None and not isinstance(value, str):
+                raise TypeError("Expected a string for %r, not %r." % (key, value, ))
+
+        return cls(**{_criteria_arguments[key]: value for key, value in criteria.items()})
+
+    @property
+    def key(self) -> tuple:
+        """
+        A hashable value identifying the criteria, used in cache keys.
+        """
+
+        return (self.form_id, self.name, self.action, )
+
+    def __call__(self, form_data: FormData) -> bool:
+        """
+        Determine if the form matches the selector.
+
+        :param form_data: A FormData object with its attributes populated.
+        """
+
+        if self.form_id is not None and form_data._attrs.get("id", None) != self.form_id:
+            return False
+
+        if self.name is not None and form_data.name != self.name:
+            return False
+
+        if self.action is not None and (form_data.action is None or self.action not in form_data.action):
+            return False
+
+        return True
+
+
+class FormSelection:
+    """
+    Tracks the forms selected while a page is parsed. Forms are selected in
+    document order, until the maximum number of forms is reached.
+
+    :param predicate: A callable given a FormData object with its attributes
+        populated, returning True for forms to select. A dictionary of
+        criteria is also accepted, see FormSelector.from_dict(). All forms
+        are selected by default.
+
+    :param max_forms: The maximum number of forms to select.
+
+    :param markup: The complete markup being parsed, if known, as a string or
+        as bytes in an ASCII compatible encoding. Used to determine if fields
+        later in the page may still be associated to a selected form.
+    """
+
+    def __init__(self, predicate: Union[Callable[[FormData], bool], dict] = None, max_forms: int = None, markup: Union[str, bytes] = None):
+
+        if isinstance(predicate, dict):
+            predicate = FormSelector.from_dict(predicate)
+
+        self.predicate = predicate
+        self.max_forms = max_forms
+        self.markup = markup
+
+        self.__selected = set()
+        self.__is_finished = None
+
+    def select(self, form_data: FormData) -> bool:
+        """
+        Determine if a newly found form is selected, and record it.
+
+        :param form_data: A FormData object with its attributes populated.
+        """
+
+        if self.max_forms is not None and len(self.__selected) >= self.max_forms:
+            return False
+
+        if self.predicate is not None and not self.predicate(form_data):
+            return False
+
+        self.__selected.add(form_data)
+
+        return True
+
+    def is_selected(self, form_data: FormData) -> bool:
+        """
+        Determine if the form has been selected.
+        """
+
+        return form_data in self.__selected
+
+    def filter(self, forms: List[FormData]) -> List[FormData]:
+        """
+        Returns the selected forms from the collection, in the order given.
+        """
+
+        return [form_data for form_data in forms if form_data in self.__selected]
+
+    def is_finished(self) -> bool:
+        """
+        Determine if parsing may stop once the current form is closed. No
+        further forms may be selected, and no field may still name a
+        selected form by its "form" attribute.
+        """
+
+        if self.max_forms is None or len(self.__selected) < self.max_forms:
+            return False
+
+        if self.__is_finished is None:
+            self.__is_finished = not any(
+                self.__is_referenced(form_data) for form_data in self.__selected)
+
+        return self.__is_finished
+
+    def __is_referenced(self, form_data: FormData) -> bool:
+        """
+        Determine if a field may name the form by its "form" attribute. The
+        whole page is searched, so the result is conservative: a "form"
+        attribute value containing a character reference may name any form.
+        """
+
+        form_id = form_data._attrs.get("id", None)
+        if form_id is None:
+            # Forms without an id can not be referenced.
+            return False
+
+        if self.markup is None:
+            # The rest of the page is unknown.
+            return True
+
+        pattern = (
+            r"""[\s/]form\s*=\s*(?:["']?""" + re.escape(form_id) + r"""(?:["'\s/>]|$)"""
+            r"""|"[^"]*&|'[^']*&|[^\s"'>]*&)""")
+
+        if not isinstance(self.markup, str):
+            try:
+                pattern = pattern.encode("ascii")
+            except UnicodeEncodeError:
+                # The encoding of the markup is not known here.
+                return True
+
+        return re.search(pattern, self.markup, re.IGNORECASE) is not None
@@ -0,0 +1,335 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from ..models.form_data import FormData
+from .parser_pool import EncodedForm, decode_forms, encode_forms
+
+# The values which may change between pages sharing a form skeleton: the
+# "value" and "action" attributes of any element, and textarea contents.
+_slot_pattern = re.compile(
+    r"(<textarea\b[^>]*>)(.*?)(?=</textarea\s*>)"
+    r"|(\s(?:value|action)\s*=\s*)(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'=<>`]+))",
+    re.IGNORECASE | re.DOTALL)
+
+# Characters a parser may replace or normalize within a value: character
+# references, carriage returns, and NUL. A leading newline is dropped from
+# textarea contents, and surrounding whitespace is stripped from the form
+# "action". Values holding them are never taken from a template.
+_unsafe_value_pattern = re.compile(r"[&\r\x00]|\A\s|\s\Z")
+
+# Private use characters marking the position of each value in the markup
+# parsed when a template is created.
+_MARKER_START = "\ue000"
+_MARKER_END = "\ue001"
+
+
+class FormTemplateStats(NamedTuple):
+    """
+    A snapshot of the statistics of a FormTemplateCache.
+    """
+
+    # Pages created from a template, and pages parsed.
+    hits: int
+    misses: int
+
+    templates: int
+
+
+def split_markup(markup: str) -> Tuple[List[str], List[str]]:
+    """
+    Split form markup into its skeleton and the values which may change
+    between pages.
+
+    :param markup: A string containing HTML form markup.
+
+    :returns: The skeleton, as the parts of the markup around the values,
+        and the values. There is one more part than there are values.
+    """
+
+    parts = []
+    values = []
+
+    position = 0
+    for match in _slot_pattern.finditer(markup):
+
+        start, end = match.span(match.lastindex)
+
+        parts.append(markup[position:start])
+        values.append(markup[start:end])
+        position = end
+
+    parts.append(markup[position:])
+
+    return parts, values
+
+
+class _Slot:
+    """
+    The position of a page value within the forms of a template.
+    """
+
+    __slots__ = ("index", )
+
+    def __init__(self, index: int):
+
+        self.index = index
+
+
+class FormTemplate:
+    """
+    The forms created from a form skeleton, with the page values they
+    contain replaced by slots. Values not copied verbatim into the forms,
+    such as "type" related values normalized by a field parser, must be
+    identical for a page to use the template.
+
+    :param slot_count: The number of values in the skeleton.
+
+    :param fixed_values: The values which must match, keyed by position.
+
+    :param forms: The encoded forms, holding _Slot objects in place of page
+        values.
+    """
+
+    def __init__(self, slot_count: int, fixed_values: Dict[int, str], forms: List[EncodedForm]):
+
+        self.slot_count = slot_count
+        self.fixed_values = fixed_values
+        self.forms = forms
+
+        self.__slot_indexes = [index for index in range(slot_count) if index not in fixed_values]
+
+    @classmethod
+    def create(cls, values: List[str], marked_forms: List[FormData]) -> Optional['FormTemplate']:
+        """
+        Create a template from the forms of a page with each value replaced
+        by a marker. The template must still be checked against the forms of
+        the page itself.
+
+        :param values: The values of the page, see split_markup().
+
+        :param marked_forms: The forms created from the marked page.
+
+        :returns: The template, or None when the forms do not depend on the
+            values only by copying them.
+        """
+
+        markers = {
+            _MARKER_START + str(index) + _MARKER_END: _Slot(index)
+            for index in range(len(values))
+        }
+        slot_indexes = set()
+
+        def replace(value):
+
+            if isinstance(value, list):
+                return [replace(item) for item in value]
+
+            if not isinstance(value, str) or _MARKER_START not in value:
+                return value
+
+            slot = markers.get(value, None)
+            if slot is None:
+                # The value was changed, or combined with other text.
+                raise ValueError(value)
+
+            slot_indexes.add(slot.index)
+
+            return slot
+
+        try:
+            template_forms = [
+                (
+                    replace(name), replace(action), replace(method), replace(enctype),
+                    {key: replace(value) for key, value in attrs.items()},
+                    [(replace(entry_name), replace(value), replace(filename), is_submitable, is_option, ) for entry_name, value, filename, is_submitable, is_option in entries],
+                    {replace(group_name): kind for group_name, kind in group_kinds.items()},
+                )
+                for name, action, method, enctype, attrs, entries, group_kinds in encode_forms(marked_forms)
+            ]
+        except ValueError:
+            return None
+
+        fixed_values = {index: value for index, value in enumerate(values) if index not in slot_indexes}
+
+        return cls(len(values), fixed_values, template_forms)
+
+    def matches(self, values: List[str]) -> bool:
+        """
+        Determine if the forms of a page with the template's skeleton may be
+        created from the template.
+
+        :param values: The values of the page, see split_markup().
+        """
+
+        if len(values) != self.slot_count:
+            return False
+
+        for index, value in self.fixed_values.items():
+            if values[index] != value:
+                return False
+
+        for index in self.__slot_indexes:
+            if _unsafe_value_pattern.search(values[index]) is not None:
+                return False
+
+        return True
+
+    def render_encoded(self, values: List[str]) -> List[EncodedForm]:
+        """
+        Returns the encoded forms of a page, see matches().
+        """
+
+        def fill(value):
+            if isinstance(value, _Slot):
+                return values[value.index]
+
+            if isinstance(value, list):
+                return [fill(item) for item in value]
+
+            return value
+
+        return [
+            (
+                fill(name), fill(action), fill(method), fill(enctype),
+                {key: fill(value) for key, value in attrs.items()},
+                [(fill(entry_name), fill(value), fill(filename), is_submitable, is_option, ) for entry_name, value, filename, is_submitable, is_option in entries],
+                {fill(group_name): kind for group_name, kind in group_kinds.items()},
+            )
+            for name, action, method, enctype, attrs, entries, group_kinds in self.forms
+        ]
+
+    def render(self, values: List[str]) -> List[FormData]:
+        """
+        Create the forms of a page, see matches().
+        """
+
+        return decode_forms(self.render_encoded(values))
+
+
+class FormTemplateCache:
+    """
+    Learns the form skeletons of the pages parsed, and creates the forms of
+    later pages sharing a skeleton without parsing them. Only the values
+    which change between pages, such as CSRF tokens, are read from those
+    pages. Pages with a different skeleton, or values a parser could
+    normalize, are parsed.
+
+    Assign a cache to the "templates" attribute of an HtmlFormParser object,
+    or class. Creating a template requires a second parse of the page, with
+    its values marked. Pages whose forms are not reproduced by the template
+    are always parsed.
+
+    A cache may be shared by any number of threads.
+
+    :param max_templates: The maximum number of skeletons remembered. The
+        least recently used skeletons are forgotten.
+    """
+
+    def __init__(self, max_templates: int = 256):
+
+        self.max_templates = max_templates
+
+        self.hits = 0
+        self.misses = 0
+
+        # Templates keyed by skeleton hash and parse settings. A template of
+        # None marks a skeleton which can not be templated.
+        self.__templates = OrderedDict()
+
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+
+        return len(self.__templates)
+
+    def parse(self, markup: str, parse: Callable[[str], List[FormData]], *settings: Hashable) -> List[FormData]:
+        """
+        Create the forms of a page from a template, or parse the page.
+
+        :param markup: A string containing HTML form markup.
+
+        :param parse: A callable parsing markup into FormData objects.
+
+        :param settings: The parse settings changing the forms created from
+            the markup, such as the parser backend.
+        """
+
+        if _MARKER_START in markup or _MARKER_END in markup:
+            with self.__lock:
+                self.misses += 1
+
+            return parse(markup)
+
+        parts, values = split_markup(markup)
+
+        skeleton = _MARKER_START.join(parts)
+        key = (hashlib.blake2b(skeleton.encode("utf-8", "surrogatepass"), digest_size=16).digest(), ) + settings
+
+        with self.__lock:
+
+            is_known = key in self.__templates
+            template = self.__templates.get(key, None)
+            if is_known:
+                self.__templates.move_to_end(key)
+
+            is_hit = template is not None and template.matches(values)
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if is_hit:
+            return template.render(values)
+
+        forms = parse(markup)
+
+        if is_known and template is None:
+            return forms
+
+        marked_markup = "".join(
+            part + _MARKER_START + str(index) + _MARKER_END
+            for index, part in enumerate(parts[:-1])
+        ) + parts[-1]
+
+        template = FormTemplate.create(values, parse(marked_markup))
+
+        if template is not None:
+
+            if not template.matches(values):
+                # The page has values a parser could normalize. The template
+                # is created from a later page.
+                return forms
+
+            # The forms of the page must be reproduced from its own values.
+            if template.render_encoded(values) != encode_forms(forms):
+                template = None
+
+        with self.__lock:
+
+            self.__templates[key] = template
+            self.__templates.move_to_end(key)
+
+            while len(self.__templates) > self.max_templates:
+                self.__templates.popitem(last=False)
+
+        return forms
+
+    def clear(self):
+        """
+        Forget all skeletons. Statistics are kept.
+        """
+
+        with self.__lock:
+            self.__templates.clear()
+
+    def stats(self) -> FormTemplateStats:
+        """
+        Returns the hit and miss counts, and the number of skeletons
+        remembered.
+        """
+
+        with self.__lock:
+            return FormTemplateStats(self.hits, self.misses, len(self.__templates))
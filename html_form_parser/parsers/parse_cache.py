@@ -0,0 +1,591 @@
+import contextlib
+import hashlib
+import marshal
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, List, NamedTuple, Optional, Tuple
+
+from ..models.form_data import FormData
+from ..models.form_data_entry import FormDataEntry
+from .form_data_entry_parser_registry import FormDataEntryParserTable
+from .parser_backend import Markup, ParserBackend
+from .parser_pool import decode_forms, encode_forms
+
+# The fixed size accounted for each entry, besides the size of its forms.
+_ENTRY_OVERHEAD = 256
+
+# The version of the format of SqliteParseCache entries. Increase when the
+# encoding of forms, or the forms created from a page, change.
+SQLITE_FORMAT_VERSION = 3
+
+# The number of SqliteParseCache hits whose access times are kept in memory
+# before they are written to the database.
+_ACCESS_BATCH_SIZE = 64
+
+
+class ParseCacheStats(NamedTuple):
+    """
+    A snapshot of the statistics of a ParseCache, or SqliteParseCache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+
+    # The number of entries, and their approximate size in bytes.
+    entries: int
+    size: int
+
+
+def _copy_attrs(attrs: dict) -> dict:
+    """
+    Copy the attributes of a form. Multi-valued attributes, such as "class",
+    are lists and are copied as well.
+    """
+
+    return {key: (list(value) if isinstance(value, list) else value) for key, value in attrs.items()}
+
+
+def _get_size(value) -> int:
+    """
+    Returns the approximate size in bytes of a string, or None.
+    """
+
+    return sys.getsizeof(value) if value is not None else 0
+
+
+class ParseCache:
+    """
+    A least recently used cache of parse results, keyed by a hash of the
+    markup and the parse settings. Assign a cache to the "cache" attribute
+    of an HtmlFormParser object, or class, to have identical pages parsed
+    only once.
+
+    Forms are stored as plain values rather than FormData objects. Each hit
+    creates new FormData objects, so callers may change the forms they are
+    given without changing the cached forms.
+
+    A cache may be shared by any number of threads.
+
+    :param max_entries: The maximum number of cached pages.
+
+    :param max_size: The maximum approximate size in bytes of the cached
+        forms. The size of the markup is not included, as only a hash of the
+        markup is stored.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_size: int = 16 * 1024 * 1024):
+
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.__entries = OrderedDict()
+        self.__size = 0
+
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+
+        return len(self.__entries)
+
+    @staticmethod
+    def create_key(markup: Markup, *settings: Hashable) -> Tuple:
+        """
+        Create the key of a page.
+
+        :param markup: A string, or bytes, containing HTML markup.
+
+        :param settings: The parse settings changing the forms created from
+            the markup, such as the parser backend and encoding.
+        """
+
+        if isinstance(markup, str):
+            # Strings and bytes holding the same data may produce different
+            # forms, once the bytes are decoded.
+            digest = hashlib.blake2b(markup.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            return (str, digest, ) + settings
+
+        return (bytes, hashlib.blake2b(markup, digest_size=16).digest(), ) + settings
+
+    def get(self, key: Tuple) -> Optional[List[FormData]]:
+        """
+        Returns new FormData objects for the forms cached for a key, or None
+        when the key is not cached.
+
+        :param key: A key created by create_key().
+        """
+
+        with self.__lock:
+
+            entry = self.__entries.get(key, None)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.hits += 1
+
+        forms = []
+        for name, action, method, enctype, attrs, entries, group_kinds in entry[0]:
+
+            form_data = FormData(name, action, method, enctype)
+            form_data._attrs = _copy_attrs(attrs)
+            form_data._group_kinds = dict(group_kinds)
+            form_data.fields.extend([
+                FormDataEntry(entry_name, value, filename, is_submitable, is_option)
+                for entry_name, value, filename, is_submitable, is_option in entries
+            ])
+
+            forms.append(form_data)
+
+        return forms
+
+    def put(self, key: Tuple, forms: List[FormData]):
+        """
+        Cache the forms of a page. The least recently used pages are removed
+        while the cache exceeds its bounds.
+
+        :param key: A key created by create_key().
+
+        :param forms: The forms created from the page. The forms are copied,
+            and may be changed afterwards.
+        """
+
+        encoded_forms = []
+        size = _ENTRY_OVERHEAD
+
+        for form_data in forms:
+
+            entries = []
+            for entry in form_data.fields:
+                entries.append((entry.name, entry.value, entry.filename, entry.is_submitable, entry.is_option, ))
+                size += _ENTRY_OVERHEAD // 2 + _get_size(entry.name) + _get_size(entry.value) + _get_size(entry.filename)
+
+            encoded_forms.append((
+                form_data.name, form_data.action, form_data.method, form_data.enctype,
+                _copy_attrs(form_data._attrs), entries, dict(form_data._group_kinds), ))
+
+            size += _ENTRY_OVERHEAD + sys.getsizeof(form_data._attrs) + sys.getsizeof(form_data._group_kinds)
+            size += _get_size(form_data.name) + _get_size(form_data.action) + _get_size(form_data.method) + _get_size(form_data.enctype)
+
+        if size > self.max_size:
+            return
+
+        with self.__lock:
+
+            previous = self.__entries.pop(key, None)
+            if previous is not None:
+                self.__size -= previous[1]
+
+            self.__entries[key] = (encoded_forms, size, )
+            self.__size += size
+
+            while len(self.__entries) > self.max_entries or self.__size > self.max_size:
+                evicted_key, (evicted_forms, evicted_size) = self.__entries.popitem(last=False)
+                self.__size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove all cached pages. Statistics are kept.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def stats(self) -> ParseCacheStats:
+        """
+        Returns the hit, miss and eviction counts, and the current number of
+        entries and approximate size.
+        """
+
+        with self.__lock:
+            return ParseCacheStats(self.hits, self.misses, self.evictions, len(self.__entries), self.__size)
+
+
+def _get_format_version() -> str:
+    """
+    Returns the version stored with persistent cache entries. Entries are
+    discarded when the format, or the marshal format, changes.
+    """
+
+    return "%d:%d" % (SQLITE_FORMAT_VERSION, marshal.version, )
+
+
+@contextlib.contextmanager
+def _transaction(connection: sqlite3.Connection):
+    """
+    Run statements in a write transaction, rolled back on any error.
+    """
+
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+        connection.execute("COMMIT")
+
+    except BaseException:
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+
+
+def _get_plain_value(value):
+    """
+    Convert a value of an encoded form to a built-in type. Parsing
+    libraries may provide strings and lists of their own subclasses.
+    """
+
+    if isinstance(value, str):
+        return str(value)
+
+    if isinstance(value, list):
+        return [_get_plain_value(item) for item in value]
+
+    return value
+
+
+def _get_setting_key(setting: Hashable) -> Hashable:
+    """
+    Returns a value describing a parse setting which is the same in every
+    process.
+    """
+
+    if isinstance(setting, ParserBackend):
+        return setting.name
+
+    if isinstance(setting, FormDataEntryParserTable):
+        return setting.signature
+
+    return setting
+
+
+class SqliteParseCache:
+    """
+    A cache of parse results stored in an SQLite database, shared by the
+    processes using the same file and kept across restarts. Assign a cache
+    to the "cache" attribute of an HtmlFormParser object, or class, and
+    provide a "cache_key" such as the URL and ETag of each page, or let
+    pages be keyed by a hash of their markup.
+
+    Entries written in another format are discarded when the database is
+    opened. The least recently used entries are removed while the stored
+    forms exceed the maximum size. Reading an entry does not write to the
+    database: access times are kept in memory, and written with the next
+    stored page, or once enough pages have been read.
+
+    A database error, such as a locked or damaged file, does not fail the
+    parse: get() reports the page as not stored, put() stores nothing, and
+    the error is counted in the "errors" attribute.
+
+    The database uses write-ahead logging, so processes read while another
+    writes. Each process, and each process forked after the cache is
+    created, opens its own connection. Within a process, the connection is
+    shared by all threads.
+
+    Statistics count the hits, misses and evictions of the current process.
+
+    :param path: The path of the database file. The file is created if it
+        does not exist.
+
+    :param max_size: The maximum total size in bytes of the stored forms.
+
+    :param timeout: The number of seconds to wait while another process
+        writes to the database.
+    """
+
+    def __init__(self, path: str, max_size: int = 64 * 1024 * 1024, timeout: float = 30.0):
+
+        self.path = path
+        self.max_size = max_size
+        self.timeout = timeout
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+        self.__connection = None
+        self.__pid = None
+
+        # The access times of the entries read since they were last written.
+        self.__accessed = {}
+
+        self.__lock = threading.Lock()
+
+        with self.__lock:
+            self.__connect()
+
+    def __enter__(self) -> 'SqliteParseCache':
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    def __len__(self) -> int:
+
+        with self.__lock:
+            return self.__connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @staticmethod
+    def create_key(markup: Markup, *settings: Hashable) -> str:
+        """
+        Create the key of a page. See ParseCache.create_key().
+
+        Parser backends are identified by name, and field parser tables by
+        their parser classes, so keys are the same in every process.
+        """
+
+        if isinstance(markup, str):
+            markup_digest = hashlib.blake2b(markup.encode("utf-8", "surrogatepass"), digest_size=16, person=b"str")
+        else:
+            markup_digest = hashlib.blake2b(markup, digest_size=16, person=b"bytes")
+
+        settings_text = repr(tuple(_get_setting_key(setting) for setting in settings))
+        settings_digest = hashlib.blake2b(settings_text.encode("utf-8", "surrogatepass"), digest_size=16)
+
+        return markup_digest.hexdigest() + settings_digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[FormData]]:
+        """
+        Returns new FormData objects for the forms stored for a key, or None
+        when the key is not stored.
+
+        :param key: A key created by create_key().
+        """
+
+        with self.__lock:
+
+            try:
+                connection = self.__connect()
+                row = connection.execute("SELECT value FROM entries WHERE key = ?", (key, )).fetchone()
+
+            except sqlite3.Error:
+                self.errors += 1
+                return None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+            self.__accessed[key] = time.time()
+            if len(self.__accessed) >= _ACCESS_BATCH_SIZE:
+                try:
+                    with _transaction(connection):
+                        self.__write_accessed(connection)
+
+                except sqlite3.Error:
+                    self.errors += 1
+
+        return decode_forms(marshal.loads(row[0]))
+
+    def put(self, key: str, forms: List[FormData]):
+        """
+        Store the forms of a page, removing the least recently used pages
+        while the cache exceeds its maximum size.
+
+        :param key: A key created by create_key().
+
+        :param forms: The forms created from the page.
+        """
+
+        value = marshal.dumps([
+            (
+                _get_plain_value(name), _get_plain_value(action), _get_plain_value(method), _get_plain_value(enctype),
+                {_get_plain_value(attribute_name): _get_plain_value(attribute_value) for attribute_name, attribute_value in attrs.items()},
+                [
+                    (_get_plain_value(entry_name), _get_plain_value(entry_value), _get_plain_value(filename), bool(is_submitable), bool(is_option), )
+                    for entry_name, entry_value, filename, is_submitable, is_option in entries
+                ],
+                {_get_plain_value(group_name): _get_plain_value(kind) for group_name, kind in group_kinds.items()},
+            )
+            for name, action, method, enctype, attrs, entries, group_kinds in encode_forms(forms)
+        ])
+        if len(value) > self.max_size:
+            return
+
+        with self.__lock:
+
+            try:
+                connection = self.__connect()
+
+                with _transaction(connection):
+
+                    self.__write_accessed(connection)
+
+                    row = connection.execute("SELECT size FROM entries WHERE key = ?", (key, )).fetchone()
+                    size = self.__get_size(connection) + len(value) - (row[0] if row is not None else 0)
+
+                    connection.execute(
+                        "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                        (key, value, len(value), time.time(), ))
+
+                    if size > self.max_size:
+                        size = self.__evict(connection, size)
+
+                    connection.execute("UPDATE meta SET value = ? WHERE name = 'size'", (size, ))
+
+            except sqlite3.Error:
+                self.errors += 1
+
+    def clear(self):
+        """
+        Remove all stored pages. Statistics are kept.
+        """
+
+        with self.__lock:
+
+            connection = self.__connect()
+
+            with _transaction(connection):
+                connection.execute("DELETE FROM entries")
+                connection.execute("UPDATE meta SET value = 0 WHERE name = 'size'")
+
+            self.__accessed.clear()
+
+    def close(self):
+        """
+        Close the database connection of the current process, writing the
+        access times kept in memory. The connection is opened again when the
+        cache is next used.
+        """
+
+        with self.__lock:
+
+            if self.__connection is not None and self.__pid == os.getpid():
+
+                if self.__accessed:
+                    try:
+                        with _transaction(self.__connection):
+                            self.__write_accessed(self.__connection)
+
+                    except sqlite3.Error:
+                        self.errors += 1
+
+                self.__connection.close()
+
+            self.__connection = None
+
+    def stats(self) -> ParseCacheStats:
+        """
+        Returns the hit, miss and eviction counts of the current process, and
+        the number of entries and size of the stored forms.
+        """
+
+        with self.__lock:
+
+            connection = self.__connect()
+
+            entries = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            size = self.__get_size(connection)
+
+            return ParseCacheStats(self.hits, self.misses, self.evictions, entries, size)
+
+    def __getstate__(self) -> dict:
+        """
+        Exclude the connection and lock when the cache is pickled, such as
+        when it is sent to worker processes.
+        """
+
+        state = self.__dict__.copy()
+        del state["_SqliteParseCache__lock"]
+        state["_SqliteParseCache__connection"] = None
+        state["_SqliteParseCache__accessed"] = {}
+
+        return state
+
+    def __setstate__(self, state: dict):
+
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Returns the connection of the current process, opening the database
+        when needed. Must be called while holding the lock.
+        """
+
+        if self.__connection is not None and self.__pid == os.getpid():
+            return self.__connection
+
+        # A connection inherited from a parent process must not be used, or
+        # closed.
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+
+        format_version = _get_format_version()
+
+        try:
+            with _transaction(connection):
+                connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value)")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+                row = connection.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+                if row is None or row[0] != format_version:
+                    connection.execute("DELETE FROM entries")
+                    connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)", (format_version, ))
+                    connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('size', 0)")
+
+        except BaseException:
+            connection.close()
+            raise
+
+        self.__connection = connection
+        self.__pid = os.getpid()
+
+        return connection
+
+    def __get_size(self, connection: sqlite3.Connection) -> int:
+
+        return connection.execute("SELECT value FROM meta WHERE name = 'size'").fetchone()[0]
+
+    def __write_accessed(self, connection: sqlite3.Connection):
+        """
+        Write the access times kept in memory. Must be called within a
+        transaction.
+        """
+
+        connection.executemany(
+            "UPDATE entries SET accessed = ? WHERE key = ?",
+            [(accessed, key, ) for key, accessed in self.__accessed.items()])
+
+        self.__accessed.clear()
+
+    def __evict(self, connection: sqlite3.Connection, size: int) -> int:
+        """
+        Remove the least recently used entries until the stored forms fit
+        within the maximum size. Must be called within a transaction.
+
+        :returns: The size of the remaining entries.
+        """
+
+        evicted_keys = []
+        for key, entry_size in connection.execute("SELECT key, size FROM entries ORDER BY accessed"):
+
+            if size <= self.max_size:
+                break
+
+            evicted_keys.append((key, ))
+            size -= entry_size
+
+        connection.executemany("DELETE FROM entries WHERE key = ?", evicted_keys)
+        self.evictions += len(evicted_keys)
+
+        return size
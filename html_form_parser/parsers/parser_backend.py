@@ -0,0 +1,559 @@
+import codecs
+from typing import Callable, FrozenSet, Iterable, Iterator, List, Tuple, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from ..models.form_data import FormData
+from .encoding_sniffer import is_ascii_compatible, strip_byte_order_mark
+from .stream_form_parser import StreamFormParser
+
+Markup = Union[str, bytes, bytearray, memoryview]
+
+# The events generated by a document traversal.
+FORM_START = "form_start"
+FORM_END = "form_end"
+FIELD = "field"
+
+
+class ParserBackend:
+    """
+    A markup parsing library used to locate HTML forms and their fields.
+
+    Elements returned by a backend provide the subset of the BeautifulSoup
+    Tag interface used by the FormDataEntryParser classes: "name", "attrs",
+    "has_attr()", "get_text()" and "find_all()".
+    """
+
+    # The name used to select the backend.
+    name = None
+
+    _field_tags = ("button", "input", "select", "textarea", )
+
+    def parse_fragment(self, markup: str) -> object:
+        """
+        Parse an HTML fragment and return its first element.
+
+        :param markup: A string containing only the HTML tag.
+        """
+
+        raise NotImplementedError()
+
+    def parse_forms(self, markup: Markup, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], encoding: str = None, is_finished: Callable[[], bool] = None, field_tags: Iterable[str] = None) -> List[FormData]:
+        """
+        Parse an HTML document and create Form Data for each form found.
+
+        :param markup: A string, or bytes, containing HTML markup.
+
+        :param create_form_data: A callable creating a FormData object from a
+            parsed form element.
+
+        :param add_form_data_field: A callable adding a parsed field element
+            to the FormData object the field is associated to.
+
+        :param encoding: The encoding of the markup, when bytes are given.
+
+        :param is_finished: A callable checked after each form is closed.
+            When it returns True, backends able to stop early do not parse
+            the remaining markup.
+
+        :param field_tags: The element tag names of form fields. Default is
+            the standard HTML form controls.
+
+        :returns: A collection of FormData objects.
+        """
+
+        return self._create_forms(
+            self._parse_document(markup, encoding), create_form_data, add_form_data_field, field_tags)
+
+    def create_incremental_parser(self, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], field_tags: Iterable[str] = None) -> 'IncrementalParser':
+        """
+        Create a parser accepting an HTML document in chunks. See
+        parse_forms() for the parameters.
+
+        Tree building backends buffer the document until it is closed.
+        """
+
+        return BufferedIncrementalParser(self, create_form_data, add_form_data_field, field_tags)
+
+    def _create_forms(self, document: object, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], field_tags: Iterable[str] = None) -> List[FormData]:
+        """
+        Create Form Data for each form of a parsed document. See
+        parse_forms() for the parameters.
+        """
+
+        forms = []
+        form_id_map = {}
+
+        # The indexes of the forms containing the current element, and each
+        # field with the index of its nearest containing form.
+        open_forms = []
+        parsed_fields = []
+
+        # A single document order traversal locates forms and fields, and
+        # tracks the form containing each field.
+        for event, element in self._walk_document(document, frozenset(field_tags or self._field_tags)):
+
+            if event == FORM_START:
+                index = len(forms)
+
+                form_id = element.attrs.get("id", None)
+                if form_id is not None and form_id not in form_id_map:
+                    form_id_map[form_id] = index
+
+                forms.append(create_form_data(element))
+                open_forms.append(index)
+
+            elif event == FORM_END:
+                open_forms.pop()
+
+            else:
+                parsed_fields.append((element, open_forms[-1] if open_forms else None, ))
+
+        # Fields associate to the nearest containing form node, or specify their form owner by attribute.
+        # https://html.spec.whatwg.org/multipage/form-control-infrastructure.html#association-of-controls-and-forms
+        for parsed_field, form_index in parsed_fields:
+
+            if "form" in parsed_field.attrs:
+                form_index = form_id_map.get(parsed_field.attrs["form"], form_index)
+
+            if form_index is not None:
+                add_form_data_field(forms[form_index], parsed_field)
+
+        return forms
+
+    def _parse_document(self, markup: Markup, encoding: str = None) -> object:
+        """
+        Parse an HTML document into the backend's document object.
+
+        :param markup: A string, or bytes, containing HTML markup.
+
+        :param encoding: The encoding of the markup, when bytes are given.
+        """
+
+        raise NotImplementedError()
+
+    def _walk_document(self, document: object, field_tags: FrozenSet[str]) -> Iterator[Tuple[str, object]]:
+        """
+        Traverse the document in document order, generating an event for
+        the start and end of each form element, and for each field element.
+
+        :param field_tags: The element tag names of form fields.
+
+        :returns: A series of (event, element) pairs. The event is one of
+            FORM_START, FORM_END, or FIELD.
+        """
+
+        raise NotImplementedError()
+
+
+class IncrementalParser:
+    """
+    Accepts an HTML document in chunks. The "forms" collection holds the
+    FormData objects found so far. Fields may continue to be added to a
+    form until the parser is closed.
+    """
+
+    def __init__(self):
+
+        self.forms = []
+
+    def feed(self, data: str):
+        """
+        Provide the next chunk of the document.
+        """
+
+        raise NotImplementedError()
+
+    def close(self):
+        """
+        Complete parsing of the document.
+        """
+
+        raise NotImplementedError()
+
+
+class BufferedIncrementalParser(IncrementalParser):
+    """
+    Buffers document chunks, and parses the whole document when closed.
+
+    :param parser_backend: The backend used to parse the document.
+    """
+
+    def __init__(self, parser_backend: ParserBackend, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], field_tags: Iterable[str] = None):
+
+        super().__init__()
+
+        self._parser_backend = parser_backend
+        self._create_form_data = create_form_data
+        self._add_form_data_field = add_form_data_field
+        self._field_tags = field_tags
+
+        self.__chunks = []
+
+    def feed(self, data: str):
+
+        self.__chunks.append(data)
+
+    def close(self):
+
+        markup = "".join(self.__chunks)
+        self.__chunks = []
+
+        self.forms.extend(self._parser_backend.parse_forms(
+            markup, self._create_form_data, self._add_form_data_field, field_tags=self._field_tags))
+
+
+class BeautifulSoupBackend(ParserBackend):
+    """
+    A backend building a BeautifulSoup tree with the given tree builder.
+
+    :param builder: A valid BeautifulSoup parsing library name.
+    """
+
+    def __init__(self, builder: str = None):
+
+        if builder is not None:
+            self.name = builder
+
+    def parse_fragment(self, markup: str) -> 'bs4.Tag':
+
+        bs4_parser = BeautifulSoup(markup, self.name)
+
+        if bs4_parser.body is not None:
+            # Tree builders such as html5lib build a full and valid DOM when
+            # parsing.
+            return bs4_parser.body.next_element
+
+        return bs4_parser.find(True)
+
+    def _parse_document(self, markup: Markup, encoding: str = None) -> BeautifulSoup:
+
+        if not isinstance(markup, str):
+            # The markup is decoded with the sniffed encoding's Python codec,
+            # as tree builders such as html5lib look encodings up by their
+            # own names.
+            markup = str(strip_byte_order_mark(markup, encoding), encoding, "replace")
+
+        return BeautifulSoup(markup, self.name)
+
+    def _walk_document(self, document: BeautifulSoup, field_tags: FrozenSet[str]) -> Iterator[Tuple[str, 'bs4.Tag']]:
+
+        # A stack of child iterators is used rather than recursion, as
+        # deeply nested documents would exceed the recursion limit. Each
+        # iterator is paired with the form element it belongs to, if any.
+        stack = [(iter(document.contents), None, )]
+
+        while stack:
+
+            children, form = stack[-1]
+
+            for child in children:
+
+                if not isinstance(child, Tag):
+                    continue
+
+                if child.name == "form":
+                    yield FORM_START, child
+                    stack.append((iter(child.contents), child, ))
+                    break
+
+                if child.name in field_tags:
+                    yield FIELD, child
+
+                if child.contents:
+                    stack.append((iter(child.contents), None, ))
+                    break
+
+            else:
+                stack.pop()
+
+                if form is not None:
+                    yield FORM_END, form
+
+
+class Html5libBackend(BeautifulSoupBackend):
+    """
+    A BeautifulSoup backend using html5lib. The tree is built exactly as a
+    web browser would, making this the most accurate and slowest backend.
+    """
+
+    name = "html5lib"
+
+
+class HtmlParserBackend(BeautifulSoupBackend):
+    """
+    A BeautifulSoup backend using the standard library html.parser.
+    """
+
+    name = "html.parser"
+
+
+class LxmlElement:
+    """
+    Presents an lxml.html element with the subset of the BeautifulSoup Tag
+    interface used by the FormDataEntryParser classes.
+
+    :param element: An lxml.html element.
+    """
+
+    def __init__(self, element: 'lxml.html.HtmlElement'):
+
+        self.element = element
+        self.name = element.tag
+        self.attrs = element.attrib
+
+    def has_attr(self, key: str) -> bool:
+        """
+        Determine if the element defines the given attribute.
+        """
+
+        return key in self.attrs
+
+    def get_text(self) -> str:
+        """
+        Returns the text content of the element.
+        """
+
+        text = self.element.text_content()
+
+        if self.name == "textarea" and text.startswith("\n"):
+            # A single leading newline is dropped by the HTML tree
+            # construction rules, libxml2 retains it.
+            text = text[1:]
+
+        return text
+
+    def find_all(self, name) -> List['LxmlElement']:
+        """
+        Returns the descendant elements matching the given element name, or
+        collection of names.
+        """
+
+        if isinstance(name, str):
+            name = (name, )
+
+        return [LxmlElement(element)
+                for element in self.element.iterdescendants(*name)]
+
+
+def _import_lxml():
+    """
+    Import the optional lxml library used by the "lxml" backend.
+
+    :returns: The lxml package, with its "etree" and "html" modules
+        imported.
+    """
+
+    try:
+        import lxml.etree
+        import lxml.html
+    except ImportError as error:
+        raise ImportError(
+            "The \"lxml\" parser backend requires the lxml library. Install it with "
+            "\"pip install html_form_parser[lxml]\".") from error
+
+    return lxml
+
+
+class LxmlBackend(ParserBackend):
+    """
+    A backend using lxml.html directly, without a BeautifulSoup tree. This
+    is the fastest tree building backend, and suited to well-formed pages.
+    Malformed markup, such as nested forms, may be repaired differently
+    than a web browser would.
+
+    Requires the optional "lxml" library, installed by the "lxml" extra.
+    """
+
+    name = "lxml"
+
+    def parse_fragment(self, markup: str) -> LxmlElement:
+
+        lxml = _import_lxml()
+
+        elements = lxml.html.fragments_fromstring(markup)
+        elements = [element for element in elements if not isinstance(element, str)]
+
+        if not elements:
+            return None
+
+        return LxmlElement(elements[0])
+
+    def create_incremental_parser(self, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], field_tags: Iterable[str] = None) -> 'LxmlIncrementalParser':
+
+        return LxmlIncrementalParser(self, create_form_data, add_form_data_field, field_tags)
+
+    def _parse_document(self, markup: Markup, encoding: str = None) -> 'lxml.html.HtmlElement':
+
+        lxml = _import_lxml()
+
+        try:
+            if isinstance(markup, str):
+                return lxml.html.document_fromstring(markup)
+
+            if is_ascii_compatible(encoding):
+                try:
+                    return lxml.html.document_fromstring(
+                        bytes(markup), parser=lxml.html.HTMLParser(encoding=encoding))
+                except LookupError:
+                    # libxml2 names some encodings differently than Python,
+                    # or does not support them.
+                    pass
+
+            return lxml.html.document_fromstring(str(strip_byte_order_mark(markup, encoding), encoding, "replace"))
+
+        except lxml.etree.ParserError:
+            # Raised for documents without an element, such as empty,
+            # whitespace or comment only markup, which have no forms.
+            return None
+
+    def _walk_document(self, document: 'lxml.html.HtmlElement', field_tags: FrozenSet[str]) -> Iterator[Tuple[str, LxmlElement]]:
+
+        if document is None:
+            return
+
+        tags = ("form", ) + tuple(field_tags)
+
+        # Only form and field elements are visited, by the lxml iterator.
+        # The elements within a form immediately follow it, so the end of a
+        # form is found by counting the matching elements it contains.
+        form_ends = []
+
+        for position, element in enumerate(document.iter(*tags)):
+
+            while form_ends and form_ends[-1][0] < position:
+                yield FORM_END, form_ends.pop()[1]
+
+            if element.tag == "form":
+                form = LxmlElement(element)
+                yield FORM_START, form
+
+                descendants = sum(1 for descendant in element.iterdescendants(*tags))
+                form_ends.append((position + descendants, form, ))
+
+            else:
+                yield FIELD, LxmlElement(element)
+
+        while form_ends:
+            yield FORM_END, form_ends.pop()[1]
+
+
+class LxmlIncrementalParser(BufferedIncrementalParser):
+    """
+    Builds the lxml tree as chunks arrive, using the lxml feed parser
+    interface. Forms are created once the document is closed.
+    """
+
+    def __init__(self, parser_backend: LxmlBackend, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], field_tags: Iterable[str] = None):
+
+        lxml = _import_lxml()
+
+        super().__init__(parser_backend, create_form_data, add_form_data_field, field_tags)
+
+        self.__lxml_parser = lxml.html.HTMLParser()
+
+    def feed(self, data: str):
+
+        self.__lxml_parser.feed(data)
+
+    def close(self):
+
+        lxml = _import_lxml()
+
+        try:
+            # An empty document closes to None, or raises when nothing was
+            # fed, and has no forms.
+            document = self.__lxml_parser.close()
+        except lxml.etree.XMLSyntaxError:
+            document = None
+
+        self.forms.extend(self._parser_backend._create_forms(
+            document, self._create_form_data, self._add_form_data_field, self._field_tags))
+
+
+class StreamBackend(ParserBackend):
+    """
+    A backend using the tree-free stream engine. Forms are extracted in a
+    single pass over the html.parser tokenizer events.
+    """
+
+    name = "stream"
+
+    # The number of bytes decoded at a time, avoiding a decoded copy of the
+    # whole document.
+    _decode_chunk_size = 65536
+
+    def parse_fragment(self, markup: str) -> 'FormElement':
+
+        elements = []
+
+        def capture(form_data, element):
+            elements.append(element)
+
+        stream_parser = StreamFormParser(lambda element: FormData(), capture)
+        stream_parser.feed("<form>")
+        stream_parser.feed(markup)
+        stream_parser.close()
+
+        if not elements:
+            return None
+
+        return elements[0]
+
+    def parse_forms(self, markup: Markup, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], encoding: str = None, is_finished: Callable[[], bool] = None, field_tags: Iterable[str] = None) -> List[FormData]:
+
+        stream_parser = StreamFormParser(create_form_data, add_form_data_field, is_finished, field_tags)
+
+        if isinstance(markup, str):
+            stream_parser.feed(markup)
+
+        else:
+            view = strip_byte_order_mark(markup, encoding)
+            decoder = codecs.getincrementaldecoder(encoding)("replace")
+            for start in range(0, len(view), self._decode_chunk_size):
+                if stream_parser.is_stopped:
+                    break
+
+                stream_parser.feed(decoder.decode(view[start:start + self._decode_chunk_size]))
+
+            stream_parser.feed(decoder.decode(b"", True))
+
+        stream_parser.close()
+
+        return stream_parser.forms
+
+    def create_incremental_parser(self, create_form_data: Callable[[object], FormData], add_form_data_field: Callable[[FormData, object], None], field_tags: Iterable[str] = None) -> StreamFormParser:
+
+        # Forms are emitted as soon as their start tag is read.
+        return StreamFormParser(create_form_data, add_form_data_field, field_tags=field_tags)
+
+
+_parser_backends = {
+    Html5libBackend.name: Html5libBackend(),
+    HtmlParserBackend.name: HtmlParserBackend(),
+    LxmlBackend.name: LxmlBackend(),
+    StreamBackend.name: StreamBackend(),
+}
+
+
+def get_parser_backend(name: str = None) -> ParserBackend:
+    """
+    Returns the parser backend for the given name. Backends hold no state,
+    and are shared. Names without a dedicated backend are given to
+    BeautifulSoup as a tree builder name.
+
+    :param name: A backend name, default is "html5lib".
+    """
+
+    if name is None:
+        name = Html5libBackend.name
+
+    if isinstance(name, ParserBackend):
+        return name
+
+    backend = _parser_backends.get(name, None)
+    if backend is None:
+        # Threads creating a backend of the same name share the first one.
+        backend = _parser_backends.setdefault(name, BeautifulSoupBackend(name))
+
+    return backend
@@ -0,0 +1,383 @@
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, List, Tuple
+
+from ..models.form_data import FormData
+from ..models.form_data_entry import FormDataEntry
+from .form_data_entry_parser_registry import FormDataEntryParserRegistry
+from .parser_backend import Markup, get_parser_backend
+
+# Modules imported once by the forkserver process, and inherited by each
+# worker process forked from it. Other workers import them on start.
+_preload_modules = ["html_form_parser", "bs4", "html5lib", "lxml.html", ]
+
+# A form encoded for sending between processes or interpreters: the name,
+# action, method, enctype and attributes of the form, a name, value,
+# filename and submitable flag for each entry, and the kind of each group
+# by name.
+EncodedForm = Tuple[str, str, str, str, dict, List[Tuple[str, str, str, bool, bool]], dict]
+
+# Set once the preload modules are given to the forkserver.
+_forkserver_preloaded = False
+
+# The HtmlFormParser object of a worker process, and its parse settings.
+_worker_parser = None
+_worker_settings = None
+
+
+def _get_context() -> multiprocessing.context.BaseContext:
+    """
+    Returns the multiprocessing context used to start worker processes. The
+    forkserver start method is used where available, as workers are forked
+    from a process with the parsing libraries already imported.
+
+    The forkserver preload list is shared by the whole process. It is set
+    once, when the first pool is created, and replaces any list set before;
+    it has no effect if the forkserver is already running.
+    """
+
+    global _forkserver_preloaded
+
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    context = multiprocessing.get_context("forkserver")
+    if not _forkserver_preloaded:
+        context.set_forkserver_preload(_preload_modules)
+        _forkserver_preloaded = True
+
+    return context
+
+
+def _initialize_worker(form_parser_class: type, field_parser_registry: FormDataEntryParserRegistry, parser: str, encoding: str, prefilter: bool):
+    """
+    Create the HtmlFormParser object of a worker process, and its field
+    parsers, once for all the documents the worker parses.
+    """
+
+    global _worker_parser, _worker_settings
+
+    for module_name in _preload_modules:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            # Optional libraries, and extension modules unable to run in a
+            # subinterpreter.
+            pass
+
+    _worker_parser = form_parser_class()
+    if field_parser_registry is not None:
+        _worker_parser.field_parser_registry = field_parser_registry
+
+    parser_backend = get_parser_backend(parser)
+
+    _worker_settings = (parser_backend, _worker_parser._get_field_parsers(parser_backend), encoding, prefilter, )
+
+
+def _parse_batch(batch: List[Tuple[int, Markup]]) -> List[Tuple[int, List[EncodedForm]]]:
+    """
+    Parse a batch of documents within a worker process, or interpreter.
+    """
+
+    parser_backend, field_parsers, encoding, prefilter = _worker_settings
+
+    return [
+        (index, encode_forms(_worker_parser._parse_markup(markup, parser_backend, field_parsers, encoding, prefilter)), )
+        for index, markup in batch
+    ]
+
+
+def encode_forms(forms: List[FormData]) -> List[EncodedForm]:
+    """
+    Encode forms as tuples of plain values. Tuples are several times
+    smaller and faster to pickle than the objects they represent.
+
+    :param forms: A collection of FormData objects.
+    """
+
+    return [
+        (
+            form_data.name, form_data.action, form_data.method, form_data.enctype, form_data._attrs,
+            [(entry.name, entry.value, entry.filename, entry.is_submitable, entry.is_option, ) for entry in form_data.fields],
+            form_data._group_kinds,
+        )
+        for form_data in forms
+    ]
+
+
+def decode_forms(encoded_forms: List[EncodedForm]) -> List[FormData]:
+    """
+    Create FormData objects from forms encoded by encode_forms().
+
+    :param encoded_forms: A collection of encoded forms.
+    """
+
+    forms = []
+    for name, action, method, enctype, attrs, entries, group_kinds in encoded_forms:
+
+        form_data = FormData(name, action, method, enctype)
+        form_data._attrs = attrs
+        form_data._group_kinds = group_kinds
+        form_data.fields.extend([
+            FormDataEntry(entry_name, value, filename, is_submitable, is_option)
+            for entry_name, value, filename, is_submitable, is_option in entries
+        ])
+
+        forms.append(form_data)
+
+    return forms
+
+
+def create_batches(documents: Iterable[Markup], chunksize: int, max_batch_size: int) -> Iterator[List[Tuple[int, Markup]]]:
+    """
+    Group documents into batches of up to "chunksize" documents, and up to
+    "max_batch_size" characters or bytes. A document larger than the maximum
+    size is placed in a batch of its own, rather than delaying the smaller
+    documents batched with it.
+
+    :param documents: A series of documents.
+
+    :param chunksize: The maximum number of documents in a batch.
+
+    :param max_batch_size: The maximum total length of the documents in a
+        batch.
+
+    :returns: A series of batches, each a collection of (index, document)
+        pairs. The index is the position of the document in the series.
+    """
+
+    batch = []
+    batch_size = 0
+
+    for index, markup in enumerate(documents):
+
+        size = len(markup)
+        if batch and batch_size + size > max_batch_size:
+            yield batch
+            batch = []
+            batch_size = 0
+
+        batch.append((index, markup, ))
+        batch_size += size
+
+        if len(batch) >= chunksize or batch_size >= max_batch_size:
+            yield batch
+            batch = []
+            batch_size = 0
+
+    if batch:
+        yield batch
+
+
+class ParserPool:
+    """
+    A pool of worker processes parsing documents in parallel. The workers
+    are started once, with the parsing libraries imported, and are reused by
+    each call to parse_many() until the pool is closed.
+
+    Worker processes are started with the forkserver method where
+    available. As with any multiprocessing program, the main module must be
+    importable without side effects, using an
+    'if __name__ == "__main__":' guard.
+
+    Results are sent back from the workers encoded as tuples, and returned
+    as FormData objects. See encode_forms().
+
+    :param form_parser_class: The HtmlFormParser class, or subclass, used by
+        the workers.
+
+    :param workers: The number of worker processes. Default is the number of
+        CPUs.
+
+    :param parser: A parser backend name. Backend objects must be picklable.
+
+    :param encoding: The encoding label of documents given as bytes, if
+        known.
+
+    :param prefilter: Scan documents for forms before parsing.
+
+    :param field_parser_registry: The FormDataEntryParserRegistry used by the
+        workers. Default is the registry of the HtmlFormParser class.
+    """
+
+    # The maximum total length of the documents sent to a worker at a time.
+    max_batch_size = 1 << 20
+
+    def __init__(self, form_parser_class: type, workers: int = None, parser: str = None, encoding: str = None, prefilter: bool = False, field_parser_registry: FormDataEntryParserRegistry = None):
+
+        self.workers = workers or os.cpu_count() or 1
+
+        self._executor = self._create_executor(
+            (form_parser_class, field_parser_registry, parser, encoding, prefilter, ))
+
+    def __enter__(self) -> 'ParserPool':
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.close()
+
+    def close(self):
+        """
+        Stop the worker processes.
+        """
+
+        self._executor.shutdown(cancel_futures=True)
+
+    def parse_many(self, documents: Iterable[Markup], chunksize: int = 16, ordered: bool = False) -> Iterator[Tuple[int, List[FormData]]]:
+        """
+        Parse a series of documents in the worker processes. Documents are
+        read from the series as workers become available, so the series may
+        be a generator of any length.
+
+        :param documents: A series of strings, or bytes, containing HTML
+            markup.
+
+        :param chunksize: The maximum number of documents sent to a worker
+            at a time. Larger documents are sent in smaller batches, see
+            create_batches().
+
+        :param ordered: Provide results in the order of the documents.
+            Otherwise, results are provided as soon as they are available.
+
+        :returns: A series of (index, forms) pairs. The index is the position
+            of the document in the series.
+        """
+
+        batches = create_batches(documents, chunksize, self.max_batch_size)
+
+        # Enough batches are kept in flight to keep every worker busy while
+        # results are collected.
+        max_pending = self.workers * 2
+
+        pending = set()
+        completed = {}
+        next_index = 0
+
+        while True:
+
+            for batch in batches:
+                pending.add(self._submit_batch(batch))
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                for index, forms in future.result():
+
+                    forms = self._load_forms(forms)
+
+                    if not ordered:
+                        yield index, forms
+                        continue
+
+                    completed[index] = forms
+
+            while next_index in completed:
+                yield next_index, completed.pop(next_index)
+                next_index += 1
+
+    def _create_executor(self, initargs: tuple) -> Executor:
+        """
+        Create the executor running the workers.
+
+        :param initargs: The arguments of the worker initializer.
+        """
+
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=_get_context(),
+            initializer=_initialize_worker,
+            initargs=initargs)
+
+    def _submit_batch(self, batch: List[Tuple[int, Markup]]) -> Future:
+        """
+        Submit a batch of documents to the workers.
+        """
+
+        return self._executor.submit(_parse_batch, batch)
+
+    def _load_forms(self, forms: List[EncodedForm]) -> List[FormData]:
+        """
+        Create the FormData objects of a document from a worker's result.
+        """
+
+        return decode_forms(forms)
+
+
+class InterpreterParserPool(ParserPool):
+    """
+    A pool of subinterpreters parsing documents in parallel, within the
+    current process. Each interpreter has its own GIL, and imports the
+    parsing libraries once when started. Documents and results are copied
+    between interpreters, with results encoded as tuples.
+
+    Requires Python 3.14 or later, providing
+    concurrent.futures.InterpreterPoolExecutor. The "lxml" backend is not
+    available within subinterpreters.
+
+    See ParserPool for the parameters.
+    """
+
+    def _create_executor(self, initargs: tuple) -> Executor:
+
+        try:
+            from concurrent.futures import InterpreterPoolExecutor
+        except ImportError:
+            raise RuntimeError("Subinterpreter pools require Python 3.14 or later.") from None
+
+        return InterpreterPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_worker,
+            initargs=initargs)
+
+
+class ThreadParserPool(ParserPool):
+    """
+    A pool of worker threads parsing documents in parallel. The workers
+    share a single HtmlFormParser object and its field parsers, and results
+    are not pickled.
+
+    Parsing is only parallel on a free-threaded Python build. With the GIL,
+    the pool provides concurrency without parallel speedup.
+
+    :param form_parser: The HtmlFormParser object used by the workers.
+
+    See ParserPool for the remaining parameters.
+    """
+
+    def __init__(self, form_parser: 'HtmlFormParser', workers: int = None, parser: str = None, encoding: str = None, prefilter: bool = False):
+
+        self.workers = workers or os.cpu_count() or 1
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        parser_backend = get_parser_backend(parser)
+
+        self.__form_parser = form_parser
+        self.__settings = (parser_backend, form_parser._get_field_parsers(parser_backend), encoding, prefilter, )
+
+    def _submit_batch(self, batch: List[Tuple[int, Markup]]) -> Future:
+
+        return self._executor.submit(self.__parse_batch, batch)
+
+    def _load_forms(self, forms: List[FormData]) -> List[FormData]:
+
+        # Results are shared between threads, and need no decoding.
+        return forms
+
+    def __parse_batch(self, batch: List[Tuple[int, Markup]]) -> List[Tuple[int, List[FormData]]]:
+
+        parser_backend, field_parsers, encoding, prefilter = self.__settings
+
+        return [
+            (index, self.__form_parser._parse_markup(markup, parser_backend, field_parsers, encoding, prefilter), )
+            for index, markup in batch
+        ]
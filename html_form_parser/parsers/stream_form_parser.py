@@ -0,0 +1,651 @@
+from collections import deque
+from html import unescape
+from html.parser import HTMLParser
+from typing import Callable, Iterable, List
+
+from ..models.form_data import FormData
+
+# Elements without content or an end tag.
+_void_tags = frozenset((
+    "area", "base", "basefont", "bgsound", "br", "col", "embed", "frame", "hr", "image", "img", "input",
+    "keygen", "link", "meta", "param", "source", "track", "wbr",
+))
+
+# Elements present once in every document, which are not tracked.
+_root_tags = frozenset(("body", "head", "html", ))
+
+# The elements the HTML tree construction rules treat as special. An end
+# tag of another element, such as a "span", does not close them.
+_special_tags = frozenset((
+    "address", "applet", "area", "article", "aside", "base", "basefont", "bgsound", "blockquote", "body",
+    "br", "button", "caption", "center", "col", "colgroup", "dd", "details", "dir", "div", "dl", "dt",
+    "embed", "fieldset", "figcaption", "figure", "footer", "form", "frame", "frameset", "h1", "h2", "h3",
+    "h4", "h5", "h6", "head", "header", "hgroup", "hr", "html", "iframe", "img", "input", "keygen", "li",
+    "link", "listing", "main", "marquee", "menu", "meta", "nav", "noembed", "noframes", "noscript",
+    "object", "ol", "p", "param", "plaintext", "pre", "script", "search", "section", "select", "source",
+    "style", "summary", "table", "tbody", "td", "template", "textarea", "tfoot", "th", "thead", "title",
+    "tr", "track", "ul", "wbr", "xmp",
+))
+
+# The elements whose end tag closes every element opened within them,
+# including a form, when the element is in scope.
+_scoped_end_tags = frozenset((
+    "address", "applet", "article", "aside", "blockquote", "button", "caption", "center", "dd",
+    "details", "dialog", "dir", "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer", "h1",
+    "h2", "h3", "h4", "h5", "h6", "header", "hgroup", "li", "listing", "main", "marquee", "menu", "nav",
+    "object", "ol", "p", "pre", "search", "section", "summary", "table", "tbody", "td", "tfoot", "th",
+    "thead", "tr", "ul",
+))
+
+# The elements limiting the scope of an end tag, by the elements the end
+# tag closes.
+_scope_boundaries = frozenset(("applet", "caption", "html", "marquee", "object", "table", "td", "template", "th", ))
+_table_scope_boundaries = frozenset(("html", "table", "template", ))
+_list_scope_boundaries = _scope_boundaries | frozenset(("ol", "ul", ))
+_button_scope_boundaries = _scope_boundaries | frozenset(("button", ))
+
+_table_tags = frozenset(("caption", "table", "tbody", "td", "tfoot", "th", "thead", "tr", ))
+_cell_tags = frozenset(("caption", "td", "th", ))
+
+# The start tags closing an open table cell.
+_cell_closing_tags = frozenset(("caption", "col", "colgroup", "tbody", "td", "tfoot", "th", "thead", "tr", ))
+
+# The start tags closing an open "p" element.
+_paragraph_closing_tags = frozenset((
+    "address", "article", "aside", "blockquote", "center", "dd", "details", "dialog", "dir", "div", "dl",
+    "dt", "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hgroup", "hr", "li", "listing", "main", "menu", "nav", "ol", "p", "plaintext", "pre",
+    "search", "section", "summary", "table", "ul", "xmp",
+))
+
+# The start tags closing an open list item, by tag name.
+_list_item_tags = {"dd": ("dd", "dt", ), "dt": ("dd", "dt", ), "li": ("li", )}
+
+# The start tags implying the end of an open element.
+_implying_tags = _cell_closing_tags | _paragraph_closing_tags | frozenset(("button", ))
+
+
+class FormElement:
+    """
+    A detached HTML form element captured from the tokenizer's event stream.
+
+    Only the attributes and text the form element parsers need are retained.
+    The object provides the subset of the BeautifulSoup Tag interface used by
+    the FormDataEntryParser classes, so it may be passed to their parse()
+    method in place of a Tag.
+
+    :param name: The lower case HTML element name.
+
+    :param attrs: A dictionary of the element's attributes.
+
+    :param parent_form: The "form" element containing this element, if any.
+    """
+
+    def __init__(self, name: str, attrs: dict = None, parent_form: 'FormElement' = None):
+
+        self.name = name
+        self.attrs = attrs if attrs is not None else {}
+        self.parent_form = parent_form
+
+        # Child elements are only tracked for "select" elements (options).
+        self.contents = []
+
+        self._text = []
+
+        # Set once the element's end tag, or an implied end tag, is reached.
+        self.is_complete = False
+
+    @classmethod
+    def detach(cls, element: object) -> 'FormElement':
+        """
+        Copy a parsed field element, such as a BeautifulSoup Tag, into a
+        FormElement holding no reference to the document it was parsed
+        from. The attributes and text of the element are copied, and the
+        options of a select element.
+
+        :param element: A parsed field element. FormElement objects are
+            returned as they are.
+        """
+
+        if isinstance(element, cls):
+            return element
+
+        detached = cls(element.name, dict(element.attrs))
+
+        if element.name == "select":
+            detached.contents = [cls.detach(option) for option in element.find_all("option")]
+        else:
+            detached._text.append(element.get_text())
+
+        detached.is_complete = True
+
+        return detached
+
+    def has_attr(self, key: str) -> bool:
+        """
+        Determine if the element defines the given attribute.
+        """
+
+        return key in self.attrs
+
+    def get_text(self) -> str:
+        """
+        Returns the text content captured for the element.
+        """
+
+        return "".join(self._text)
+
+    def find_all(self, name) -> List['FormElement']:
+        """
+        Returns the captured child elements matching the given element name,
+        or collection of names.
+        """
+
+        if isinstance(name, str):
+            name = (name, )
+
+        return [element for element in self.contents if element.name in name]
+
+
+class _StopParsing(Exception):
+    """
+    Raised from an event handler to stop parsing the remaining markup.
+    """
+
+
+class _FormState:
+    """
+    Tracks a form being emitted by the stream parser, and the controls
+    waiting to be converted into entries in document order.
+    """
+
+    def __init__(self, element: FormElement, form_data: FormData):
+
+        self.element = element
+        self.form_data = form_data
+        self.pending = deque()
+
+    def flush(self, add_form_data_field: Callable[[FormData, FormElement], None]):
+        """
+        Add completed controls to the form. Controls are added in document
+        order, stopping at the first incomplete one.
+        """
+
+        while self.pending and self.pending[0].is_complete:
+            add_form_data_field(self.form_data, self.pending.popleft())
+
+
+class StreamFormParser(HTMLParser):
+    """
+    A tree-free form extraction engine. A single pass is made over the
+    html.parser tokenizer events, and FormData objects are emitted directly
+    without building a document tree.
+
+    The tree construction rules html5lib applies to forms are followed where
+    they affect the result: nested "form" start tags are ignored, an option
+    is closed by the next option, and a "select" is closed by a nested
+    "select", "input", or "textarea" start tag. The open elements are
+    tracked by tag name, so a form left open is closed with the element
+    containing it, a "form" end tag leaves the elements opened within the
+    form in it, and a form started directly within a table is empty.
+    Misnested formatting elements, such as "b" and "a", are not
+    reconstructed.
+
+    :param create_form_data: A callable creating a FormData object from a
+        "form" FormElement.
+
+    :param add_form_data_field: A callable adding a form control
+        FormElement to the FormData object it is associated to.
+
+    :param is_finished: A callable checked after each form is closed. When
+        it returns True, the remaining markup is not parsed.
+
+    :param field_tags: The element tag names of form controls. Default is
+        the standard HTML form controls. Elements other than the standard
+        controls, such as form-associated custom elements, are emitted with
+        their attributes once their start tag is read; their content is not
+        captured.
+    """
+
+    _control_tags = frozenset(("button", "input", "select", "textarea", ))
+
+    _select_closing_tags = ("input", "keygen", "select", "textarea", )
+
+    def __init__(self, create_form_data: Callable[[FormElement], FormData], add_form_data_field: Callable[[FormData, FormElement], None], is_finished: Callable[[], bool] = None, field_tags: Iterable[str] = None):
+
+        super().__init__(convert_charrefs=True)
+
+        if field_tags is not None:
+            self._control_tags = frozenset(field_tags)
+
+        self._create_form_data = create_form_data
+        self._add_form_data_field = add_form_data_field
+        self._is_finished = is_finished
+
+        # Set once parsing has stopped early.
+        self.is_stopped = False
+
+        # Newer releases of html.parser treat textarea content as escapable
+        # raw text. Older releases tokenize it as markup, and must be told.
+        self._textarea_is_rcdata = "textarea" in getattr(HTMLParser, "RCDATA_CONTENT_ELEMENTS", ())
+
+        self.forms = []
+
+        self.__form_states = {}
+        self.__form_id_map = {}
+
+        # The form each control has been associated to.
+        self.__control_owners = {}
+
+        # Controls referencing a form by "form" attribute that has not been
+        # reached yet. Keyed by the form's id attribute value.
+        self.__unresolved = {}
+
+        # The open elements, as (tag name, containing form) pairs. Fields
+        # belong to the form containing the current element.
+        self.__open_elements = []
+
+        # The last form started, until its end tag. Other "form" start tags
+        # are ignored while it is set.
+        self.__form_pointer = None
+
+        self.__current_select = None
+        self.__current_option = None
+        self.__current_textarea = None
+        self.__current_button = None
+
+    def feed(self, data: str):
+        """
+        Parse the next chunk of markup. Ignored once parsing has stopped.
+        """
+
+        if self.is_stopped:
+            return
+
+        try:
+            super().feed(data)
+        except _StopParsing:
+            self.__stop()
+
+    def close(self):
+        """
+        Process any remaining buffered data and complete all open elements.
+        Controls referencing a form that was never found fall back to their
+        containing form.
+        """
+
+        if not self.is_stopped:
+            try:
+                super().close()
+            except _StopParsing:
+                self.__stop()
+
+        self.__end_select()
+        self.__end_textarea()
+        self.__end_element(self.__current_button)
+        self.__current_button = None
+
+        for elements in self.__unresolved.values():
+            for element in elements:
+                if element.parent_form is not None:
+                    form_state = self.__form_states[element.parent_form]
+                    form_state.pending.append(element)
+                    self.__control_owners[element] = form_state
+
+        self.__unresolved = {}
+
+        for form_state in self.__form_states.values():
+            for element in form_state.pending:
+                element.is_complete = True
+
+            form_state.flush(self._add_form_data_field)
+
+        self.__open_elements = []
+        self.__form_pointer = None
+
+    def handle_starttag(self, tag: str, attrs: list):
+
+        if self.__current_select is not None:
+            if tag == "option" or tag == "optgroup":
+                self.__end_option()
+            elif tag in self._select_closing_tags:
+                self.__end_select()
+                if tag == "select":
+                    return
+            else:
+                # Other markup is ignored within a select element.
+                return
+
+        self.__close_implied_elements(tag)
+
+        if tag == "form":
+            if self.__form_pointer is None:
+                self.__start_form(self.__make_element(tag, attrs))
+
+            return
+
+        if tag not in _void_tags and tag not in _root_tags:
+            self.__open_elements.append((tag, self.__get_current_form(), ))
+
+        if tag in self._control_tags:
+            element = self.__make_element(tag, attrs)
+            self.__add_control(element)
+
+            if tag == "select":
+                self.__current_select = element
+            elif tag == "textarea":
+                self.__current_textarea = element
+                if not self._textarea_is_rcdata:
+                    self.set_cdata_mode(tag)
+            elif tag == "button":
+                self.__end_element(self.__current_button)
+                self.__current_button = element
+            else:
+                self.__end_element(element)
+
+        elif tag == "option" and self.__current_select is not None:
+            self.__current_option = self.__make_element(tag, attrs)
+            self.__current_select.contents.append(self.__current_option)
+
+    def handle_startendtag(self, tag: str, attrs: list):
+
+        # A self-closing syntax has no meaning on non-void HTML elements, the
+        # end tag is only implied for void elements.
+        self.handle_starttag(tag, attrs)
+
+        if tag == "option":
+            self.__end_option()
+
+    def handle_endtag(self, tag: str):
+
+        if self.__current_select is not None and tag not in ("select", "option", "optgroup", ):
+            # Other markup is ignored within a select element.
+            return
+
+        if tag == "form":
+            self.__end_form()
+
+            if self._is_finished is not None and self._is_finished():
+                raise _StopParsing()
+
+            return
+
+        if tag == "select":
+            self.__end_select()
+
+        elif tag == "option" or tag == "optgroup":
+            self.__end_option()
+
+        elif tag == "textarea":
+            self.__end_textarea()
+
+        elif tag == "button":
+            self.__end_element(self.__current_button)
+            self.__current_button = None
+
+        if tag not in _root_tags:
+            self.__close_element(tag)
+
+    def handle_data(self, data: str):
+
+        if self.__current_textarea is not None:
+            self.__current_textarea._text.append(data)
+
+        elif self.__current_option is not None:
+            self.__current_option._text.append(data)
+
+    def __stop(self):
+        """
+        Stop parsing, discarding the remaining markup.
+        """
+
+        self.is_stopped = True
+        self.rawdata = ""
+
+    def __make_element(self, tag: str, attrs: list) -> FormElement:
+        """
+        Create a FormElement. Duplicate attributes are ignored, and value-less
+        attributes are given an empty value, as a tree builder would.
+        """
+
+        element_attrs = {}
+        for key, val in attrs:
+            if key not in element_attrs:
+                element_attrs[key] = "" if val is None else val
+
+        return FormElement(tag, element_attrs, self.__get_current_form())
+
+    def __start_form(self, element: FormElement):
+        """
+        Emit a new form, and attach any controls which referenced it by id
+        before it was reached.
+        """
+
+        form_state = _FormState(element, self._create_form_data(element))
+
+        self.__form_states[element] = form_state
+        self.forms.append(form_state.form_data)
+        self.__form_pointer = element
+
+        # A form started directly within a table is inserted empty, and the
+        # fields following it remain in the table.
+        if not self.__is_in_table():
+            self.__open_elements.append(("form", element, ))
+
+        form_id = element.attrs.get("id", None)
+        if form_id is not None and form_id not in self.__form_id_map:
+            self.__form_id_map[form_id] = form_state
+            for control in self.__unresolved.pop(form_id, []):
+                form_state.pending.append(control)
+                self.__control_owners[control] = form_state
+
+            form_state.flush(self._add_form_data_field)
+
+    def __end_form(self):
+        """
+        Close the last form started. Only the form itself is removed from the
+        open elements: elements opened within it, and left open, keep
+        containing form.
+        """
+
+        element = self.__form_pointer
+        self.__form_pointer = None
+
+        if element is None:
+            return
+
+        open_elements = self.__open_elements
+        for index in range(len(open_elements) - 1, -1, -1):
+
+            tag, form = open_elements[index]
+            if form is element and tag == "form":
+                del open_elements[index]
+                return
+
+            if tag in _scope_boundaries:
+                return
+
+    def __get_current_form(self) -> FormElement:
+        """
+        Returns the form containing the current element, if any.
+        """
+
+        return self.__open_elements[-1][1] if self.__open_elements else None
+
+    def __is_in_table(self) -> bool:
+        """
+        Determine if the current element is a table, table section or row,
+        rather than a cell, or an element outside any table.
+        """
+
+        for tag, form in reversed(self.__open_elements):
+            if tag in _table_tags:
+                return tag not in _cell_tags
+
+        return False
+
+    def __find_element(self, tags: Iterable[str], boundaries: Iterable[str]) -> int:
+        """
+        Returns the position of the last open element with one of the tag
+        names, or None when it is not open, or is out of scope. An element
+        which is itself a boundary is found.
+        """
+
+        open_elements = self.__open_elements
+        for index in range(len(open_elements) - 1, -1, -1):
+
+            tag = open_elements[index][0]
+            if tag in tags:
+                return index
+
+            if tag in boundaries:
+                return None
+
+        return None
+
+    def __close_implied_elements(self, tag: str):
+        """
+        Close the elements a start tag implies the end of: an open table
+        cell, an open "p", a previous list item, or an open button.
+        """
+
+        if tag not in _implying_tags:
+            return
+
+        if tag == "button":
+            index = self.__find_element(("button", ), _scope_boundaries)
+            if index is not None:
+                del self.__open_elements[index:]
+
+        if tag in _cell_closing_tags:
+            index = self.__find_element(("td", "th", ), _table_scope_boundaries)
+            if index is not None:
+                del self.__open_elements[index:]
+
+        if tag in _paragraph_closing_tags:
+            index = self.__find_element(("p", ), _button_scope_boundaries)
+            if index is not None:
+                del self.__open_elements[index:]
+
+        list_item_tags = _list_item_tags.get(tag, None)
+        if list_item_tags is not None:
+
+            open_elements = self.__open_elements
+            for index in range(len(open_elements) - 1, -1, -1):
+
+                open_tag = open_elements[index][0]
+                if open_tag in list_item_tags:
+                    del open_elements[index:]
+                    break
+
+                if open_tag in _special_tags and open_tag not in ("address", "div", "p", ):
+                    break
+
+    def __close_element(self, tag: str):
+        """
+        Close an element by its end tag, and the elements opened within it.
+        The end tag of an element which is not special is ignored when a
+        special element, such as a form, was opened within it.
+        """
+
+        open_elements = self.__open_elements
+        if open_elements and open_elements[-1][0] == tag:
+            # Most end tags close the current element.
+            del open_elements[-1]
+            return
+
+        if tag in _scoped_end_tags:
+
+            if tag in _table_tags:
+                boundaries = _table_scope_boundaries
+            elif tag == "li":
+                boundaries = _list_scope_boundaries
+            elif tag == "p":
+                boundaries = _button_scope_boundaries
+            else:
+                boundaries = _scope_boundaries
+
+            index = self.__find_element((tag, ), boundaries)
+
+        else:
+            index = self.__find_element((tag, ), _special_tags)
+
+        if index is not None:
+            del self.__open_elements[index:]
+
+    def __add_control(self, element: FormElement):
+        """
+        Fields associate to the nearest containing form node, or specify
+        their form owner by attribute.
+        https://html.spec.whatwg.org/multipage/form-control-infrastructure.html#association-of-controls-and-forms
+        """
+
+        form_state = None
+
+        if "form" in element.attrs:
+            form_id = element.attrs["form"]
+            form_state = self.__form_id_map.get(form_id, None)
+
+            if form_state is None:
+                self.__unresolved.setdefault(form_id, []).append(element)
+                return
+
+        elif element.parent_form is not None:
+            form_state = self.__form_states[element.parent_form]
+
+        if form_state is not None:
+            form_state.pending.append(element)
+            self.__control_owners[element] = form_state
+
+    def __end_element(self, element: FormElement):
+        """
+        Mark a control complete and emit entries which are now ready.
+        """
+
+        if element is None or element.is_complete:
+            return
+
+        element.is_complete = True
+
+        owner = self.__control_owners.get(element, None)
+        if owner is not None:
+            owner.flush(self._add_form_data_field)
+
+    def __end_option(self):
+
+        if self.__current_option is not None:
+            self.__current_option.is_complete = True
+            self.__current_option = None
+
+    def __end_select(self):
+
+        self.__end_option()
+
+        if self.__current_select is not None:
+            element = self.__current_select
+            self.__current_select = None
+            self.__end_element(element)
+
+            self.__close_element("select")
+
+    def __end_textarea(self):
+
+        if self.__current_textarea is None:
+            return
+
+        element = self.__current_textarea
+        self.__current_textarea = None
+
+        text = element.get_text()
+        if not self._textarea_is_rcdata:
+            text = unescape(text)
+
+        # Newlines are normalized, and a single leading newline is dropped,
+        # matching the HTML tree construction rules.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if text.startswith("\n"):
+            text = text[1:]
+
+        element._text = [text]
+
+        self.__end_element(element)
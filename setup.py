@@ -25,11 +25,18 @@ setuptools.setup(
     classifiers=[
         "License :: OSI Approved :: MIT License",
         'Development Status :: 3 - Alpha',
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.9',
     install_requires=required_packages,
+    extras_require={
+        "lxml": ["lxml"],
+    },
     project_urls={
         'Source': "https://www.github.com/gkunde/py_html_form_parser/",
         'Bug Reports': "https://www.github.com/gkunde/py_html_form_parser/issues",
@@ -1,6 +1,9 @@
+import json
+import pickle
 import unittest
 
 from html_form_parser.models.form_data import FormData
+from html_form_parser.models.form_data_entry import FormDataEntry
 
 class Test_FormData(unittest.TestCase):
 
@@ -27,3 +30,87 @@ class Test_FormData(unittest.TestCase):
         obj = FormData("example", action="https://www.example.com/")
 
         obj.fields.append("garbage")
+
+    def test_to_dict(self):
+
+        obj = FormData("example", "https://www.example.com/", "POST")
+        obj._attrs = {"name": "example", "class": ["a", "b"]}
+        obj.fields.append(FormDataEntry("foo", "bar", is_option=True))
+        obj.add_group("foo", "radio")
+
+        result = obj.to_dict()
+
+        self.assertEqual({
+            "name": "example",
+            "action": "https://www.example.com/",
+            "method": "POST",
+            "enctype": "multipart/form-data",
+            "attrs": {"name": "example", "class": ["a", "b"]},
+            "fields": [{"name": "foo", "value": "bar", "filename": None, "is_submitable": True, "is_option": True}],
+            "groups": {"foo": "radio"},
+        }, result)
+
+        # The dictionary holds only JSON types.
+        self.assertEqual(result, json.loads(json.dumps(result)))
+
+    def test_from_dict(self):
+
+        obj = FormData("example", "https://www.example.com/", "POST", "text/plain")
+        obj._attrs = {"name": "example", "class": ["a", "b"]}
+        obj.fields.append(FormDataEntry("foo", "bar", is_submitable=False))
+        obj.add_group("foo", "select")
+
+        result = FormData.from_dict(obj.to_dict())
+
+        self.assertEqual(("example", "https://www.example.com/", "POST", "text/plain"), (result.name, result.action, result.method, result.enctype))
+        self.assertEqual(obj._attrs, result._attrs)
+        self.assertEqual([FormDataEntry("foo", "bar")], list(result.fields))
+        self.assertFalse(result.fields[0].is_submitable)
+        self.assertEqual({"foo": "select"}, dict(result._group_kinds))
+
+    def test_from_dict_defaults(self):
+
+        result = FormData.from_dict({"name": "example"})
+
+        self.assertEqual(("example", None, "GET", "multipart/form-data"), (result.name, result.action, result.method, result.enctype))
+        self.assertEqual(0, len(result.fields))
+
+    def test_pickle(self):
+
+        obj = FormData("example", "https://www.example.com/")
+        obj.fields.extend([FormDataEntry("foo", "bar"), FormDataEntry("baz", "qux", "file.txt", False)])
+        obj.fields.index_by_name("foo")
+
+        result = pickle.loads(pickle.dumps(obj))
+
+        self.assertEqual(list(obj.fields), list(result.fields))
+        self.assertEqual(["file.txt", False], [result.fields[1].filename, result.fields[1].is_submitable])
+        self.assertEqual(1, result.fields.index_by_name("baz"))
+
+    def test_clone(self):
+
+        obj = FormData("example", "https://www.example.com/", "POST")
+        obj._attrs = {"name": "example", "class": ["a", "b"]}
+        obj.fields.extend([FormDataEntry("user", ""), FormDataEntry("genre", "jazz", is_submitable=False, is_option=True), FormDataEntry("genre", "rock", is_submitable=False, is_option=True)])
+        obj.add_group("genre", "radio")
+
+        template = obj.template()
+        self.assertTrue(template.fields.is_template)
+
+        clone = template.clone()
+        clone.fields.update_many({"user": "john"})
+        clone.groups["genre"].select("rock")
+        clone._attrs["class"].append("c")
+        clone.add_group("user", "select")
+
+        self.assertEqual(("example", "https://www.example.com/", "POST"), (clone.name, clone.action, clone.method))
+        self.assertEqual([("user", "john"), ("genre", "rock")], clone.prepare_data())
+
+        self.assertEqual([("user", "")], template.prepare_data())
+        self.assertEqual(["a", "b"], template._attrs["class"])
+        self.assertEqual({"genre": "radio"}, template._group_kinds)
+
+        # Forms which are not templates are copied into a template.
+        other = obj.clone()
+        self.assertFalse(other.fields.is_template)
+        self.assertEqual(obj.to_dict(), other.to_dict())
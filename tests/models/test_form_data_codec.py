@@ -0,0 +1,88 @@
+import unittest
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.models.form_data import FormData
+from html_form_parser.models.form_data_codec import pack_forms, unpack_forms
+from html_form_parser.models.form_data_entry import FormDataEntry
+
+
+class Test_FormDataCodec(unittest.TestCase):
+
+    def create_forms(self, count: int):
+
+        forms = []
+        for index in range(count):
+
+            form_data = FormData("form%d" % index, "/submit", "POST")
+            form_data._attrs = {"name": "form%d" % index, "class": ["login", "wide"], "data-empty": ""}
+            form_data.fields.extend([
+                FormDataEntry("user", "user%d" % index),
+                FormDataEntry("file", "/tmp/ünïcode.txt", "ünïcode.txt"),
+                FormDataEntry("submit", None, is_submitable=False),
+                FormDataEntry("size", "M", is_option=True),
+                FormDataEntry("size", "L", is_submitable=False, is_option=True),
+            ])
+
+            forms.append(form_data)
+
+        return forms
+
+    def assertFormsEqual(self, expected, result):
+
+        self.assertEqual([form_data.to_dict() for form_data in expected], [form_data.to_dict() for form_data in result])
+
+    def test_round_trip(self):
+
+        forms = self.create_forms(3)
+
+        self.assertFormsEqual(forms, unpack_forms(pack_forms(forms)))
+
+    def test_empty(self):
+
+        self.assertEqual([], unpack_forms(pack_forms([])))
+
+        form_data = FormData(None, None, None, None)
+        self.assertFormsEqual([form_data], unpack_forms(pack_forms([form_data])))
+
+    def test_large(self):
+
+        # More than 65536 distinct strings, and strings longer than 65536
+        # characters.
+        form_data = FormData("example")
+        form_data.fields.extend([FormDataEntry(str(index)) for index in range(70000)])
+        form_data.fields[0].value = "x" * 70000
+
+        result = unpack_forms(pack_forms([form_data]))[0]
+
+        self.assertEqual(70000, len(result.fields))
+        self.assertEqual(("69999", "x" * 70000), (result.fields[69999].name, result.fields[0].value))
+
+    def test_string_table(self):
+
+        # Repeated names are stored once.
+        self.assertLess(len(pack_forms(self.create_forms(100))), len(pack_forms(self.create_forms(1))) * 100 / 2)
+
+    def test_parsed_forms(self):
+
+        html_doc = "<form name=\"login\" class=\"a b\"><input name=\"foo\" value=\"bar\" /><select name=\"s\"><option>1</option></select></form>"
+
+        for parser in ("html5lib", "lxml", "stream"):
+            with self.subTest(parser=parser):
+
+                forms = HtmlFormParser().parse_forms(html_doc, parser=parser)
+
+                self.assertFormsEqual(forms, unpack_forms(pack_forms(forms)))
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            unpack_forms(b"not packed forms, not at all")
+
+        with self.assertRaises(ValueError):
+            unpack_forms(pack_forms(self.create_forms(2))[:-3])
+
+        form_data = FormData("example")
+        form_data.fields.append(FormDataEntry("foo", 1))
+
+        with self.assertRaises(TypeError):
+            pack_forms([form_data])
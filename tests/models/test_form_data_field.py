@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from html_form_parser.models import form_data_entry
@@ -248,3 +249,61 @@ class Test_FormDataField(unittest.TestCase):
         result = obj1 > obj0
 
         self.assertTrue(result)
+
+    def test_to_dict(self):
+
+        obj = form_data_entry.FormDataEntry(self.example0_name, self.example0_value, self.example0_filename, False)
+
+        self.assertEqual({
+            "name": self.example0_name,
+            "value": self.example0_value,
+            "filename": self.example0_filename,
+            "is_submitable": False,
+            "is_option": False,
+        }, obj.to_dict())
+
+    def test_from_dict(self):
+
+        obj = form_data_entry.FormDataEntry.from_dict({"name": self.example0_name, "value": self.example0_value})
+
+        self.assertEqual((self.example0_name, self.example0_value, None, True, False), (obj.name, obj.value, obj.filename, obj.is_submitable, obj.is_option))
+
+        obj = form_data_entry.FormDataEntry.from_dict({"name": self.example0_name, "is_option": True})
+        self.assertTrue(obj.is_option)
+
+    def test_pickle(self):
+
+        obj = form_data_entry.FormDataEntry(self.example0_name, self.example0_value, self.example0_filename, False)
+
+        result = pickle.loads(pickle.dumps(obj))
+
+        self.assertEqual((self.example0_name, self.example0_value, self.example0_filename, False), (result.name, result.value, result.filename, result.is_submitable))
+
+        result = pickle.loads(pickle.dumps(form_data_entry.FormDataEntry(self.example0_name, is_option=True)))
+        self.assertTrue(result.is_option)
+
+    def test_slots(self):
+
+        obj = form_data_entry.FormDataEntry(self.example0_name, self.example0_value)
+
+        self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertEqual("form-data", obj.content_type)
+
+        with self.assertRaises(AttributeError):
+            obj.other = None
+
+    def test_sort_key_changed(self):
+
+        obj0 = form_data_entry.FormDataEntry(self.example0_name, self.example0_value, self.example0_filename)
+        obj2 = form_data_entry.FormDataEntry(self.example2_name, self.example2_value, self.example2_filename)
+
+        self.assertTrue(obj2 < obj0)
+        self.assertEqual((self.example0_name, self.example0_value, self.example0_filename), obj0.sort_key)
+
+        obj2.name = "z"
+        self.assertTrue(obj2 > obj0)
+
+        obj2.name = self.example0_name
+        obj2.value = self.example0_value
+        obj2.filename = self.example0_filename
+        self.assertTrue(obj2 == obj0)
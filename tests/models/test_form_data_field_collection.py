@@ -1,7 +1,10 @@
+import copy
+import pickle
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from html_form_parser.models.form_data_entry import FormDataEntry
-from html_form_parser.models.form_data_entry_collection import FormDataEntryCollection
+from html_form_parser.models.form_data_entry_collection import FormDataEntryCollection, FormDataEntryNameView, FormDataEntrySubmitableView
 
 
 class Test_FormDataFieldCollection(unittest.TestCase):
@@ -60,3 +63,430 @@ class Test_FormDataFieldCollection(unittest.TestCase):
         obj.insert(1, self.field1)
 
         self.assertEqual(len(obj), 3)
+
+    def test_index_shared_across_threads(self):
+
+        fields = [FormDataEntry("field%d" % (index, ), str(index)) for index in range(200)]
+        obj = FormDataEntryCollection(fields)
+
+        def lookup(index):
+            return obj.index_by_name("field%d" % (index, )), obj.index_by_name_value("field%d" % (index, ), str(index))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            result = list(executor.map(lookup, range(200)))
+
+        self.assertEqual([(index, index) for index in range(200)], result)
+
+    def test_index_after_change(self):
+
+        obj = FormDataEntryCollection([self.field1, self.field2, ])
+        self.assertEqual(0, obj.index_by_name(self.field1.name))
+
+        del obj[0]
+
+        self.assertEqual(0, obj.index_by_name(self.field2.name))
+        with self.assertRaises(KeyError):
+            obj.index_by_name(self.field1.name)
+
+    def test_pickle(self):
+
+        obj = FormDataEntryCollection([self.field1, self.field2])
+        obj.index_by_name(self.field1.name)
+
+        # The indexes are not pickled.
+        data = pickle.dumps(obj)
+        self.assertNotIn(b"indexes", data)
+
+        result = pickle.loads(data)
+
+        self.assertEqual([self.field1, self.field2], list(result))
+        self.assertEqual(1, result.index_by_name(self.field2.name))
+
+    def test_index_after_entry_change(self):
+
+        field1 = FormDataEntry("example1", "test1234")
+        field2 = FormDataEntry("example2", "test5678")
+
+        obj = FormDataEntryCollection([field1, field2, ])
+        self.assertEqual(1, obj.index_by_name_value("example2", "test5678"))
+
+        field2.value = "changed"
+        self.assertEqual(1, obj.index_by_name_value("example2", "changed"))
+        with self.assertRaises(KeyError):
+            obj.index_by_name_value("example2", "test5678")
+
+        field1.name = "example2"
+        self.assertEqual(0, obj.index_by_name("example2"))
+        self.assertEqual(0, obj.index_by_name_value("example2", "test1234"))
+        with self.assertRaises(KeyError):
+            obj.index_by_name("example1")
+
+    def test_index_after_insert_and_delete(self):
+
+        fields = [FormDataEntry("field%d" % (index, ), str(index)) for index in range(10)]
+        obj = FormDataEntryCollection(fields)
+        obj.index_by_name("field0")
+
+        inserted = FormDataEntry("inserted", "")
+        obj.insert(3, inserted)
+        obj.insert(-1, FormDataEntry("field9", "again"))
+        obj.append(FormDataEntry("field0", "last"))
+
+        self.assertEqual(3, obj.index_by_name("inserted"))
+        self.assertEqual(4, obj.index_by_name("field3"))
+        self.assertEqual(10, obj.index_by_name_value("field9", "again"))
+        self.assertEqual(10, obj.index_by_name("field9"))
+        self.assertEqual(11, obj.index_by_name_value("field9", "9"))
+        self.assertEqual(12, obj.index_by_name_value("field0", "last"))
+
+        del obj[3]
+        del obj[-3]
+
+        self.assertEqual(3, obj.index_by_name("field3"))
+        self.assertEqual(9, obj.index_by_name("field9"))
+        self.assertEqual(10, obj.index_by_name_value("field0", "last"))
+
+        # A removed entry no longer changes the indexes.
+        inserted.name = "field3"
+        self.assertEqual(3, obj.index_by_name("field3"))
+
+        for name in ["field%d" % (index, ) for index in range(10)]:
+            self.assertEqual(obj[obj.index_by_name(name)].name, name)
+
+    def test_index_after_set_and_slice(self):
+
+        field1 = FormDataEntry("example1", "test1234")
+        field2 = FormDataEntry("example2", "test5678")
+
+        obj = FormDataEntryCollection([field1, field2, field1, ])
+        obj.index_by_name("example1")
+
+        obj[0] = FormDataEntry("example3", "")
+        self.assertEqual(0, obj.index_by_name("example3"))
+        self.assertEqual(2, obj.index_by_name("example1"))
+
+        # The entry is still contained at another position.
+        field1.value = "changed"
+        self.assertEqual(2, obj.index_by_name_value("example1", "changed"))
+
+        del obj[1:]
+        self.assertEqual(1, len(obj))
+        with self.assertRaises(KeyError):
+            obj.index_by_name("example1")
+
+        field1.name = "example3"
+        self.assertEqual(0, obj.index_by_name("example3"))
+
+    def test_index_shared_entry(self):
+
+        field = FormDataEntry("example1", "test1234")
+
+        obj1 = FormDataEntryCollection([self.field2, field, ])
+        obj2 = FormDataEntryCollection([field, ])
+        obj1.index_by_name("example1")
+        obj2.index_by_name("example1")
+
+        field.name = "renamed"
+
+        self.assertEqual(1, obj1.index_by_name("renamed"))
+        self.assertEqual(0, obj2.index_by_name("renamed"))
+
+        obj2.clear()
+        field.name = "renamed again"
+
+        self.assertEqual(1, obj1.index_by_name("renamed again"))
+
+    def test_index_after_sort(self):
+
+        field1 = FormDataEntry("example1", "test1234")
+        field2 = FormDataEntry("example2", "test5678")
+
+        obj = FormDataEntryCollection([field2, field1, ])
+        self.assertEqual(1, obj.index_by_name("example1"))
+
+        obj.sort()
+        self.assertEqual(0, obj.index_by_name("example1"))
+
+        obj.reverse()
+        field2.value = "changed"
+        self.assertEqual(0, obj.index_by_name_value("example2", "changed"))
+
+    def test_get_all(self):
+
+        option1 = FormDataEntry("genre", "classical", is_submitable=False, is_option=True)
+        option2 = FormDataEntry("genre", "jazz", is_submitable=False, is_option=True)
+
+        obj = FormDataEntryCollection([option1, self.field1, option2, ])
+
+        self.assertEqual([0, 2], obj.indices_by_name("genre"))
+        self.assertEqual([option1, option2], obj.get_all("genre"))
+        self.assertEqual([], obj.indices_by_name("missing"))
+        self.assertEqual([], obj.get_all("missing"))
+
+        obj.insert(0, FormDataEntry("genre", "rock", is_option=True))
+        self.assertEqual([0, 1, 3], obj.indices_by_name("genre"))
+
+        # The result is a copy.
+        obj.indices_by_name("genre").clear()
+        self.assertEqual([0, 1, 3], obj.indices_by_name("genre"))
+
+    def test_by_name(self):
+
+        option1 = FormDataEntry("genre", "classical", is_option=True)
+        option2 = FormDataEntry("genre", "jazz", is_option=True)
+
+        obj = FormDataEntryCollection([option1, self.field1, option2, ])
+        view = obj.by_name
+
+        self.assertIsInstance(view, FormDataEntryNameView)
+        self.assertEqual({"genre": [option1, option2], "example1": [self.field1]}, dict(view))
+        self.assertIn("genre", view)
+        self.assertEqual(2, len(view))
+        with self.assertRaises(KeyError):
+            view["missing"]
+
+        # The view reflects later changes.
+        option2.name = "other"
+        del obj[1]
+
+        self.assertEqual({"genre": [option1], "other": [option2]}, dict(view))
+
+    def test_submitable(self):
+
+        option1 = FormDataEntry("genre", "classical", is_submitable=False, is_option=True)
+        option2 = FormDataEntry("genre", "jazz", is_submitable=False, is_option=True)
+
+        obj = FormDataEntryCollection([option1, self.field1, option2, ])
+        view = obj.submitable()
+
+        self.assertIsInstance(view, FormDataEntrySubmitableView)
+        self.assertEqual([self.field1], list(view))
+
+        option2.is_submitable = True
+        obj.insert(0, FormDataEntry("example3", ""))
+
+        self.assertEqual(3, len(view))
+        self.assertEqual(["example3", "example1", "genre"], [field.name for field in view])
+        self.assertIs(option2, view[-1])
+        self.assertEqual([option2], view[2:])
+
+        option2.is_submitable = False
+        del obj[0]
+
+        self.assertEqual([self.field1], list(view))
+
+    def test_submitable_unchanged_value(self):
+
+        field = FormDataEntry("example1", "test1234")
+        obj = FormDataEntryCollection([field, ])
+
+        self.assertEqual(1, len(obj.submitable()))
+
+        field.value = "test1234"
+        field.is_submitable = 1
+
+        self.assertEqual([field], list(obj.submitable()))
+
+    def create_order_fields(self) -> FormDataEntryCollection:
+
+        return FormDataEntryCollection([
+            FormDataEntry("user", ""),
+            FormDataEntry("note", ""),
+            FormDataEntry("upload", ""),
+            FormDataEntry("size", "S", is_submitable=False, is_option=True),
+            FormDataEntry("size", "M", is_submitable=True, is_option=True),
+            FormDataEntry("size", "L", is_submitable=False, is_option=True),
+            FormDataEntry("extras", "cheese", is_submitable=False, is_option=True),
+            FormDataEntry("extras", "ham", is_submitable=False, is_option=True),
+        ] + [FormDataEntry("other%d" % (index, ), "") for index in range(20)])
+
+    def test_update_many(self):
+
+        obj = self.create_order_fields()
+
+        obj.update_many({"user": "john", "upload": ("photo.jpg", "/tmp/photo.jpg")}, select={"size": "L", "extras": ["cheese", "ham"]})
+
+        self.assertEqual(("user", "john"), (obj[0].name, obj[0].value))
+        self.assertEqual(("/tmp/photo.jpg", "photo.jpg"), (obj[2].value, obj[2].filename))
+        self.assertEqual(["L"], [field.value for field in obj.get_all("size") if field.is_submitable])
+        self.assertEqual(["cheese", "ham"], [field.value for field in obj.get_all("extras") if field.is_submitable])
+
+        self.assertEqual(0, obj.index_by_name_value("user", "john"))
+        self.assertEqual(5, obj.index_by_name_value("size", "L"))
+        with self.assertRaises(KeyError):
+            obj.index_by_name_value("user", "")
+
+        # Pairs are accepted as well.
+        obj.update_many([("note", "first"), ("note", "second")], select=[("extras", "ham")])
+
+        self.assertEqual(1, obj.index_by_name_value("note", "second"))
+        self.assertEqual(["ham"], [field.value for field in obj.get_all("extras") if field.is_submitable])
+        self.assertEqual(
+            ["user", "note", "upload", "size", "extras"],
+            [field.name for field in obj.submitable()][:5])
+
+    def test_update_many_all_fields(self):
+
+        obj = self.create_order_fields()
+        obj.index_by_name("user")
+
+        # Most fields change, so the indexes are created again.
+        obj.update_many({"other%d" % (index, ): str(index) for index in range(20)}, select={"size": "S"})
+
+        for index in range(20):
+            self.assertEqual(8 + index, obj.index_by_name_value("other%d" % (index, ), str(index)))
+
+        self.assertEqual(3, obj.index_by_name_value("size", "S"))
+        self.assertEqual(["user", "note", "upload", "size", "other0"], [field.name for field in obj.submitable()][:5])
+
+    def test_update_many_unknown(self):
+
+        obj = self.create_order_fields()
+
+        with self.assertRaises(KeyError):
+            obj.update_many({"user": "john", "missing": "value"})
+
+        with self.assertRaises(KeyError):
+            obj.update_many({"user": "john"}, select={"size": "XL"})
+
+        # No field is changed.
+        self.assertEqual("", obj[0].value)
+        self.assertEqual(0, obj.index_by_name_value("user", ""))
+
+    def test_update_many_shared_entry(self):
+
+        field = FormDataEntry("user", "")
+
+        obj1 = FormDataEntryCollection([field, FormDataEntry("note", "")])
+        obj2 = FormDataEntryCollection([field, ])
+        obj2.index_by_name("user")
+
+        obj1.update_many({"user": "john"})
+
+        self.assertEqual(0, obj1.index_by_name_value("user", "john"))
+        self.assertEqual(0, obj2.index_by_name_value("user", "john"))
+
+    def test_template(self):
+
+        obj = FormDataEntryCollection([FormDataEntry("example1", "test1234"), self.field2, ])
+        template = obj.template()
+
+        self.assertTrue(template.is_template)
+        self.assertFalse(obj.is_template)
+        self.assertEqual(list(obj), list(template))
+        self.assertIsNot(obj[0], template[0])
+
+        with self.assertRaises(TypeError):
+            template.append(FormDataEntry("example3", ""))
+        with self.assertRaises(TypeError):
+            del template[0]
+        with self.assertRaises(TypeError):
+            template.update_many({"example1": "changed"})
+        with self.assertRaises(TypeError):
+            template[0].value = "changed"
+
+    def test_template_entries_unchanged(self):
+
+        template = FormDataEntryCollection([FormDataEntry("example1", "test1234"), FormDataEntry("example2", "")]).template()
+        clone = template.clone()
+
+        for name, value in (("name", "changed"), ("value", "changed"), ("filename", "changed.txt"), ("is_submitable", False)):
+            with self.assertRaises(TypeError):
+                setattr(template[0], name, value)
+
+        # A failed change leaves the entry and the indexes unchanged.
+        self.assertEqual(FormDataEntry("example1", "test1234"), template[0])
+        self.assertTrue(template[0].is_submitable)
+        self.assertEqual(0, template.index_by_name_value("example1", "test1234"))
+        with self.assertRaises(KeyError):
+            template.index_by_name_value("example1", "changed")
+        self.assertEqual(2, len(template.submitable()))
+
+        self.assertEqual(FormDataEntry("example1", "test1234"), clone[0])
+        self.assertEqual(0, clone.index_by_name_value("example1", "test1234"))
+
+        # Entries of a clone may be changed.
+        clone[0].value = "changed"
+        self.assertEqual(0, clone.index_by_name_value("example1", "changed"))
+        self.assertEqual("test1234", template[0].value)
+
+    def test_clone(self):
+
+        template = self.create_order_fields().template()
+
+        clone1 = template.clone()
+        clone2 = template.clone()
+
+        self.assertFalse(clone1.is_template)
+        self.assertEqual(list(template), list(clone1))
+        self.assertIsNot(template[0], clone1[0])
+
+        clone1[0].value = "john"
+        clone1.update_many({"note": "hello"}, select={"size": "L", "extras": ["ham"]})
+        clone2[3].name = "renamed"
+
+        self.assertEqual(0, clone1.index_by_name_value("user", "john"))
+        self.assertEqual(1, clone1.index_by_name_value("note", "hello"))
+        self.assertEqual(["L"], [field.value for field in clone1.get_all("size") if field.is_submitable])
+        self.assertEqual(["ham"], [field.value for field in clone1.get_all("extras") if field.is_submitable])
+        with self.assertRaises(KeyError):
+            clone1.index_by_name_value("user", "")
+
+        self.assertEqual(3, clone2.index_by_name("renamed"))
+        self.assertEqual([4, 5], clone2.indices_by_name("size"))
+        self.assertIn("renamed", clone2.by_name)
+        self.assertEqual(["M"], [field.value for field in clone2.submitable() if field.name == "size"])
+
+        # The template, and the other clone, are unchanged.
+        for obj in (template, clone2, ):
+            self.assertEqual(0, obj.index_by_name_value("user", ""))
+            self.assertEqual(["M"], [field.value for field in obj.get_all("size") if field.is_submitable])
+
+        self.assertEqual(3, template.index_by_name("size"))
+        self.assertEqual(28, len(clone1))
+
+    def test_clone_structure_change(self):
+
+        template = self.create_order_fields().template()
+        clone = template.clone()
+
+        clone[0].value = "john"
+        clone.insert(0, FormDataEntry("first", ""))
+        del clone[-1]
+
+        self.assertEqual(28, len(clone))
+        self.assertEqual(1, clone.index_by_name_value("user", "john"))
+        self.assertEqual(0, clone.index_by_name("first"))
+
+        clone[1].value = "jane"
+        self.assertEqual(1, clone.index_by_name_value("user", "jane"))
+
+        self.assertEqual(28, len(template))
+        self.assertEqual("", template[0].value)
+
+    def test_template_pickle(self):
+
+        template = self.create_order_fields().template()
+
+        for result in (pickle.loads(pickle.dumps(template)), copy.deepcopy(template), ):
+            self.assertTrue(result.is_template)
+            self.assertEqual(list(template), list(result))
+            self.assertEqual(0, result.index_by_name_value("user", ""))
+            with self.assertRaises(TypeError):
+                result.append(FormDataEntry("example3", ""))
+            with self.assertRaises(TypeError):
+                result[0].value = "changed"
+
+            clone = result.clone()
+            clone[0].value = "john"
+            self.assertEqual("", result[0].value)
+
+    def test_clone_pickle(self):
+
+        clone = self.create_order_fields().template().clone()
+        clone[0].value = "john"
+
+        result = pickle.loads(pickle.dumps(clone))
+
+        self.assertEqual(list(clone), list(result))
+        self.assertEqual(0, result.index_by_name_value("user", "john"))
@@ -0,0 +1,194 @@
+import unittest
+
+from html_form_parser.models.form_data import FormData
+from html_form_parser.models.form_data_entry import FormDataEntry
+from html_form_parser.models.form_data_group import FormDataGroup
+
+
+class Test_FormDataGroup(unittest.TestCase):
+
+    def create_form(self, kind: str) -> FormData:
+
+        form_data = FormData("example")
+        form_data.fields.extend([
+            FormDataEntry("before", ""),
+            FormDataEntry("genre", "classical", is_submitable=True, is_option=True),
+            FormDataEntry("genre", "jazz", is_submitable=False, is_option=True),
+            FormDataEntry("genre", "rock", is_submitable=False, is_option=True),
+            FormDataEntry("after", ""),
+        ])
+        form_data.add_group("genre", kind)
+
+        return form_data
+
+    def selected(self, group: FormDataGroup) -> list:
+
+        return [field.value for field in group.selected()]
+
+    def test_groups(self):
+
+        form_data = self.create_form("radio")
+
+        self.assertEqual(["genre"], list(form_data.groups))
+        self.assertIn("genre", form_data.groups)
+        self.assertNotIn("before", form_data.groups)
+        self.assertEqual(1, len(form_data.groups))
+
+        group = form_data.groups["genre"]
+        self.assertEqual(("genre", "radio"), (group.name, group.kind))
+        self.assertFalse(group.multiple)
+        self.assertEqual(["classical", "jazz", "rock"], [field.value for field in group.options])
+
+        with self.assertRaises(KeyError):
+            form_data.groups["before"]
+
+        # The first kind recorded is kept.
+        form_data.add_group("genre", "checkbox")
+        self.assertEqual("radio", form_data.groups["genre"].kind)
+
+    def test_select_exclusive(self):
+
+        for kind in ("radio", "select", ):
+            with self.subTest(kind=kind):
+                form_data = self.create_form(kind)
+                group = form_data.groups["genre"]
+
+                self.assertEqual(["classical"], self.selected(group))
+
+                group.select("rock")
+                self.assertEqual(["rock"], self.selected(group))
+
+                group.select("rock")
+                self.assertEqual(["rock"], self.selected(group))
+
+                group.clear()
+                self.assertEqual([], self.selected(group))
+
+                with self.assertRaises(KeyError):
+                    group.select("missing")
+
+    def test_select_multiple(self):
+
+        for kind in ("checkbox", "select-multiple", ):
+            with self.subTest(kind=kind):
+                form_data = self.create_form(kind)
+                group = form_data.groups["genre"]
+
+                self.assertTrue(group.multiple)
+
+                group.select("rock")
+                self.assertEqual(["classical", "rock"], self.selected(group))
+
+                group.deselect("classical")
+                self.assertEqual(["rock"], self.selected(group))
+
+                group.clear()
+                self.assertEqual([], self.selected(group))
+
+    def test_field_changes(self):
+
+        form_data = self.create_form("select")
+        group = form_data.groups["genre"]
+        group.selected()
+
+        # Changes made to the fields directly are visible to the group.
+        form_data.fields[2].is_submitable = True
+        self.assertEqual(["classical", "jazz"], self.selected(group))
+
+        form_data.fields.insert(0, FormDataEntry("genre", "pop", is_option=True))
+        self.assertEqual(["pop", "classical", "jazz"], self.selected(group))
+
+        group.select("rock")
+        self.assertEqual(["rock"], self.selected(group))
+        self.assertEqual(4, form_data.fields.index_by_name_value("genre", "rock"))
+
+        del form_data.fields[4]
+        self.assertEqual([], self.selected(group))
+
+        form_data.fields.append(FormDataEntry("genre", "folk", is_option=True))
+        form_data.fields.sort()
+        self.assertEqual(["folk"], self.selected(group))
+
+        form_data.fields.clear()
+        self.assertEqual([], self.selected(group))
+        self.assertEqual([], group.options)
+
+    def test_replaced_fields(self):
+
+        form_data = self.create_form("radio")
+        form_data.fields = FormData.from_dict(form_data.to_dict()).fields
+
+        self.assertEqual(["classical"], self.selected(form_data.groups["genre"]))
+
+    def test_update_many(self):
+
+        form_data = self.create_form("select")
+        group = form_data.groups["genre"]
+        group.selected()
+
+        form_data.fields.update_many({"before": "value"}, select={"genre": "jazz"})
+        self.assertEqual(["jazz"], self.selected(group))
+
+        form_data.fields.update_many({"before": "changed", "after": "changed"}, select={"genre": ["classical", "rock"]})
+        self.assertEqual(["classical", "rock"], self.selected(group))
+
+    def test_other_fields(self):
+
+        # A hidden input submitted when the checkbox is not checked, and a
+        # hidden input sharing the name of a group.
+        form_data = FormData("example")
+        form_data.fields.extend([
+            FormDataEntry("agree", "0"),
+            FormDataEntry("agree", "1", is_submitable=False, is_option=True),
+            FormDataEntry("g", "f"),
+            FormDataEntry("g", "e", is_option=True),
+            FormDataEntry("g", "f", is_submitable=False, is_option=True),
+        ])
+        form_data.add_group("agree", "checkbox")
+        form_data.add_group("g", "radio")
+
+        for fields in (form_data.fields, form_data.template().clone().fields, ):
+            with self.subTest(is_clone=fields is not form_data.fields):
+                form_data.fields = fields
+                agree = form_data.groups["agree"]
+                g = form_data.groups["g"]
+
+                self.assertEqual(["1"], [field.value for field in agree.options])
+                self.assertEqual([], self.selected(agree))
+                self.assertEqual(["e"], self.selected(g))
+
+                agree.select("1")
+                agree.clear()
+                self.assertEqual([("agree", "0"), ("g", "f"), ("g", "e")], form_data.prepare_data())
+
+                g.select("f")
+                self.assertEqual(["f"], self.selected(g))
+                self.assertEqual([("agree", "0"), ("g", "f"), ("g", "f")], form_data.prepare_data())
+
+                with self.assertRaises(KeyError):
+                    agree.select("0")
+
+                fields.update_many(select={"agree": "1", "g": "e"})
+                self.assertEqual([("agree", "0"), ("agree", "1"), ("g", "f"), ("g", "e")], form_data.prepare_data())
+
+                fields.update_many(select={"agree": []})
+                self.assertEqual([("agree", "0"), ("g", "f"), ("g", "e")], form_data.prepare_data())
+
+                with self.assertRaises(KeyError):
+                    fields.update_many(select={"agree": "0"})
+
+    def test_clone(self):
+
+        template = self.create_form("radio").template()
+        template.groups["genre"].selected()
+
+        clone = template.clone()
+        group = clone.groups["genre"]
+
+        self.assertEqual(["classical"], self.selected(group))
+
+        group.select("jazz")
+        self.assertEqual(["jazz"], self.selected(group))
+        self.assertEqual(["before", "jazz", "after"], [field.name if field.name != "genre" else field.value for field in clone.fields.submitable()])
+
+        self.assertEqual(["classical"], self.selected(template.groups["genre"]))
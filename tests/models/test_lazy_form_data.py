@@ -0,0 +1,107 @@
+import pickle
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from html_form_parser.models.form_data_entry import FormDataEntry
+from html_form_parser.models.lazy_form_data import LazyFormData
+
+
+class Test_LazyFormData(unittest.TestCase):
+
+    def _create_fields(self, field_source):
+
+        self.created.append(field_source)
+
+        return [FormDataEntry(field_source, "value"), ]
+
+    def setUp(self):
+
+        self.created = []
+
+    def test_new_object(self):
+
+        obj = LazyFormData("example", action="https://www.example.com/", create_fields=self._create_fields)
+
+        self.assertEqual(obj.name, "example")
+        self.assertEqual(obj.action, "https://www.example.com/")
+        self.assertEqual(obj.method, "GET")
+        self.assertEqual(obj.enctype, "multipart/form-data")
+        self.assertEqual(len(obj.fields), 0)
+
+    def test_fields_created_on_access(self):
+
+        obj = LazyFormData(create_fields=self._create_fields)
+        obj.add_field_source("fizz")
+        obj.add_field_source("buzz")
+
+        self.assertFalse(obj.is_loaded)
+        self.assertEqual([], self.created)
+
+        self.assertEqual(["fizz", "buzz"], [field.name for field in obj.fields])
+        self.assertTrue(obj.is_loaded)
+
+        obj.fields
+        self.assertEqual(["fizz", "buzz"], self.created)
+
+    def test_add_after_access(self):
+
+        obj = LazyFormData(create_fields=self._create_fields)
+        obj.add_field_source("fizz")
+        obj.fields
+        obj.add_field_source("buzz")
+
+        self.assertEqual(["fizz", "buzz"], [field.name for field in obj.fields])
+
+    def test_prepare_data(self):
+
+        obj = LazyFormData(create_fields=self._create_fields)
+        obj.add_field_source("fizz")
+
+        self.assertEqual([("fizz", "value")], obj.prepare_data())
+
+    def test_pickle(self):
+
+        obj = LazyFormData("example", create_fields=self._create_fields)
+        obj.add_field_source("fizz")
+
+        result = pickle.loads(pickle.dumps(obj))
+
+        self.assertEqual("example", result.name)
+        self.assertEqual(["fizz"], [field.name for field in result.fields])
+
+    def test_fields_created_once_across_threads(self):
+
+        started = threading.Event()
+
+        def create_fields(field_source):
+            started.set()
+            time.sleep(0.001)
+            self.created.append(field_source)
+            return [FormDataEntry(field_source, "value"), ]
+
+        obj = LazyFormData(create_fields=create_fields)
+        for index in range(20):
+            obj.add_field_source("field%d" % (index, ))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = list(executor.map(lambda _: len(obj.fields), range(8)))
+
+        self.assertEqual([20] * 8, result)
+        self.assertEqual(20, len(self.created))
+
+    def test_load_after_pickle(self):
+
+        obj = pickle.loads(pickle.dumps(LazyFormData(create_fields=self._create_fields)))
+
+        obj.add_field_source("foo")
+        obj._create_fields = self._create_fields
+
+        self.assertEqual(["foo"], [field.name for field in obj.fields])
+
+    def test_slots(self):
+
+        obj = LazyFormData("example", create_fields=lambda source: [])
+
+        self.assertFalse(hasattr(obj, "__dict__"))
@@ -1,7 +1,7 @@
 import unittest
 
 from bs4 import BeautifulSoup
-from html_form_parser.parsers.form_element_parser import ButtonFormElementParser
+from html_form_parser.parsers.form_data_entry_parser import ButtonFormElementParser
 
 
 class Test_ButtonFormElementParser(unittest.TestCase):
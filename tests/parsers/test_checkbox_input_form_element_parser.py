@@ -1,6 +1,6 @@
 import unittest
 
-from html_form_parser.parsers.form_element_parser import SelectableInputFormElementParser
+from html_form_parser.parsers.form_data_entry_parser import SelectableInputFormElementParser
 
 
 class Test_CheckboxInputFormElementParser(unittest.TestCase):
@@ -73,3 +73,10 @@ class Test_CheckboxInputFormElementParser(unittest.TestCase):
         result = obj.suitable("example", "example")
 
         self.assertFalse(result)
+
+    def test_get_group(self):
+
+        obj = SelectableInputFormElementParser()
+
+        self.assertEqual(("test1234", "checkbox"), obj.get_group(self.TESTVALUE))
+        self.assertEqual(("test1234", "radio"), obj.get_group("<input type=\"Radio\" name=\"test1234\" />"))
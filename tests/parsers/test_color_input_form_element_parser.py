@@ -1,6 +1,6 @@
 import unittest
 
-from html_form_parser.parsers.form_element_parser import ColorInputFormElementParser
+from html_form_parser.parsers.form_data_entry_parser import ColorInputFormElementParser
 
 
 class Test_ColorInputFormElementParser(unittest.TestCase):
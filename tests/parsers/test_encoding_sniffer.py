@@ -0,0 +1,98 @@
+import codecs
+import unittest
+
+from html_form_parser.parsers.encoding_sniffer import IncrementalMarkupDecoder, normalize_encoding, prescan_encoding, sniff_encoding
+
+
+class Test_EncodingSniffer(unittest.TestCase):
+
+    TESTVALUE_META = b"<html><head><meta charset=\"shift_jis\"></head></html>"
+    TESTVALUE_HTTP_EQUIV = b"<meta http-equiv=\"Content-Type\" content=\"text/html; charset=ISO-8859-1\">"
+    TESTVALUE_COMMENT = b"<!-- <meta charset=\"koi8-r\"> --><meta charset=\"euc-jp\">"
+
+    def test_byte_order_mark(self):
+
+        self.assertEqual("utf-8", sniff_encoding(codecs.BOM_UTF8 + self.TESTVALUE_META))
+        self.assertEqual("utf-16-le", sniff_encoding(codecs.BOM_UTF16_LE + b"<\x00"))
+
+    def test_transport_encoding(self):
+
+        self.assertEqual("euc-kr", sniff_encoding(self.TESTVALUE_META, "EUC-KR"))
+
+    def test_transport_encoding_unknown(self):
+
+        self.assertEqual("shift_jis", sniff_encoding(self.TESTVALUE_META, "garbage"))
+
+    def test_meta_charset(self):
+
+        self.assertEqual("shift_jis", sniff_encoding(self.TESTVALUE_META))
+
+    def test_meta_http_equiv(self):
+
+        self.assertEqual("windows-1252", prescan_encoding(self.TESTVALUE_HTTP_EQUIV))
+
+    def test_meta_in_comment(self):
+
+        self.assertEqual("euc-jp", prescan_encoding(self.TESTVALUE_COMMENT))
+
+    def test_meta_utf16(self):
+
+        self.assertEqual("utf-8", prescan_encoding(b"<meta charset=\"utf-16\">"))
+
+    def test_undeclared(self):
+
+        self.assertEqual("utf-8", sniff_encoding("<p>café</p>".encode("utf-8")))
+        self.assertEqual("windows-1252", sniff_encoding("<p>café</p>".encode("windows-1252")))
+
+    def test_memoryview(self):
+
+        self.assertEqual("shift_jis", sniff_encoding(memoryview(self.TESTVALUE_META)))
+
+    def test_normalize_encoding(self):
+
+        self.assertEqual("windows-1252", normalize_encoding(" Latin1 "))
+        self.assertEqual("utf-8", normalize_encoding("UTF8"))
+        self.assertIsNone(normalize_encoding("garbage"))
+        self.assertIsNone(normalize_encoding(None))
+
+    def test_incremental_decoder(self):
+
+        markup = "<meta charset=\"euc-jp\"><p>日本</p>".encode("euc-jp")
+
+        obj = IncrementalMarkupDecoder()
+        result = "".join(obj.decode(markup[index:index + 3]) for index in range(0, len(markup), 3))
+        result += obj.decode(b"", True)
+
+        self.assertEqual("euc-jp", obj.encoding)
+        self.assertEqual("<meta charset=\"euc-jp\"><p>日本</p>", result)
+
+    def test_incremental_decoder_byte_order_mark(self):
+
+        obj = IncrementalMarkupDecoder()
+
+        self.assertEqual("<p>", obj.decode(codecs.BOM_UTF8 + b"<p>", True))
+
+    def test_normalize_encoding_whatwg_labels(self):
+
+        self.assertEqual("windows-1252", normalize_encoding("ANSI_X3.4-1968"))
+        self.assertEqual("cp874", normalize_encoding("tis-620"))
+        self.assertEqual("utf-16-le", normalize_encoding("utf-16"))
+        self.assertEqual("iso-8859-8", normalize_encoding("iso-8859-8-i"))
+
+    def test_normalize_encoding_codec_labels(self):
+
+        # Python codecs which are not encodings of the WHATWG standard.
+        for label in ("rot13", "hex", "zlib", "base64", "idna", "utf-32", "cp500", "punycode", "undefined", "replacement", ):
+            with self.subTest(label=label):
+                self.assertIsNone(normalize_encoding(label))
+
+    def test_meta_hostile_charset(self):
+
+        for label in ("rot13", "hex", "zlib", "base64", "idna", "cp500", "utf-7", ):
+            with self.subTest(label=label):
+                self.assertEqual("utf-8", sniff_encoding(b"<meta charset=\"%s\"><p>fizz</p>" % (label.encode("ascii"), )))
+
+    def test_meta_utf32(self):
+
+        self.assertEqual("utf-8", prescan_encoding(b"<meta charset=\"utf-32\">"))
+        self.assertEqual("utf-8", prescan_encoding(b"<meta charset=\"UTF-16BE\">"))
@@ -0,0 +1,100 @@
+import unittest
+
+from html_form_parser.parsers import form_data_entry_parser
+from html_form_parser.parsers.form_data_entry_parser_registry import FormDataEntryParserRegistry, default_registry
+from html_form_parser.parsers.parser_backend import get_parser_backend
+
+
+class Test_FormDataEntryParserRegistry(unittest.TestCase):
+
+    def test_default_parsers_match_suitable(self):
+
+        tag_names = ("button", "input", "select", "textarea", "example", )
+        type_attributes = (None, "text", "checkbox", "radio", "color", "range", "submit", "button", "reset", "search", "image", "example", )
+
+        parsers = [
+            form_data_entry_parser.SelectableInputFormElementParser,
+            form_data_entry_parser.ColorInputFormElementParser,
+            form_data_entry_parser.RangeInputFormElementParser,
+            form_data_entry_parser.SubmitInputFormElementParser,
+            form_data_entry_parser.ButtonInputFormElementParser,
+            form_data_entry_parser.ImageInputFormElementParser,
+            form_data_entry_parser.ButtonFormElementParser,
+            form_data_entry_parser.InputFormElementParser,
+            form_data_entry_parser.SelectFormElementParser,
+            form_data_entry_parser.TextareaFormElementParser,
+        ]
+
+        table = default_registry.get_table()
+
+        for tag_name in tag_names:
+            for type_attribute in type_attributes:
+                with self.subTest(tag_name=tag_name, type_attribute=type_attribute):
+
+                    expected = None
+                    for parser_class in parsers:
+                        if parser_class().suitable(tag_name, type_attribute) or parser_class().suitable(tag_name, None):
+                            expected = parser_class
+                            break
+
+                    result = table.get_parser(tag_name, type_attribute)
+
+                    self.assertEqual(expected, None if result is None else type(result))
+
+    def test_type_normalized(self):
+
+        result = default_registry.get_table().get_parser("input", " CheckBox ")
+
+        self.assertIsInstance(result, form_data_entry_parser.SelectableInputFormElementParser)
+
+    def test_table_shared(self):
+
+        obj = FormDataEntryParserRegistry.create_default()
+
+        self.assertIs(obj.get_table("html5lib"), obj.get_table(get_parser_backend("html5lib")))
+        self.assertIsNot(obj.get_table("html5lib"), obj.get_table("stream"))
+
+    def test_parser_instance_shared(self):
+
+        table = default_registry.get_table()
+
+        self.assertIs(table.get_parser("input", "checkbox"), table.get_parser("input", "radio"))
+
+    def test_register(self):
+
+        obj = FormDataEntryParserRegistry.create_default()
+        table = obj.get_table()
+
+        obj.register(form_data_entry_parser.TextareaFormElementParser, "X-Editor")
+
+        self.assertIsNot(table, obj.get_table())
+        self.assertIn("x-editor", obj.get_table().tag_names)
+        self.assertEqual(form_data_entry_parser.TextareaFormElementParser, obj.get_parser_class("x-editor"))
+
+    def test_register_replaces(self):
+
+        obj = FormDataEntryParserRegistry.create_default()
+        obj.register(form_data_entry_parser.InputFormElementParser, "input", "color")
+
+        self.assertEqual(form_data_entry_parser.InputFormElementParser, obj.get_parser_class("input", "color"))
+        self.assertEqual(form_data_entry_parser.RangeInputFormElementParser, obj.get_parser_class("input", "range"))
+
+    def test_unregister(self):
+
+        obj = FormDataEntryParserRegistry.create_default()
+        obj.unregister("input", ("checkbox", "radio", ))
+
+        self.assertEqual(form_data_entry_parser.InputFormElementParser, obj.get_parser_class("input", "checkbox"))
+
+        obj.unregister("textarea")
+
+        self.assertIsNone(obj.get_parser_class("textarea"))
+        self.assertNotIn("textarea", obj.get_table().tag_names)
+
+    def test_copy(self):
+
+        obj = default_registry.copy()
+        obj.unregister("textarea")
+
+        self.assertIsNone(obj.get_parser_class("textarea"))
+        self.assertEqual(form_data_entry_parser.TextareaFormElementParser, default_registry.get_parser_class("textarea"))
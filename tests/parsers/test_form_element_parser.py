@@ -1,7 +1,7 @@
 import unittest
 
 from bs4 import BeautifulSoup
-from html_form_parser.parsers.form_element_parser import FormDataEntryParser
+from html_form_parser.parsers.form_data_entry_parser import FormDataEntryParser
 
 
 class Test_FormElementParser(unittest.TestCase):
@@ -0,0 +1,116 @@
+import unittest
+
+from html_form_parser.parsers.form_region_scanner import extract_form_markup, find_form_regions, has_form
+
+
+class Test_FormRegionScanner(unittest.TestCase):
+
+    def _regions(self, markup: bytes):
+
+        return [markup[start:end] for start, end in find_form_regions(markup)]
+
+    def test_no_forms(self):
+
+        self.assertEqual([], self._regions(b"<html><body><p>fizz</p></body></html>"))
+
+    def test_form(self):
+
+        markup = b"<p>fizz</p><FORM action=\"/buzz\"><input name=\"foo\"></Form><p>woof</p>"
+
+        self.assertEqual([b"<FORM action=\"/buzz\"><input name=\"foo\"></Form>"], self._regions(markup))
+
+    def test_unclosed_form(self):
+
+        self.assertEqual([b"<form><input name=\"foo\">"], self._regions(b"<p><form><input name=\"foo\">"))
+
+    def test_nested_form(self):
+
+        # Parsers disagree on nested forms, the whole document is parsed.
+        markup = b"<p>fizz</p><form><form><input></form><input></form>"
+
+        self.assertEqual([markup], self._regions(markup))
+
+    def test_quoted_attributes(self):
+
+        markup = b"<form><input name=a value=\"</form>\"><input name=b></form><p>fizz</p>"
+
+        self.assertEqual([b"<form><input name=a value=\"</form>\"><input name=b></form>"], self._regions(markup))
+
+        markup = b"<div title='<form>'></div><form id=f></form><input form=f name=x value=\"a>b\"><input value=\"form=f\">"
+
+        self.assertEqual([b"<form id=f></form>", b"<input form=f name=x value=\"a>b\">"], self._regions(markup))
+
+    def test_text_elements(self):
+
+        markup = b"<form><textarea name=t></form></textarea><title><form></title><input name=b></form><p>fizz</p>"
+
+        self.assertEqual([b"<form><textarea name=t></form></textarea><title><form></title><input name=b></form>"], self._regions(markup))
+
+        markup = b"<textarea form=f><form></textarea><p>fizz</p>"
+
+        self.assertEqual([b"<textarea form=f><form></textarea>"], self._regions(markup))
+
+    def test_ambiguous_nesting(self):
+
+        for markup in (
+            b"<div><form><input name=a></div><input name=b></form>",
+            b"<table><form><tr><td><input name=a></td></tr></form></table>",
+            b"<form><div><input name=a></form><input name=b></div>",
+            b"<form><table><tr><td><input name=a></form><input name=b></td></tr></table>",
+            b"<form><svg><form></svg></form>",
+        ):
+            with self.subTest(markup=markup):
+                markup = b"<p>fizz</p>" + markup
+
+                self.assertEqual([markup], self._regions(markup))
+
+    def test_implied_end_tags(self):
+
+        markup = b"<form><p>fizz<ul><li>a<li>b</ul><select><option>1<option>2</select></form><p>buzz</p>"
+
+        self.assertEqual([b"<form><p>fizz<ul><li>a<li>b</ul><select><option>1<option>2</select></form>"], self._regions(markup))
+
+    def test_form_attribute_fields(self):
+
+        markup = b"<input name=\"a\" form=\"f\"><input name=\"b\"><select form=f><option>1</select><textarea\nform=f></form></textarea>"
+
+        self.assertEqual(
+            [b"<input name=\"a\" form=\"f\">", b"<select form=f><option>1</select>", b"<textarea\nform=f></form></textarea>"],
+            self._regions(markup))
+
+    def test_skipped_markup(self):
+
+        markup = b"<!-- <form> --><script>\"<form>\"</script><style>/* <form> */</style><form><!-- </form> --></form>"
+
+        self.assertEqual([b"<form><!-- </form> --></form>"], self._regions(markup))
+
+    def test_form_prefix(self):
+
+        self.assertEqual([], self._regions(b"<formula><input data-form=\"f\">"))
+
+    def test_str(self):
+
+        markup = "<p>é</p><form><input name=\"foo\"></form><input form=\"f\">"
+
+        self.assertEqual(
+            ["<form><input name=\"foo\"></form>", "<input form=\"f\">"],
+            [markup[start:end] for start, end in find_form_regions(markup)])
+
+    def test_has_form(self):
+
+        self.assertTrue(has_form(b"<p><FORM>"))
+        self.assertTrue(has_form("<form\naction=\"/\">"))
+        self.assertFalse(has_form(b"<formula><input name=\"foo\"><button>"))
+
+    def test_extract_form_markup(self):
+
+        markup = b"<p>fizz</p><form><input name=\"foo\"></form><p>buzz</p><input form=\"f\">"
+
+        self.assertEqual(b"<form><input name=\"foo\"></form><input form=\"f\">", extract_form_markup(markup))
+        self.assertEqual(b"<form><input name=\"foo\"></form><input form=\"f\">", extract_form_markup(memoryview(markup)))
+        self.assertEqual("<form></form>", extract_form_markup("<p><form></form>"))
+
+    def test_extract_form_markup_no_forms(self):
+
+        self.assertIsNone(extract_form_markup(b"<input name=\"foo\">"))
+        self.assertIsNone(extract_form_markup("<!-- <form> -->"))
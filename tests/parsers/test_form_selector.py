@@ -0,0 +1,117 @@
+import unittest
+
+from html_form_parser.models.form_data import FormData
+from html_form_parser.parsers.form_selector import FormSelection, FormSelector
+
+
+class Test_FormSelector(unittest.TestCase):
+
+    def _form_data(self, form_id: str = None, name: str = None, action: str = None):
+
+        form_data = FormData(name, action)
+        if form_id is not None:
+            form_data._attrs["id"] = form_id
+
+        return form_data
+
+    def test_match_id(self):
+
+        obj = FormSelector(form_id="fizz")
+
+        self.assertTrue(obj(self._form_data("fizz")))
+        self.assertFalse(obj(self._form_data("buzz")))
+        self.assertFalse(obj(self._form_data()))
+
+    def test_match_name(self):
+
+        obj = FormSelector(name="fizz")
+
+        self.assertTrue(obj(self._form_data(name="fizz")))
+        self.assertFalse(obj(self._form_data(name="buzz")))
+
+    def test_match_action(self):
+
+        obj = FormSelector(action="/login")
+
+        self.assertTrue(obj(self._form_data(action="https://www.example.com/login?next=/")))
+        self.assertFalse(obj(self._form_data(action="/search")))
+        self.assertFalse(obj(self._form_data()))
+
+    def test_match_all(self):
+
+        obj = FormSelector(name="fizz", action="/login")
+
+        self.assertTrue(obj(self._form_data(name="fizz", action="/login")))
+        self.assertFalse(obj(self._form_data(name="buzz", action="/login")))
+
+    def test_from_dict(self):
+
+        obj = FormSelector.from_dict({"id": "fizz", "action": "/login"})
+
+        self.assertEqual(("fizz", None, "/login"), obj.key)
+        self.assertEqual(FormSelector.from_dict({"name": None}).key, FormSelector.from_dict({}).key)
+
+    def test_from_dict_unknown_key(self):
+
+        with self.assertRaises(ValueError):
+            FormSelector.from_dict({"nmae": "fizz"})
+
+    def test_from_dict_invalid_value(self):
+
+        for value in (["fizz"], {"fizz": 1}, 1, ):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    FormSelector.from_dict({"name": value})
+
+
+class Test_FormSelection(unittest.TestCase):
+
+    def test_select_predicate(self):
+
+        obj = FormSelection({"name": "fizz"})
+
+        form_data1 = FormData("buzz")
+        form_data2 = FormData("fizz")
+
+        self.assertFalse(obj.select(form_data1))
+        self.assertTrue(obj.select(form_data2))
+        self.assertEqual([form_data2], obj.filter([form_data1, form_data2]))
+
+    def test_select_max_forms(self):
+
+        obj = FormSelection(max_forms=1)
+
+        self.assertFalse(obj.is_finished())
+        self.assertTrue(obj.select(FormData()))
+        self.assertFalse(obj.select(FormData()))
+        self.assertTrue(obj.is_finished())
+
+    def test_is_finished_referenced(self):
+
+        form_data = FormData()
+        form_data._attrs["id"] = "fizz"
+
+        obj = FormSelection(max_forms=1, markup=b"<form id=\"fizz\"></form><input form=\"fizz\">")
+        obj.select(form_data)
+
+        self.assertFalse(obj.is_finished())
+
+    def test_is_finished_not_referenced(self):
+
+        form_data = FormData()
+        form_data._attrs["id"] = "fizz"
+
+        obj = FormSelection(max_forms=1, markup="<form id=\"fizz\"></form><input form=\"fizzbuzz\">")
+        obj.select(form_data)
+
+        self.assertTrue(obj.is_finished())
+
+    def test_is_finished_unknown_markup(self):
+
+        form_data = FormData()
+        form_data._attrs["id"] = "fizz"
+
+        obj = FormSelection(max_forms=1)
+        obj.select(form_data)
+
+        self.assertFalse(obj.is_finished())
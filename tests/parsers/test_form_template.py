@@ -0,0 +1,165 @@
+import unittest
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.parsers.form_template import FormTemplateCache, split_markup
+from html_form_parser.parsers.parser_pool import encode_forms
+
+page = (
+    "<form action=\"/login?sid=%s\" method=\"post\">"
+    "<input type=\"hidden\" name=\"csrf\" value=\"%s\" />"
+    "<input type=\"checkbox\" name=\"remember\" value=\"yes\" checked />"
+    "<input type=\"image\" name=\"image\" value=\"%s\" />"
+    "<select name=\"plan\"><option value=\"1\">One</option><option value=\"%s\" selected>Two</option></select>"
+    "<textarea name=\"comment\">%s</textarea>"
+    "</form>"
+)
+
+
+class Test_FormTemplateCache(unittest.TestCase):
+
+    def parse(self, form_parser, values, parser="html.parser"):
+
+        markup = page % values
+
+        forms = form_parser.parse_forms(markup, parser=parser)
+        self.assertEqual(encode_forms(HtmlFormParser().parse_forms(markup, parser=parser)), encode_forms(forms))
+
+        return forms
+
+    def test_split_markup(self):
+
+        parts, values = split_markup("<form action='/a'><input value=x /><textarea>text</textarea></form>")
+
+        self.assertEqual(["/a", "x", "text"], values)
+        self.assertEqual(["<form action='", "'><input value=", " /><textarea>", "</textarea></form>"], parts)
+
+    def test_parse(self):
+
+        for parser in ("html5lib", "html.parser", "lxml", "stream"):
+            with self.subTest(parser=parser):
+
+                form_parser = HtmlFormParser()
+                form_parser.templates = FormTemplateCache()
+
+                self.parse(form_parser, ("1", "token1", "go", "2", "first"), parser)
+                forms = self.parse(form_parser, ("2", "token2", "go", "3", "second\nline"), parser)
+
+                self.assertEqual("/login?sid=2", forms[0].action)
+                self.assertEqual((1, 1, 1), tuple(form_parser.templates.stats()))
+
+    def test_parse_fixed_value(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache()
+
+        self.parse(form_parser, ("1", "token1", "go", "2", "first"))
+
+        # The image input value is not copied into its entries, and is part
+        # of the skeleton.
+        self.parse(form_parser, ("1", "token1", "other", "2", "first"))
+        self.assertEqual((0, 2), (form_parser.templates.hits, form_parser.templates.misses))
+
+    def test_parse_unsafe_value(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache()
+
+        self.parse(form_parser, ("1", "token1", "go", "2", "first"))
+        self.parse(form_parser, ("1", "a&amp;b", "go", "2", "first"))
+        self.parse(form_parser, ("1", "token1", "go", "2", "\nfirst"))
+
+        self.assertEqual((0, 3), (form_parser.templates.hits, form_parser.templates.misses))
+
+        # A template is not learned from a page with unsafe values.
+        form_parser.templates.clear()
+        self.parse(form_parser, ("1", "a&amp;b", "go", "2", "first"))
+        self.assertEqual(0, len(form_parser.templates))
+
+    def test_parse_action_whitespace(self):
+
+        for parser in ("html5lib", "html.parser", "stream"):
+            with self.subTest(parser=parser):
+
+                form_parser = HtmlFormParser()
+                form_parser.templates = FormTemplateCache()
+
+                self.parse(form_parser, ("1", "token1", "go", "2", "first"), parser)
+                forms = self.parse(form_parser, (" 2 ", "token2", "go", "3", "second"), parser)
+
+                self.assertEqual("/login?sid= 2", forms[0].action)
+                self.assertEqual((0, 2), (form_parser.templates.hits, form_parser.templates.misses))
+
+    def test_parse_structure_changed(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache()
+
+        self.parse(form_parser, ("1", "token1", "go", "2", "first"))
+
+        markup = (page % ("1", "token1", "go", "2", "first")).replace("checked ", "")
+        forms = form_parser.parse_forms(markup, parser="html.parser")
+
+        self.assertEqual(["csrf", "plan", "comment"], [entry.name for entry in forms[0].fields if entry.is_submitable])
+        self.assertEqual(0, form_parser.templates.hits)
+        self.assertEqual(2, len(form_parser.templates))
+
+    def test_parse_independent(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache()
+
+        self.parse(form_parser, ("1", "token1", "go", "2", "first"))
+
+        first = self.parse(form_parser, ("1", "token1", "go", "2", "first"))
+        first[0].fields[0].value = "changed"
+        first[0]._attrs["action"] = "changed"
+
+        second = self.parse(form_parser, ("1", "token1", "go", "2", "first"))
+        self.assertEqual("token1", second[0].fields[0].value)
+        self.assertEqual(2, form_parser.templates.hits)
+
+    def test_parse_bytes(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache()
+
+        self.parse(form_parser, ("1", "token1", "go", "2", "first"))
+
+        forms = form_parser.parse_forms((page % ("1", "tøken", "go", "2", "first")).encode("utf-8"), parser="html.parser", encoding="utf-8")
+
+        self.assertEqual("tøken", forms[0].fields[0].value)
+        self.assertEqual(1, form_parser.templates.hits)
+
+    def test_parse_outside_form_changed(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache()
+
+        for index in range(3):
+            markup = "<html><body><p>Visit %d</p>%s<p>Footer %d</p></body></html>" % (
+                index, page % (str(index), "token%d" % (index, ), "go", "2", "first"), index, )
+
+            forms = form_parser.parse_forms(markup, parser="html.parser")
+
+            self.assertEqual(encode_forms(HtmlFormParser().parse_forms(markup, parser="html.parser")), encode_forms(forms))
+
+        self.assertEqual((2, 1, 1), tuple(form_parser.templates.stats()))
+
+    def test_parse_no_forms(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache()
+
+        self.assertEqual([], form_parser.parse_forms("<p>No form</p>", parser="html.parser"))
+        self.assertEqual(0, len(form_parser.templates))
+
+    def test_max_templates(self):
+
+        form_parser = HtmlFormParser()
+        form_parser.templates = FormTemplateCache(max_templates=1)
+
+        form_parser.parse_forms("<form><input name=\"a\" value=\"1\" /></form>", parser="html.parser")
+        form_parser.parse_forms("<form><input name=\"b\" value=\"1\" /></form>", parser="html.parser")
+        form_parser.parse_forms("<form><input name=\"a\" value=\"2\" /></form>", parser="html.parser")
+
+        self.assertEqual((0, 3, 1), tuple(form_parser.templates.stats()))
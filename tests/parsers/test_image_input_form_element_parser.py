@@ -1,6 +1,6 @@
 import unittest
 
-from html_form_parser.parsers.form_element_parser import ImageInputFormElementParser
+from html_form_parser.parsers.form_data_entry_parser import ImageInputFormElementParser
 
 
 class Test_ImageInputFormElementParser(unittest.TestCase):
@@ -0,0 +1,411 @@
+import concurrent.futures
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.models.form_data import FormData
+from html_form_parser.models.form_data_entry import FormDataEntry
+from html_form_parser.parsers.form_data_entry_parser import ColorInputFormElementParser
+from html_form_parser.parsers.form_data_entry_parser_registry import default_registry
+from html_form_parser.parsers.parse_cache import ParseCache, SqliteParseCache
+from html_form_parser.parsers.parser_backend import get_parser_backend
+
+
+def create_form(name: str, value: str = "bar") -> FormData:
+
+    form_data = FormData(name, "/submit", "POST")
+    form_data._attrs = {"name": name, "class": ["login", "wide"]}
+    form_data.fields.append(FormDataEntry("foo", value, is_option=True))
+    form_data.add_group("foo", "radio")
+
+    return form_data
+
+
+class Test_ParseCache(unittest.TestCase):
+
+    def test_create_key(self):
+
+        key = ParseCache.create_key("<form></form>", "lxml", None)
+
+        self.assertEqual(key, ParseCache.create_key("<form></form>", "lxml", None))
+        self.assertNotEqual(key, ParseCache.create_key("<form></form>", "stream", None))
+        self.assertNotEqual(key, ParseCache.create_key("<form ></form>", "lxml", None))
+        self.assertNotEqual(key, ParseCache.create_key(b"<form></form>", "lxml", None))
+
+        self.assertEqual(
+            ParseCache.create_key(b"<form></form>"),
+            ParseCache.create_key(memoryview(b"<form></form>")))
+
+    def test_get_miss(self):
+
+        cache = ParseCache()
+
+        self.assertIsNone(cache.get(ParseCache.create_key("")))
+        self.assertEqual((0, 1, 0, 0, 0), tuple(cache.stats()))
+
+    def test_get_copies(self):
+
+        cache = ParseCache()
+        key = ParseCache.create_key("page")
+
+        form_data = create_form("login")
+        cache.put(key, [form_data])
+
+        # Changes to the stored forms are not cached.
+        form_data.fields[0].value = "changed"
+        form_data._attrs["class"].append("changed")
+        form_data.add_group("changed", "select")
+
+        first = cache.get(key)
+        first[0].fields[0].value = "first"
+        first[0]._attrs["class"].append("first")
+        first[0].add_group("first", "select")
+
+        second = cache.get(key)
+
+        self.assertIsNot(first[0], second[0])
+        self.assertEqual("bar", second[0].fields[0].value)
+        self.assertTrue(second[0].fields[0].is_option)
+        self.assertEqual(["login", "wide"], second[0]._attrs["class"])
+        self.assertEqual(["foo"], list(second[0].groups))
+        self.assertEqual(("login", "/submit", "POST"), (second[0].name, second[0].action, second[0].method))
+
+        self.assertEqual(2, cache.stats().hits)
+
+    def test_get_empty(self):
+
+        cache = ParseCache()
+        key = ParseCache.create_key("<p>No form</p>")
+
+        cache.put(key, [])
+
+        self.assertEqual([], cache.get(key))
+        self.assertEqual(1, cache.stats().hits)
+
+    def test_max_entries(self):
+
+        cache = ParseCache(max_entries=2)
+        keys = [ParseCache.create_key("page%d" % index) for index in range(3)]
+
+        cache.put(keys[0], [create_form("a")])
+        cache.put(keys[1], [create_form("b")])
+
+        # Using the first page makes the second the least recently used.
+        cache.get(keys[0])
+        cache.put(keys[2], [create_form("c")])
+
+        self.assertEqual(2, len(cache))
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertEqual(1, cache.stats().evictions)
+
+    def test_max_size(self):
+
+        cache = ParseCache()
+        cache.put(ParseCache.create_key("small"), [create_form("a")])
+        entry_size = cache.stats().size
+
+        cache = ParseCache(max_size=entry_size * 2 + entry_size // 2)
+        for index in range(5):
+            cache.put(ParseCache.create_key("page%d" % index), [create_form("a")])
+
+        stats = cache.stats()
+        self.assertEqual(2, stats.entries)
+        self.assertEqual(entry_size * 2, stats.size)
+        self.assertEqual(3, stats.evictions)
+
+        # A page larger than the cache is not stored.
+        cache.put(ParseCache.create_key("large"), [create_form("a", "x" * entry_size * 4)])
+
+        self.assertIsNone(cache.get(ParseCache.create_key("large")))
+        self.assertEqual(2, len(cache))
+
+    def test_put_replaces(self):
+
+        cache = ParseCache()
+        key = ParseCache.create_key("page")
+
+        cache.put(key, [create_form("a")])
+        size = cache.stats().size
+        cache.put(key, [create_form("a")])
+
+        self.assertEqual((1, size), (len(cache), cache.stats().size))
+
+    def test_clear(self):
+
+        cache = ParseCache()
+        key = ParseCache.create_key("page")
+        cache.put(key, [create_form("a")])
+
+        cache.clear()
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual((0, 0), (cache.stats().entries, cache.stats().size))
+
+    def test_threads(self):
+
+        cache = ParseCache(max_entries=8)
+        keys = [ParseCache.create_key("page%d" % index) for index in range(16)]
+
+        def run():
+            for key in keys * 20:
+                if cache.get(key) is None:
+                    cache.put(key, [create_form("a")])
+
+        threads = [threading.Thread(target=run) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertEqual(8, stats.entries)
+        self.assertEqual(16 * 20 * 4, stats.hits + stats.misses)
+
+    def test_html_form_parser(self):
+
+        html_doc = "<form name=\"login\" class=\"main\"><input name=\"foo\" value=\"bar\" /></form>"
+
+        form_parser = HtmlFormParser()
+        form_parser.cache = ParseCache()
+
+        first = form_parser.parse_forms(html_doc, parser="html.parser")
+        first[0].fields[0].value = "changed"
+
+        second = form_parser.parse_forms(html_doc, parser="html.parser")
+        self.assertEqual("bar", second[0].fields[0].value)
+        self.assertEqual("login", second[0].name)
+        self.assertEqual((1, 1), (form_parser.cache.stats().hits, form_parser.cache.stats().misses))
+
+        # Other settings are cached separately.
+        form_parser.parse_forms(html_doc, parser="stream")
+        form_parser.parse_forms(html_doc.encode("utf-8"), parser="html.parser")
+        form_parser.parse_forms(html_doc, parser="html.parser", forms={"name": "other"})
+        self.assertEqual((1, 4), (form_parser.cache.stats().hits, form_parser.cache.stats().misses))
+
+        # Invalid selections are rejected before the cache is used.
+        with self.assertRaises(ValueError):
+            form_parser.parse_forms(html_doc, parser="html.parser", forms={"nmae": "other"})
+
+        with self.assertRaises(TypeError):
+            form_parser.parse_forms(html_doc, parser="html.parser", forms={"name": ["other"]})
+
+        # Lazy parses, and selections by callable, are not cached.
+        form_parser.parse_forms(html_doc, parser="html.parser", lazy=True)
+        form_parser.parse_forms(html_doc, parser="html.parser", forms=lambda form_data: True)
+        self.assertEqual((1, 4), (form_parser.cache.stats().hits, form_parser.cache.stats().misses))
+
+        # parse() stores the cached forms.
+        form_parser.parse(html_doc, parser="html.parser")
+        self.assertEqual(1, len(form_parser.forms))
+        self.assertEqual(2, form_parser.cache.stats().hits)
+
+
+class Test_SqliteParseCache(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "forms.db")
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def test_create_key(self):
+
+        key = SqliteParseCache.create_key("<form></form>", get_parser_backend("lxml"), default_registry.get_table("lxml"), None)
+
+        self.assertIsInstance(key, str)
+
+        # Backends and field parser tables are identified by their names and
+        # parser classes.
+        registry = default_registry.copy()
+        self.assertEqual(key, SqliteParseCache.create_key("<form></form>", get_parser_backend("lxml"), registry.get_table("lxml"), None))
+
+        registry.register(ColorInputFormElementParser, "input", ("x-rating", ))
+        self.assertNotEqual(key, SqliteParseCache.create_key("<form></form>", get_parser_backend("lxml"), registry.get_table("lxml"), None))
+        self.assertNotEqual(key, SqliteParseCache.create_key(b"<form></form>", get_parser_backend("lxml"), default_registry.get_table("lxml"), None))
+
+    def test_get_put(self):
+
+        with SqliteParseCache(self.path) as cache:
+
+            self.assertIsNone(cache.get("page"))
+
+            cache.put("page", [create_form("login")])
+            cache.put("empty", [])
+
+            forms = cache.get("page")
+
+            self.assertEqual(("login", "/submit", "POST"), (forms[0].name, forms[0].action, forms[0].method))
+            self.assertEqual({"name": "login", "class": ["login", "wide"]}, forms[0]._attrs)
+            self.assertEqual([FormDataEntry("foo", "bar")], list(forms[0].fields))
+            self.assertTrue(forms[0].fields[0].is_option)
+            self.assertEqual("radio", forms[0].groups["foo"].kind)
+            self.assertEqual([], cache.get("empty"))
+
+            self.assertEqual((2, 1, 0, 2), tuple(cache.stats())[:4])
+
+    def test_persistent(self):
+
+        with SqliteParseCache(self.path) as cache:
+            cache.put("page", [create_form("login")])
+
+        with SqliteParseCache(self.path) as cache:
+            self.assertEqual("login", cache.get("page")[0].name)
+
+    def test_format_version(self):
+
+        with SqliteParseCache(self.path) as cache:
+            cache.put("page", [create_form("login")])
+
+        with mock.patch("html_form_parser.parsers.parse_cache.SQLITE_FORMAT_VERSION", 0):
+            with SqliteParseCache(self.path) as cache:
+
+                self.assertIsNone(cache.get("page"))
+                self.assertEqual(0, cache.stats().size)
+
+    def test_max_size(self):
+
+        with SqliteParseCache(self.path) as cache:
+            cache.put("page", [create_form("a")])
+            entry_size = cache.stats().size
+            cache.clear()
+
+        with SqliteParseCache(self.path, max_size=entry_size * 2 + entry_size // 2) as cache:
+
+            for index in range(5):
+                cache.put("page%d" % index, [create_form("a")])
+
+            # Reading a page makes it the most recently used.
+            cache.get("page3")
+            cache.put("page5", [create_form("a")])
+
+            stats = cache.stats()
+            self.assertEqual((2, entry_size * 2, 4), (stats.entries, stats.size, stats.evictions))
+            self.assertIsNotNone(cache.get("page3"))
+            self.assertIsNotNone(cache.get("page5"))
+
+            # A page larger than the cache is not stored.
+            cache.put("large", [create_form("a", "x" * entry_size * 4)])
+            self.assertIsNone(cache.get("large"))
+
+    def test_get_does_not_write(self):
+
+        with SqliteParseCache(self.path, timeout=0.1) as cache:
+
+            cache.put("page", [create_form("a")])
+
+            # Pages are read while another process writes.
+            with sqlite3.connect(self.path, isolation_level=None) as connection:
+
+                connection.execute("BEGIN IMMEDIATE")
+                for _ in range(3):
+                    self.assertEqual("a", cache.get("page")[0].name)
+
+                connection.execute("ROLLBACK")
+
+            self.assertEqual((3, 0), (cache.hits, cache.errors))
+
+    def test_errors(self):
+
+        html_doc = "<form name=\"login\"><input name=\"foo\" value=\"bar\" /></form>"
+
+        with SqliteParseCache(self.path, timeout=0.1) as cache:
+
+            form_parser = HtmlFormParser()
+            form_parser.cache = cache
+
+            with sqlite3.connect(self.path, isolation_level=None) as connection:
+
+                # A locked database.
+                connection.execute("BEGIN IMMEDIATE")
+                self.assertEqual("login", form_parser.parse_forms(html_doc, parser="html.parser")[0].name)
+                connection.execute("ROLLBACK")
+
+                self.assertEqual(1, cache.errors)
+
+                # A damaged database.
+                connection.execute("DROP TABLE entries")
+                self.assertEqual("login", form_parser.parse_forms(html_doc, parser="html.parser")[0].name)
+
+            connection.close()
+
+            self.assertEqual((0, 3), (cache.hits, cache.errors))
+
+    def test_put_replaces(self):
+
+        with SqliteParseCache(self.path) as cache:
+
+            cache.put("page", [create_form("a")])
+            size = cache.stats().size
+            cache.put("page", [create_form("a")])
+
+            self.assertEqual((1, size), (len(cache), cache.stats().size))
+
+    def test_clear(self):
+
+        with SqliteParseCache(self.path) as cache:
+
+            cache.put("page", [create_form("a")])
+            cache.clear()
+
+            self.assertIsNone(cache.get("page"))
+            self.assertEqual((0, 0), (cache.stats().entries, cache.stats().size))
+
+    def test_pickle(self):
+
+        with SqliteParseCache(self.path) as cache:
+            cache.put("page", [create_form("a")])
+
+            copy = pickle.loads(pickle.dumps(cache))
+
+        self.assertEqual("a", copy.get("page")[0].name)
+        copy.close()
+
+    def test_processes(self):
+
+        with SqliteParseCache(self.path) as cache:
+
+            cache.put("page", [create_form("a")])
+
+            context = multiprocessing.get_context("spawn")
+            with concurrent.futures.ProcessPoolExecutor(2, mp_context=context) as executor:
+                results = list(executor.map(_use_cache, [cache] * 4, range(4)))
+
+            self.assertEqual(["a"] * 4, results)
+            self.assertEqual(5, cache.stats().entries)
+
+    def test_html_form_parser(self):
+
+        html_doc = "<form name=\"login\" class=\"main\"><input name=\"foo\" value=\"bar\" /></form>"
+
+        with SqliteParseCache(self.path) as cache:
+
+            form_parser = HtmlFormParser()
+            form_parser.cache = cache
+
+            form_parser.parse_forms(html_doc, parser="html.parser")
+            form_parser.parse_forms(html_doc, parser="html.parser", cache_key="https://example.com/ \"etag\"")
+
+            # Pages are found by the key given, without reading the markup.
+            forms = form_parser.parse_forms("", parser="html.parser", cache_key="https://example.com/ \"etag\"")
+
+            self.assertEqual("login", forms[0].name)
+            self.assertEqual("bar", forms[0].fields[0].value)
+            self.assertEqual((1, 2, 2), (cache.stats().hits, cache.stats().misses, cache.stats().entries))
+
+
+def _use_cache(cache: SqliteParseCache, index: int) -> str:
+
+    cache.put("page%d" % index, [create_form("a")])
+
+    return cache.get("page")[0].name
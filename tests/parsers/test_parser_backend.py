@@ -0,0 +1,166 @@
+import sys
+import unittest
+from unittest import mock
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.parsers import form_data_entry_parser
+from html_form_parser.parsers.parser_backend import BeautifulSoupBackend, Html5libBackend, LxmlBackend, StreamBackend, get_parser_backend
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+
+class Test_ParserBackend(unittest.TestCase):
+
+    BACKEND_NAMES = ("html5lib", "html.parser", "lxml", "stream", )
+
+    TESTVALUE_FRAGMENTS = (
+        (form_data_entry_parser.InputFormElementParser, "<input type=\"text\" name=\"foo\" value=\"bar\" />"),
+        (form_data_entry_parser.SelectableInputFormElementParser, "<input type=\"checkbox\" name=\"foo\" checked />"),
+        (form_data_entry_parser.RangeInputFormElementParser, "<input type=\"range\" min=\"10\" max=\"20\" />"),
+        (form_data_entry_parser.ImageInputFormElementParser, "<input type=\"image\" name=\"foo\" />"),
+        (form_data_entry_parser.ButtonFormElementParser, "<button name=\"foo\" value=\"bar\">Fizz</button>"),
+        (form_data_entry_parser.SelectFormElementParser, "<select name=\"foo\"><option value=\"fizz\" /><option selected>buzz</option></select>"),
+        (form_data_entry_parser.TextareaFormElementParser, "<textarea name=\"foo\">fizz &amp; buzz</textarea>"),
+        (form_data_entry_parser.TextareaFormElementParser, "<textarea />"),
+    )
+
+    TESTVALUE_DOCUMENT = """
+        <html><body>
+        <input name="early" form="login" />
+        <form id="login" name="login" action="/login" method="post">
+            <table><tr><td><input type="text" name="user" value="fizz" /></td></tr></table>
+            <input type="checkbox" name="remember" checked>
+            <select name="lang"><option value="en" selected>English</option><option>Deutsch</option></select>
+            <textarea name="note">buzz</textarea>
+            <button name="go">Go</button>
+        </form>
+        <input name="late" form="login" />
+        <input name="orphan" />
+        </body></html>
+        """
+
+    def _entries(self, fields):
+
+        return [(field.name, field.value, field.is_submitable, ) for field in fields]
+
+    def _backends(self):
+
+        for name in self.BACKEND_NAMES:
+            if name == "lxml" and lxml is None:
+                continue
+
+            yield get_parser_backend(name)
+
+    def test_get_parser_backend_default(self):
+
+        self.assertIsInstance(get_parser_backend(), Html5libBackend)
+
+    def test_get_parser_backend_shared(self):
+
+        self.assertIs(get_parser_backend("stream"), get_parser_backend("stream"))
+        self.assertIsInstance(get_parser_backend("stream"), StreamBackend)
+        self.assertIsInstance(get_parser_backend("lxml"), LxmlBackend)
+
+    def test_get_parser_backend_object(self):
+
+        backend = StreamBackend()
+
+        self.assertIs(backend, get_parser_backend(backend))
+
+    def test_get_parser_backend_bs4_builder(self):
+
+        backend = get_parser_backend("html5")
+
+        self.assertIsInstance(backend, BeautifulSoupBackend)
+        self.assertEqual("html5", backend.name)
+
+    def test_parse_fragment(self):
+
+        for parser_class, markup in self.TESTVALUE_FRAGMENTS:
+
+            expected = self._entries(parser_class().parse(markup))
+
+            for backend in self._backends():
+                with self.subTest(backend=backend.name, markup=markup):
+                    result = self._entries(parser_class(backend).parse(markup))
+                    self.assertEqual(expected, result)
+
+    def test_parse_forms(self):
+
+        expected = HtmlFormParser(self.TESTVALUE_DOCUMENT).forms
+
+        for backend in self._backends():
+            with self.subTest(backend=backend.name):
+                result = HtmlFormParser(self.TESTVALUE_DOCUMENT, backend.name).forms
+
+                self.assertEqual(1, len(result))
+                self.assertEqual(expected[0].name, result[0].name)
+                self.assertEqual(expected[0].action, result[0].action)
+                self.assertEqual(expected[0].method, result[0].method)
+                self.assertEqual(self._entries(expected[0].fields), self._entries(result[0].fields))
+
+    TESTVALUE_MULTIPLE = """
+        <form id="first" name="first"><div><input name="a" /></div></form>
+        <form id="second" name="second"><input name="b" form="first" /><input name="c" /></form>
+        <form id="first" name="duplicate"><input name="d" /></form>
+        <input name="e" form="missing" />
+        <input name="f" form="second" />
+        """
+
+    def test_parse_forms_multiple(self):
+
+        for backend in self._backends():
+            with self.subTest(backend=backend.name):
+                result = HtmlFormParser(self.TESTVALUE_MULTIPLE, backend.name).forms
+
+                self.assertEqual(
+                    [("first", ["a", "b"]), ("second", ["c", "f"]), ("duplicate", ["d"])],
+                    [(form_data.name, [field.name for field in form_data.fields]) for form_data in result])
+
+    def test_parse_forms_nested_tree(self):
+
+        # html.parser does not drop nested "form" start tags, fields associate
+        # to the nearest containing form.
+        markup = "<form name=\"outer\"><input name=\"a\" /><form name=\"inner\"><input name=\"b\" /></form><input name=\"c\" /></form>"
+
+        result = HtmlFormParser().parse(markup, "html.parser", prefilter=False)
+
+        self.assertEqual(
+            [("outer", ["a", "c"]), ("inner", ["b"])],
+            [(form_data.name, [field.name for field in form_data.fields]) for form_data in result])
+
+    def test_parse_forms_deeply_nested(self):
+
+        markup = "<form>" + "<div>" * 2000 + "<input name=\"foo\" />" + "</div>" * 2000 + "</form><input name=\"bar\" />"
+
+        result = HtmlFormParser(markup, "html.parser").forms
+
+        self.assertEqual(["foo"], [field.name for field in result[0].fields])
+
+    def test_parse_forms_empty(self):
+
+        for markup in ("", "   \n", "<!-- comment -->", b"", ):
+            for backend in self._backends():
+                with self.subTest(backend=backend.name, markup=markup):
+                    self.assertEqual([], HtmlFormParser().parse(markup, backend.name, prefilter=False))
+
+    def test_incremental_parser_empty(self):
+
+        for chunks in ([], [""], ["<!-- comment -->"], ):
+            for backend in self._backends():
+                with self.subTest(backend=backend.name, chunks=chunks):
+                    form_parser = HtmlFormParser()
+                    for chunk in chunks:
+                        form_parser.feed(chunk, backend.name)
+
+                    self.assertEqual([], form_parser.close())
+
+    def test_lxml_missing(self):
+
+        # A module set to None in sys.modules can not be imported.
+        with mock.patch.dict(sys.modules, {"lxml": None, "lxml.etree": None, "lxml.html": None}):
+            with self.assertRaisesRegex(ImportError, r"html_form_parser\[lxml\]"):
+                HtmlFormParser().parse("<form></form>", "lxml")
@@ -0,0 +1,119 @@
+import concurrent.futures
+import multiprocessing
+import pickle
+import unittest
+from unittest import mock
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.parsers import parser_pool
+from html_form_parser.parsers.parser_pool import InterpreterParserPool, ParserPool, ThreadParserPool, create_batches, decode_forms, encode_forms
+
+
+class Test_ParserPool(unittest.TestCase):
+
+    def test_create_batches_chunksize(self):
+
+        result = list(create_batches(["a", "b", "c", "d", "e"], 2, 100))
+
+        self.assertEqual([[(0, "a"), (1, "b")], [(2, "c"), (3, "d")], [(4, "e")]], result)
+
+    def test_create_batches_size(self):
+
+        documents = ["a" * 3, "b" * 3, "c" * 20, "d" * 3, "e" * 3, "f" * 3]
+
+        result = [[index for index, markup in batch] for batch in create_batches(documents, 10, 8)]
+
+        # The large document is not batched with its neighbours.
+        self.assertEqual([[0, 1], [2], [3, 4], [5]], result)
+
+    @unittest.skipIf("forkserver" not in multiprocessing.get_all_start_methods(), "forkserver is not available")
+    def test_get_context_preloads_once(self):
+
+        context = multiprocessing.get_context("forkserver")
+
+        with mock.patch.object(parser_pool, "_forkserver_preloaded", False), \
+                mock.patch.object(context, "set_forkserver_preload") as set_forkserver_preload:
+            parser_pool._get_context()
+            parser_pool._get_context()
+
+        set_forkserver_preload.assert_called_once_with(parser_pool._preload_modules)
+
+    def test_create_batches_empty(self):
+
+        self.assertEqual([], list(create_batches([], 2, 100)))
+
+    def test_parse_many(self):
+
+        documents = [
+            "<form name=\"doc%d\"><input name=\"foo\" value=\"%d\" /></form>" % (index, index, )
+            for index in range(40)
+        ]
+        documents[7] = documents[7].encode("utf-8")
+        documents[9] = "<p>No form</p>"
+
+        with ParserPool(HtmlFormParser, workers=2, parser="stream") as pool:
+
+            for ordered in (True, False, ):
+                with self.subTest(ordered=ordered):
+                    result = list(pool.parse_many(iter(documents), chunksize=3, ordered=ordered))
+
+                    if ordered:
+                        self.assertEqual(list(range(40)), [index for index, forms in result])
+
+                    result = dict(result)
+
+                    self.assertEqual(40, len(result))
+                    self.assertEqual([], result[9])
+                    self.assertEqual("doc7", result[7][0].name)
+                    self.assertEqual("31", result[31][0].fields[0].value)
+
+    def test_thread_pool_parse_many(self):
+
+        documents = [
+            "<form name=\"doc%d\"><input name=\"foo\" value=\"%d\" /></form>" % (index, index, )
+            for index in range(40)
+        ]
+
+        form_parser = HtmlFormParser()
+
+        with ThreadParserPool(form_parser, workers=4, parser="html5lib") as pool:
+            result = list(pool.parse_many(documents, chunksize=3, ordered=True))
+
+        self.assertEqual(list(range(40)), [index for index, forms in result])
+        self.assertEqual(["%d" % (index, ) for index in range(40)], [forms[0].fields[0].value for index, forms in result])
+        self.assertEqual([], form_parser.forms)
+
+    def test_encode_forms(self):
+
+        forms = HtmlFormParser().parse_forms(
+            "<form id=\"fizz\" name=\"buzz\" action=\"/go\" method=\"post\">"
+            "<input name=\"foo\" value=\"bar\" /><input type=\"checkbox\" name=\"baz\" /></form>", "stream")
+
+        result = decode_forms(pickle.loads(pickle.dumps(encode_forms(forms))))
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(("buzz", "/go", "POST", "multipart/form-data", ), (result[0].name, result[0].action, result[0].method, result[0].enctype, ))
+        self.assertEqual("fizz", result[0]._attrs["id"])
+        self.assertEqual(
+            [(field.name, field.value, field.filename, field.is_submitable, ) for field in forms[0].fields],
+            [(field.name, field.value, field.filename, field.is_submitable, ) for field in result[0].fields])
+        self.assertEqual(0, result[0].fields.index_by_name("foo"))
+
+    @unittest.skipIf(hasattr(concurrent.futures, "InterpreterPoolExecutor"), "Subinterpreters are available.")
+    def test_interpreter_pool_unavailable(self):
+
+        with self.assertRaises(RuntimeError):
+            InterpreterParserPool(HtmlFormParser, workers=1)
+
+    @unittest.skipUnless(hasattr(concurrent.futures, "InterpreterPoolExecutor"), "Requires subinterpreters.")
+    def test_interpreter_pool_parse_many(self):
+
+        documents = [
+            "<form name=\"doc%d\"><input name=\"foo\" value=\"%d\" /></form>" % (index, index, )
+            for index in range(20)
+        ]
+
+        with InterpreterParserPool(HtmlFormParser, workers=2, parser="stream") as pool:
+            result = list(pool.parse_many(documents, chunksize=3, ordered=True))
+
+        self.assertEqual(["%d" % (index, ) for index in range(20)], [forms[0].fields[0].value for index, forms in result])
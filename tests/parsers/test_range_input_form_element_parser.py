@@ -1,6 +1,6 @@
 import unittest
 
-from html_form_parser.parsers.form_element_parser import RangeInputFormElementParser
+from html_form_parser.parsers.form_data_entry_parser import RangeInputFormElementParser
 
 
 class Test_RangeInputFormElementParser(unittest.TestCase):
@@ -1,6 +1,6 @@
 import unittest
 
-from html_form_parser.parsers.form_element_parser import SelectFormElementParser
+from html_form_parser.parsers.form_data_entry_parser import SelectFormElementParser
 
 
 class Test_SelectFormElementParser(unittest.TestCase):
@@ -88,3 +88,10 @@ class Test_SelectFormElementParser(unittest.TestCase):
         result = obj.suitable("select", "example")
 
         self.assertTrue(result)
+
+    def test_get_group(self):
+
+        obj = SelectFormElementParser()
+
+        self.assertEqual(("foo", "select"), obj.get_group(self.TESTVALUE))
+        self.assertEqual(("foo", "select-multiple"), obj.get_group("<select name=\"foo\" multiple><option>fizz</option></select>"))
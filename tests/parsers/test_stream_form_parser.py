@@ -0,0 +1,146 @@
+import unittest
+
+from html_form_parser import HtmlFormParser
+from html_form_parser.parsers.form_data_entry_parser import SelectFormElementParser, TextareaFormElementParser
+from html_form_parser.parsers.stream_form_parser import FormElement, StreamFormParser
+
+
+class Test_StreamFormParser(unittest.TestCase):
+
+    TESTVALUE = """
+        <html><body>
+        <form name="login" action=" /login " method="post">
+            <input type="text" name="user" value="fizz" />
+            <input type="password" name="pass">
+            <input type="checkbox" name="remember" checked>
+            <input type="image" name="go">
+            <select name="lang">
+                <option value="en" selected>English
+                <option>Deutsch
+            </select>
+            <textarea name="note">
+buzz &amp; woof</textarea>
+            <button type="submit" name="submit" value="1">Go</button>
+        </form>
+        </body></html>
+        """
+
+    TESTVALUE_MULTIPLE = """
+        <input name="early" form="second" />
+        <form id="first"><input name="a" /></form>
+        <form id="second"><input name="b" /></form>
+        <input name="late" form="first" />
+        <input name="orphan" />
+        """
+
+    def _parse(self, markup: str):
+
+        return HtmlFormParser().parse(markup, HtmlFormParser.STREAM_PARSER)
+
+    def _entries(self, form_data):
+
+        return [(field.name, field.value, field.is_submitable, ) for field in form_data.fields]
+
+    def test_matches_html5lib(self):
+
+        expected = HtmlFormParser().parse(self.TESTVALUE)
+        result = self._parse(self.TESTVALUE)
+
+        self.assertEqual(len(expected), len(result))
+        self.assertEqual(expected[0].name, result[0].name)
+        self.assertEqual(expected[0].action, result[0].action)
+        self.assertEqual(expected[0].method, result[0].method)
+        self.assertEqual(self._entries(expected[0]), self._entries(result[0]))
+
+    TESTVALUE_TREE_CONSTRUCTION = (
+        # A form left open is closed with the element containing it.
+        "<div><form><input name=\"a\"></div><input name=\"b\">",
+        "<div><div><form><input name=\"a\"></div><input name=\"b\"></div><input name=\"c\">",
+        "<ul><li><form><input name=\"a\"><li><input name=\"b\"></ul>",
+        "<table><tr><td><form><input name=\"a\"><td><input name=\"b\"></table><input name=\"c\">",
+        # Another form is ignored until the form end tag.
+        "<div><form><input name=\"a\"></div><form name=\"second\"><input name=\"c\"></form>",
+        # A form started within a table is empty.
+        "<table><form><tr><td><input name=\"a\">",
+        "<table><form><input type=\"hidden\" name=\"h\"><tr><td><input name=\"a\"></table><input name=\"b\"></form>",
+        "<table><tr><td><table><form><input name=\"a\"></table><input name=\"b\"></table>",
+        # Elements left open within a form remain in it.
+        "<form><div><input name=\"a\"></form><input name=\"b\"></div><input name=\"c\">",
+        "<form><table><tr><td><input name=\"a\"></form><input name=\"b\"></table><input name=\"c\">",
+        # End tags which do not close a form.
+        "<span><form><input name=\"a\"></span><input name=\"b\">",
+        "<p><form><input name=\"a\"></p><input name=\"b\">",
+        "<div><table><tr><td><form><input name=\"a\"></div><input name=\"b\"></table><input name=\"c\">",
+    )
+
+    def test_tree_construction_matches_html5lib(self):
+
+        for markup in self.TESTVALUE_TREE_CONSTRUCTION:
+            with self.subTest(markup=markup):
+                expected = HtmlFormParser().parse(markup)
+                result = self._parse(markup)
+
+                self.assertEqual([self._entries(form_data) for form_data in expected], [self._entries(form_data) for form_data in result])
+
+    def test_form_attribute_association(self):
+
+        result = self._parse(self.TESTVALUE_MULTIPLE)
+
+        self.assertEqual(2, len(result))
+        self.assertEqual([("a", "", True), ("late", "", True)], self._entries(result[0]))
+        self.assertEqual([("early", "", True), ("b", "", True)], self._entries(result[1]))
+
+    def test_nested_form_ignored(self):
+
+        result = self._parse("<form name=\"outer\"><form name=\"inner\"><input name=\"a\" /></form><input name=\"b\" />")
+
+        self.assertEqual(1, len(result))
+        self.assertEqual("outer", result[0].name)
+        self.assertEqual([("a", "", True)], self._entries(result[0]))
+
+    def test_unclosed_form(self):
+
+        result = self._parse("<form><select name=\"foo\"><option>fizz<option selected>buzz")
+
+        self.assertEqual(1, len(result))
+        self.assertEqual([("foo", "fizz", False), ("foo", "buzz", True)], self._entries(result[0]))
+
+    def test_select_closed_by_input(self):
+
+        result = self._parse("<form><select name=\"foo\"><option>fizz<input name=\"bar\" /></form>")
+
+        self.assertEqual([("foo", "fizz", False), ("bar", "", True)], self._entries(result[0]))
+
+    def test_textarea_markup(self):
+
+        result = self._parse("<form><textarea name=\"foo\"><input name=\"bar\" /></textarea></form>")
+
+        self.assertEqual([("foo", "<input name=\"bar\" />", True)], self._entries(result[0]))
+
+    def test_forms_emitted_while_feeding(self):
+
+        stream_parser = StreamFormParser(HtmlFormParser()._create_form_data, lambda form_data, element: None)
+        stream_parser.feed("<form name=\"fizz\" action=\"/buzz\"><input name=\"foo\"")
+
+        self.assertEqual(1, len(stream_parser.forms))
+        self.assertEqual("fizz", stream_parser.forms[0].name)
+
+    def test_element_with_field_parser(self):
+
+        select = FormElement("select", {"name": "foo"})
+        option = FormElement("option", {"selected": ""})
+        option._text.append("fizz")
+        select.contents.append(option)
+
+        elements = SelectFormElementParser().parse(select)
+
+        self.assertEqual(1, len(elements))
+        self.assertEqual("foo", elements[0].name)
+        self.assertEqual("fizz", elements[0].value)
+        self.assertTrue(elements[0].is_submitable)
+
+    def test_element_default_value(self):
+
+        elements = TextareaFormElementParser().parse(FormElement("textarea", {"name": "foo"}))
+
+        self.assertEqual("", elements[0].value)
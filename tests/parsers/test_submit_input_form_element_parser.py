@@ -1,6 +1,6 @@
 import unittest
 
-from html_form_parser.parsers.form_element_parser import SubmitInputFormElementParser
+from html_form_parser.parsers.form_data_entry_parser import SubmitInputFormElementParser
 
 
 class Test_SubmitInputFormElementParser(unittest.TestCase):
@@ -0,0 +1,625 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from html_form_parser import HtmlFormParser, parse_forms
+from html_form_parser.parsers.form_data_entry_parser import FormDataEntryParser
+from html_form_parser.parsers.form_data_entry_parser_registry import default_registry
+from html_form_parser.parsers.stream_form_parser import FormElement
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+
+class Test_HtmlFormParser(unittest.TestCase):
+
+    TESTVALUE = """
+        <html><body>
+        <input name="early" form="login" />
+        <form id="login" name="login" action="/login" method="post">
+            <input type="text" name="user" value="fizz" />
+            <select name="lang"><option value="en" selected>English</option><option>Deutsch</option></select>
+            <textarea name="note">buzz &amp; woof</textarea>
+        </form>
+        <input name="late" form="login" />
+        </body></html>
+        """
+
+    def _entries(self, fields):
+
+        return [(field.name, field.value, field.is_submitable, ) for field in fields]
+
+    def _feed(self, obj: HtmlFormParser, markup: str, chunk_size: int, parser: str):
+
+        for index in range(0, len(markup), chunk_size):
+            obj.feed(markup[index:index + chunk_size], parser)
+
+        return obj.close()
+
+    def test_feed(self):
+
+        expected = HtmlFormParser(self.TESTVALUE, "stream").forms
+
+        for parser in ("html5lib", "lxml", "stream", ):
+            if parser == "lxml" and lxml is None:
+                continue
+
+            with self.subTest(parser=parser):
+                result = self._feed(HtmlFormParser(), self.TESTVALUE, 7, parser)
+
+                self.assertEqual(1, len(result))
+                self.assertEqual("login", result[0].name)
+                self.assertEqual(self._entries(expected[0].fields), self._entries(result[0].fields))
+
+    def test_feed_form_attribute_before_form(self):
+
+        result = self._feed(HtmlFormParser(), self.TESTVALUE, 3, "stream")
+
+        self.assertEqual("early", result[0].fields[0].name)
+        self.assertEqual("late", result[0].fields[-1].name)
+
+    def test_feed_emits_forms_early(self):
+
+        obj = HtmlFormParser()
+
+        new_forms = obj.feed("<html><body><form name=\"fizz\"><input name=\"bu", "stream")
+
+        self.assertEqual(1, len(new_forms))
+        self.assertEqual("fizz", new_forms[0].name)
+        self.assertEqual(0, len(new_forms[0].fields))
+
+        self.assertEqual([], obj.feed("zz\" /></form><p>", "stream"))
+        self.assertEqual("buzz", new_forms[0].fields[0].name)
+
+        self.assertEqual(new_forms, obj.close())
+
+    def test_feed_buffered_until_close(self):
+
+        obj = HtmlFormParser()
+
+        self.assertEqual([], obj.feed("<form><input name=\"buzz\" /></form>"))
+        self.assertEqual(1, len(obj.close()))
+
+    def test_close_without_feed(self):
+
+        self.assertEqual([], HtmlFormParser().close())
+
+    def test_parse_stream(self):
+
+        result = HtmlFormParser().parse_stream(io.StringIO(self.TESTVALUE), 16, "stream")
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(
+            ["early", "user", "lang", "lang", "note", "late"],
+            [field.name for field in result[0].fields])
+
+    def test_parse_bytes(self):
+
+        markup = "<meta charset=\"windows-1251\"><form><input name=\"имя\" value=\"тест\" /></form>".encode("windows-1251")
+
+        for parser in ("html5lib", "html.parser", "lxml", "stream", ):
+            if parser == "lxml" and lxml is None:
+                continue
+
+            for value in (markup, bytearray(markup), memoryview(markup), ):
+                with self.subTest(parser=parser, type=type(value)):
+                    result = HtmlFormParser(value, parser).forms
+
+                    self.assertEqual(1, len(result))
+                    self.assertEqual([("имя", "тест", True)], self._entries(result[0].fields))
+
+    def test_parse_bytes_transport_encoding(self):
+
+        markup = "<form><input name=\"foo\" value=\"café\" /></form>".encode("iso-8859-15")
+
+        result = HtmlFormParser(markup, "stream", "iso-8859-15").forms
+
+        self.assertEqual("café", result[0].fields[0].value)
+
+    def test_parse_bytes_hostile_charset(self):
+
+        for label in ("rot13", "hex", "zlib", "base64", "idna", "utf-32", "cp500", ):
+            markup = ("<meta charset=\"%s\"><form><input name=\"foo\" value=\"café\" /></form>" % (label, )).encode("utf-8")
+
+            for parser in ("html5lib", "lxml", "stream", ):
+                if parser == "lxml" and lxml is None:
+                    continue
+
+                with self.subTest(parser=parser, label=label):
+                    result = HtmlFormParser(markup, parser).forms
+
+                    self.assertEqual("café", result[0].fields[0].value)
+
+    def test_parse_bytes_mac_cyrillic(self):
+
+        markup = "<meta charset=\"x-mac-cyrillic\"><form><input name=\"foo\" value=\"тест\" /></form>".encode("mac-cyrillic")
+
+        for parser in ("html5lib", "lxml", "stream", ):
+            if parser == "lxml" and lxml is None:
+                continue
+
+            with self.subTest(parser=parser):
+                self.assertEqual("тест", HtmlFormParser(markup, parser).forms[0].fields[0].value)
+
+    def test_parse_bytes_utf16(self):
+
+        markup = "﻿<form><input name=\"foo\" value=\"é\" /></form>".encode("utf-16-le")
+
+        for parser in ("html5lib", "lxml", "stream", ):
+            if parser == "lxml" and lxml is None:
+                continue
+
+            with self.subTest(parser=parser):
+                result = HtmlFormParser(markup, parser).forms
+
+                self.assertEqual("é", result[0].fields[0].value)
+
+    def test_parse_stream_bytes(self):
+
+        markup = ("<meta charset=\"euc-jp\">" + self.TESTVALUE.replace("fizz", "日本")).encode("euc-jp")
+
+        result = HtmlFormParser().parse_stream(io.BytesIO(markup), 5, "stream")
+
+        self.assertEqual("日本", result[0].fields[1].value)
+
+    def _write_files(self, directory: str, contents: list):
+
+        paths = []
+        for index, content in enumerate(contents):
+            path = os.path.join(directory, "%d.html" % (index, ))
+            with open(path, "wb") as fh:
+                fh.write(content)
+
+            paths.append(path)
+
+        return paths
+
+    def test_parse_file(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = self._write_files(directory, [self.TESTVALUE.encode("utf-8"), ])[0]
+
+            for parser in ("html5lib", "stream", ):
+                with self.subTest(parser=parser):
+                    result = HtmlFormParser().parse_file(path, parser)
+
+                    self.assertEqual(1, len(result))
+                    self.assertEqual(6, len(result[0].fields))
+
+    def test_parse_file_empty(self):
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = self._write_files(directory, [b"", ])[0]
+
+            for parser in ("html5lib", "lxml", "stream", ):
+                if parser == "lxml" and lxml is None:
+                    continue
+
+                for prefilter in (True, False, ):
+                    with self.subTest(parser=parser, prefilter=prefilter):
+                        self.assertEqual([], HtmlFormParser().parse_file(path, parser, prefilter=prefilter))
+
+    def test_parse_files(self):
+
+        contents = [self.TESTVALUE.encode("utf-8"), b"<p>fizz</p>", b"<form></form><form></form>", ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self._write_files(directory, contents)
+
+            obj = HtmlFormParser()
+            result = list(obj.parse_files(paths, "stream"))
+
+            self.assertEqual(paths, [path for path, forms in result])
+            self.assertEqual([1, 0, 2], [len(forms) for path, forms in result])
+            self.assertEqual([], obj.forms)
+
+    def test_prefilter(self):
+
+        for parser in ("html5lib", "stream", ):
+            with self.subTest(parser=parser):
+                expected = HtmlFormParser().parse(self.TESTVALUE, parser, prefilter=False)
+                result = HtmlFormParser().parse(self.TESTVALUE, parser, prefilter=True)
+
+                self.assertEqual(self._entries(expected[0].fields), self._entries(result[0].fields))
+
+    TESTVALUE_PREFILTER = (
+        "<form><input name=a value=\"</form>\"><input name=b></form>",
+        "<form id=f></form><input form=f name=x value=\"a>b\">",
+        "<form><textarea name=t>fizz</form>buzz</textarea><input name=b></form>",
+        "<div><form><input name=a></div><input name=b></form>",
+        "<table><form><tr><td><input name=a></td></tr></form></table>",
+        "<form><div><input name=a></form><input name=b></div>",
+        "<div title=\"<form>\"><input name=a></div>",
+    )
+
+    def test_prefilter_matches_whole_page(self):
+
+        for markup in self.TESTVALUE_PREFILTER:
+            for parser in ("html5lib", "html.parser", "lxml", "stream", ):
+                if parser == "lxml" and lxml is None:
+                    continue
+
+                with self.subTest(parser=parser, markup=markup):
+                    expected = HtmlFormParser().parse("<p>fizz</p>" + markup, parser, prefilter=False)
+                    result = HtmlFormParser().parse("<p>fizz</p>" + markup, parser, prefilter=True)
+
+                    self.assertEqual(
+                        [self._entries(form_data.fields) for form_data in expected],
+                        [self._entries(form_data.fields) for form_data in result])
+
+    def test_prefilter_default(self):
+
+        markup = "<form><input name=a value=\"</form>\"><input name=b></form>"
+
+        self.assertEqual(["a", "b"], [field.name for field in HtmlFormParser().parse(markup, "stream")[0].fields])
+
+    def test_prefilter_no_forms(self):
+
+        markup = "<html><body><!-- <form> --><input name=\"foo\" /></body></html>"
+
+        self.assertEqual([], HtmlFormParser().parse(markup, prefilter=True))
+        self.assertEqual([], HtmlFormParser().parse(markup.encode("utf-8"), prefilter=True))
+
+    def test_prefilter_utf16(self):
+
+        markup = ("<p>fizz</p>" + self.TESTVALUE).encode("utf-16")
+
+        result = HtmlFormParser().parse(markup, "stream", prefilter=True)
+
+        self.assertEqual(6, len(result[0].fields))
+
+    def test_parse_lazy(self):
+
+        markup = self.TESTVALUE + "<form name=\"other\"><input name=\"buzz\" /></form>"
+
+        for parser in ("html5lib", "stream", ):
+            with self.subTest(parser=parser):
+                expected = HtmlFormParser(markup, parser).forms
+                result = HtmlFormParser().parse(markup, parser, lazy=True)
+
+                self.assertEqual(2, len(result))
+                self.assertEqual("login", result[0].name)
+                self.assertEqual("POST", result[0].method)
+                self.assertFalse(result[0].is_loaded)
+                self.assertFalse(result[1].is_loaded)
+
+                self.assertEqual(self._entries(expected[0].fields), self._entries(result[0].fields))
+                self.assertTrue(result[0].is_loaded)
+                self.assertFalse(result[1].is_loaded)
+
+    def test_parse_lazy_detached(self):
+
+        markup = self.TESTVALUE + "<form><select name=\"s\"><optgroup><option selected>a</option></optgroup><option value=\"b\">B</option></select><textarea name=\"t\">\nfizz</textarea></form>"
+
+        for parser in ("html5lib", "html.parser", "lxml", ):
+            if parser == "lxml" and lxml is None:
+                continue
+
+            with self.subTest(parser=parser):
+                expected = HtmlFormParser(markup, parser).forms
+                result = HtmlFormParser().parse(markup, parser, lazy=True)
+
+                # The parsed elements are copied, so the document tree is
+                # not retained by the forms.
+                for form_data in result:
+                    for field_source in form_data._field_sources:
+                        self.assertIsInstance(field_source, FormElement)
+                        self.assertIs(dict, type(field_source.attrs))
+
+                self.assertEqual(
+                    [self._entries(form_data.fields) for form_data in expected],
+                    [self._entries(form_data.fields) for form_data in result])
+
+    TESTVALUE_GROUPS = """
+        <form name="order">
+            <select name="size"><option>S</option><option selected>M</option><option>L</option></select>
+            <select name="extras" multiple><option selected>cheese</option><option>ham</option></select>
+            <input type="radio" name="delivery" value="pickup" checked />
+            <input type="radio" name="delivery" value="courier" />
+            <input type="checkbox" name="terms" value="yes" />
+            <input type="text" name="note" />
+        </form>
+        """
+
+    def test_parse_groups(self):
+
+        for parser in ("html5lib", "html.parser", "stream", ):
+            for lazy in (False, True, ):
+                with self.subTest(parser=parser, lazy=lazy):
+                    form_data = HtmlFormParser().parse(self.TESTVALUE_GROUPS, parser, lazy=lazy)[0]
+
+                    self.assertEqual(
+                        {"size": "select", "extras": "select-multiple", "delivery": "radio", "terms": "checkbox"},
+                        {name: group.kind for name, group in form_data.groups.items()})
+
+                    size = form_data.groups["size"]
+                    self.assertEqual(["M"], [field.value for field in size.selected()])
+
+                    size.select("L")
+                    self.assertEqual(["L"], [field.value for field in size.selected()])
+
+                    form_data.groups["extras"].select("ham")
+                    form_data.groups["delivery"].select("courier")
+
+                    self.assertEqual(
+                        [("size", "L"), ("extras", "cheese"), ("extras", "ham"), ("delivery", "courier"), ("note", "")],
+                        form_data.prepare_data())
+
+    TESTVALUE_GROUP_DEFAULTS = """
+        <form>
+            <input type="hidden" name="agree" value="0" />
+            <input type="checkbox" name="agree" value="1" checked />
+            <input type="hidden" name="size" value="M" />
+            <select name="size"><option>S</option><option>M</option></select>
+        </form>
+        """
+
+    def test_parse_groups_other_fields(self):
+
+        for parser in ("html5lib", "html.parser", "lxml", "stream", ):
+            for lazy in (False, True, ):
+                with self.subTest(parser=parser, lazy=lazy):
+                    form_data = HtmlFormParser().parse(self.TESTVALUE_GROUP_DEFAULTS, parser, lazy=lazy)[0]
+
+                    self.assertEqual(["S", "M"], [field.value for field in form_data.groups["size"].options])
+
+                    # The hidden inputs are not members of the groups.
+                    form_data.groups["agree"].clear()
+                    form_data.groups["size"].select("S")
+                    self.assertEqual([("agree", "0"), ("size", "M"), ("size", "S")], form_data.prepare_data())
+
+                    form_data.fields.update_many(select={"agree": "1", "size": []})
+                    self.assertEqual([("agree", "0"), ("agree", "1"), ("size", "M")], form_data.prepare_data())
+
+    TESTVALUE_SELECTION = """
+        <form name="search" action="/search"><input name="q" /></form>
+        <form id="login" name="login" action="/login"><input name="user" /></form>
+        <form name="newsletter" action="/subscribe"><input name="email" /></form>
+        <input name="late" form="login" />
+        """
+
+    def test_parse_forms_selector(self):
+
+        for parser in ("html5lib", "stream", ):
+            with self.subTest(parser=parser):
+                result = HtmlFormParser().parse(self.TESTVALUE_SELECTION, parser, forms={"action": "/log"})
+
+                self.assertEqual(["login"], [form_data.name for form_data in result])
+
+        result = HtmlFormParser().parse(self.TESTVALUE_SELECTION, "stream", forms=lambda form_data: form_data.name != "login")
+
+        self.assertEqual(["search", "newsletter"], [form_data.name for form_data in result])
+
+    def test_parse_first_only(self):
+
+        result = HtmlFormParser().parse(self.TESTVALUE_SELECTION, "stream", first_only=True)
+
+        self.assertEqual(["search"], [form_data.name for form_data in result])
+        self.assertEqual(["q"], [field.name for field in result[0].fields])
+
+    def test_parse_max_forms(self):
+
+        result = HtmlFormParser().parse(self.TESTVALUE_SELECTION, "stream", max_forms=2)
+
+        self.assertEqual(["search", "login"], [form_data.name for form_data in result])
+
+    def test_parse_stops_early(self):
+
+        class CountingHtmlFormParser(HtmlFormParser):
+
+            created = 0
+
+            def _create_form_data(self, parsed_form, form_data=None):
+                self.created += 1
+                return super()._create_form_data(parsed_form, form_data)
+
+        obj = CountingHtmlFormParser()
+        obj.parse(self.TESTVALUE_SELECTION, "stream", first_only=True)
+
+        self.assertEqual(1, obj.created)
+
+    def test_parse_waits_for_form_attribute(self):
+
+        result = HtmlFormParser().parse(self.TESTVALUE_SELECTION, "stream", forms={"id": "login"}, first_only=True)
+
+        self.assertEqual(["user", "late"], [field.name for field in result[0].fields])
+
+    def test_parse_waits_for_form_attribute_utf16(self):
+
+        markup = self.TESTVALUE_SELECTION.encode("utf-16")
+
+        for parser in ("html5lib", "stream", ):
+            with self.subTest(parser=parser):
+                result = HtmlFormParser().parse(markup, parser, forms={"id": "login"}, first_only=True)
+
+                self.assertEqual(["user", "late"], [field.name for field in result[0].fields])
+
+    def test_parse_waits_for_form_attribute_character_reference(self):
+
+        markup = self.TESTVALUE_SELECTION.replace('form="login"', 'form="&#108;ogin"')
+
+        result = HtmlFormParser().parse(markup, "stream", forms={"id": "login"}, first_only=True)
+
+        self.assertEqual(["user", "late"], [field.name for field in result[0].fields])
+
+    def test_custom_field_parser(self):
+
+        class RatingFormElementParser(FormDataEntryParser):
+            _default_value = "3"
+
+        class RatingHtmlFormParser(HtmlFormParser):
+            field_parser_registry = default_registry.copy()
+
+        RatingHtmlFormParser.field_parser_registry.register(RatingFormElementParser, "x-rating")
+
+        markup = "<form><x-rating name=\"stars\"></x-rating><input name=\"foo\" /></form><x-rating name=\"other\"></x-rating>"
+
+        for parser in ("html5lib", "lxml", "stream", ):
+            if parser == "lxml" and lxml is None:
+                continue
+
+            with self.subTest(parser=parser):
+                result = RatingHtmlFormParser(markup, parser).forms
+
+                self.assertEqual([("stars", "3", True), ("foo", "", True)], self._entries(result[0].fields))
+
+                result = HtmlFormParser(markup, parser).forms
+
+                self.assertEqual([("foo", "", True)], self._entries(result[0].fields))
+
+    def test_parse_many(self):
+
+        documents = [self.TESTVALUE, "<p>fizz</p>", self.TESTVALUE_SELECTION.encode("utf-8"), ]
+
+        obj = HtmlFormParser()
+        result = list(obj.parse_many(documents, "stream", workers=2, ordered=True))
+
+        self.assertEqual([0, 1, 2], [index for index, forms in result])
+        self.assertEqual([1, 0, 3], [len(forms) for index, forms in result])
+        self.assertEqual(self._entries(HtmlFormParser(self.TESTVALUE, "stream").forms[0].fields), self._entries(result[0][1][0].fields))
+        self.assertEqual([], obj.forms)
+
+    def test_parse_async(self):
+
+        expected = self._entries(HtmlFormParser(self.TESTVALUE, "stream").forms[0].fields)
+
+        obj = HtmlFormParser()
+        result = asyncio.run(obj.parse_async(self.TESTVALUE.encode("utf-8"), "stream"))
+
+        self.assertEqual(expected, self._entries(result[0].fields))
+        self.assertEqual([], obj.forms)
+
+    def test_parse_async_stream_reader(self):
+
+        async def parse():
+            reader = asyncio.StreamReader()
+            reader.feed_data(self.TESTVALUE.encode("utf-8"))
+            reader.feed_eof()
+
+            return await HtmlFormParser().parse_async(reader, "stream", chunk_size=10)
+
+        result = asyncio.run(parse())
+
+        self.assertEqual(6, len(result[0].fields))
+
+    def test_parse_async_iterator(self):
+
+        async def chunks():
+            for index in range(0, len(self.TESTVALUE), 7):
+                await asyncio.sleep(0)
+                yield self.TESTVALUE[index:index + 7]
+
+        for parser in ("html5lib", "stream", ):
+            with self.subTest(parser=parser):
+                result = asyncio.run(HtmlFormParser().parse_async(chunks(), parser))
+
+                self.assertEqual(["early", "user", "lang", "lang", "note", "late"], [field.name for field in result[0].fields])
+
+    def test_parse_async_process_pool(self):
+
+        async def chunks():
+            for index in range(0, len(self.TESTVALUE), 7):
+                yield self.TESTVALUE[index:index + 7].encode("utf-8")
+
+        async def parse(executor):
+            reader = asyncio.StreamReader()
+            reader.feed_data(self.TESTVALUE.encode("utf-8"))
+            reader.feed_eof()
+
+            return [
+                await HtmlFormParser().parse_async(reader, "stream", executor=executor, chunk_size=10),
+                await HtmlFormParser().parse_async(chunks(), "stream", executor=executor),
+                await HtmlFormParser().parse_async(self.TESTVALUE, "stream", executor=executor),
+            ]
+
+        with ProcessPoolExecutor(1) as executor:
+            results = asyncio.run(parse(executor))
+
+        for result in results:
+            self.assertEqual(["early", "user", "lang", "lang", "note", "late"], [field.name for field in result[0].fields])
+
+    def test_parse_async_timeout(self):
+
+        read = []
+
+        async def chunks():
+            yield "<form><input name=\"foo\" />"
+            read.append(1)
+            await asyncio.sleep(10)
+            read.append(2)
+            yield "</form>"
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(HtmlFormParser().parse_async(chunks(), "stream", timeout=0.05))
+
+        self.assertEqual([1], read)
+
+    def test_parse_async_cancel(self):
+
+        async def chunks():
+            yield "<form>"
+            await asyncio.sleep(10)
+            yield "</form>"
+
+        async def parse():
+            task = asyncio.ensure_future(HtmlFormParser().parse_async(chunks(), "stream"))
+            await asyncio.sleep(0.01)
+            task.cancel()
+
+            return await task
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(parse())
+
+    def test_parse_reset(self):
+
+        obj = HtmlFormParser()
+        obj.parse(self.TESTVALUE, "stream")
+        result = obj.parse(self.TESTVALUE_SELECTION, "stream", reset=True)
+
+        self.assertEqual(["search", "login", "newsletter"], [form_data.name for form_data in result])
+        self.assertIs(result, obj.forms)
+
+    def test_parse_forms_stateless(self):
+
+        obj = HtmlFormParser()
+
+        result1 = obj.parse_forms(self.TESTVALUE, "stream")
+        result2 = obj.parse_forms(self.TESTVALUE, "stream")
+
+        self.assertEqual(1, len(result1))
+        self.assertIsNot(result1, result2)
+        self.assertIsNot(result1[0], result2[0])
+        self.assertEqual([], obj.forms)
+
+    def test_parse_forms_function(self):
+
+        result = parse_forms(self.TESTVALUE_SELECTION, "stream", forms={"name": "newsletter"})
+
+        self.assertEqual(["newsletter"], [form_data.name for form_data in result])
+        self.assertEqual(["email"], [field.name for field in result[0].fields])
+
+    def test_parse_forms_threads(self):
+
+        documents = [
+            "<form name=\"doc%d\"><input name=\"foo\" value=\"%d\" /></form>" % (index, index, )
+            for index in range(50)
+        ]
+
+        obj = HtmlFormParser()
+
+        for parser in ("html5lib", "stream", ):
+            with self.subTest(parser=parser):
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    result = list(executor.map(lambda markup: obj.parse_forms(markup, parser), documents))
+
+                self.assertEqual(
+                    [("doc%d" % (index, ), str(index)) for index in range(50)],
+                    [(forms[0].name, forms[0].fields[0].value) for forms in result])
+                self.assertEqual([], obj.forms)